@@ -3,19 +3,16 @@ from web_components import (
     wind_time_series_component,
     environmental_time_series_component,
     time_selection_component,
+    refine_data_component,
     # correlation_plot_component,
     scatter_plot_component,
-    # pca_explained_variance_component,
-    # pca_biplot_components,
-    # roc_curve_plot_component,
-    # pr_curve_plot_component,
-    # predicted_plot_components,
     wind_3d_component,
 )
 
 import sys
 from pathlib import Path
 import streamlit as st
+from web_components.perf import start_perf_run, perf_panel_component
 
 
 # Add the project root directory to the Python path
@@ -49,6 +46,9 @@ st.set_page_config(
 
 
 def main():
+    # Opt-in timing record for this rerun (?debug=1)
+    start_perf_run()
+
     # Display the dashboard title
     st.markdown(
         "<h1 style='text-align: center;'>🌤️ Weather Dashboard 🌤️</h1>",
@@ -81,30 +81,55 @@ def main():
     with col4:
         scatter_plot_component()
 
-    # # Explained Variance Plot + PCA Biplot
-    # col5, col6 = st.columns(2)
-    # with col5:
-    #     pca_explained_variance_component()
-    # with col6:
-    #     pca_biplot_components()
+    # Explained Variance Plot + PCA Biplot; like the ML section below, its
+    # modules are imported and its results fetched only once toggled on
+    if st.toggle("Show PCA analysis", key="show_pca"):
+        from web_components import (
+            pca_explained_variance_component,
+            pca_biplot_components,
+        )
+
+        col5, col6 = st.columns(2)
+        with col5:
+            pca_explained_variance_component()
+        with col6:
+            pca_biplot_components()
 
     ####################
     # ML section title #
     ####################
-    # st.markdown(
-    #     "<hr><br><h2 style='text-align: center;'>🤖 Machine Learning Insights 🤖</h2>",
-    #     unsafe_allow_html=True,
-    # )
-
-    # # ROC + PR curves
-    # col7, col8 = st.columns(2)
-    # with col7:
-    #     roc_curve_plot_component()
-    # with col8:
-    #     pr_curve_plot_component()
-
-    # # Predictions Plot
-    # predicted_plot_components()
+    st.markdown(
+        "<hr><br><h2 style='text-align: center;'>🤖 Machine Learning Insights 🤖</h2>",
+        unsafe_allow_html=True,
+    )
+
+    if st.toggle("Show machine learning results", key="show_ml"):
+        from web_components import (
+            roc_curve_plot_component,
+            pr_curve_plot_component,
+            predicted_plot_components,
+        )
+
+        # ROC + PR curves
+        col7, col8 = st.columns(2)
+        with col7:
+            roc_curve_plot_component()
+        with col8:
+            pr_curve_plot_component()
+
+        # Predictions Plot
+        predicted_plot_components()
+
+    ######################
+    # Full-res data load #
+    ######################
+    # First paint uses coarse aggregates; swap in raw data once it arrives
+    refine_data_component()
+
+    ###############
+    # Debug panel #
+    ###############
+    perf_panel_component()
 
 
 if __name__ == "__main__":
@@ -10,6 +10,8 @@ from cli_components import (
     check_analysis_results,
     connect_to_mongodb,
     create_weather_plot,
+    DEFAULT_PROFILE,
+    RENDER_PROFILES,
     delete_mongodb_collection,
     get_available_date_range,
     get_pi_ip,
@@ -85,7 +87,16 @@ def get_parser():
         "check": {
             "help": "Check database collections",
             "description": "Display detailed statistics and content preview for all MongoDB collections.",
-            "args": [("--force", {"action": "store_true", "help": argparse.SUPPRESS})],
+            "args": [
+                (
+                    "--verify",
+                    {
+                        "action": "store_true",
+                        "help": "Rebuild the metadata collection from the raw data and report mismatches",
+                    },
+                ),
+                ("--force", {"action": "store_true", "help": argparse.SUPPRESS}),
+            ],
         },
         "head": {
             "help": "Show earliest logged timestamp or first 5 rows if date specified",
@@ -143,6 +154,14 @@ With a date (YYYY_MM_DD format): Shows the last 5 rows of that specific date."""
             "args": [
                 ("start_date", {"help": "Start date (YYYY_MM_DD)"}),
                 ("end_date", {"nargs": "?", "help": "End date (YYYY_MM_DD, optional)"}),
+                (
+                    "--profile",
+                    {
+                        "choices": list(RENDER_PROFILES),
+                        "default": DEFAULT_PROFILE,
+                        "help": "Render profile: report (300 DPI PNG), discord (WebP), thumbnail (JPEG) or svg (vector)",
+                    },
+                ),
             ],
         },
         "monitor": {
@@ -274,7 +293,9 @@ async def async_main():
 
     regular_handlers = {
         "who": lambda: show_who_info(),
-        "check": lambda: check_analysis_results(db),
+        "check": lambda: check_analysis_results(
+            db, args.verify if hasattr(args, "verify") else False
+        ),
         "delete": lambda: delete_mongodb_collection(
             db,
             args.start_date if hasattr(args, "start_date") else None,
@@ -283,7 +304,7 @@ async def async_main():
         "eda": lambda: run_eda_analysis(db),
         "ml": lambda: run_ml_analysis(db),
         "info": lambda: get_available_date_range(
-            args.month if hasattr(args, "month") else None
+            args.month if hasattr(args, "month") else None, db
         ),
         "head": lambda: show_head(args.date if hasattr(args, "date") else None),
         "tail": lambda: show_tail(args.date if hasattr(args, "date") else None),
@@ -299,7 +320,9 @@ async def async_main():
         "spit": lambda start, end: sys.stdout.write(
             spit_csv_data(start, end)[1].getvalue()
         ),
-        "plot": lambda start, end: handle_plot_command(start, end, save_locally=True),
+        "plot": lambda start, end: handle_plot_command(
+            start, end, save_locally=True, profile=args.profile
+        ),
     }
 
     try:
@@ -348,11 +371,13 @@ def handle_date_command(args, handler):
         rprint("[red]Invalid date format. Use YYYY_MM_DD.[/red]")
 
 
-def handle_plot_command(start_date, end_date, save_locally=True):
+def handle_plot_command(
+    start_date, end_date, save_locally=True, profile=DEFAULT_PROFILE
+):
     """Handle plot command specifically."""
     try:
         filenames, buffers, filepaths = create_weather_plot(
-            start_date, end_date, save_locally=save_locally
+            start_date, end_date, save_locally=save_locally, profile=profile
         )
 
         if save_locally:
@@ -389,7 +414,9 @@ def main():
 
             handlers = {
                 "who": lambda: show_who_info(),
-                "check": lambda: check_analysis_results(db),
+                "check": lambda: check_analysis_results(
+                    db, args.verify if hasattr(args, "verify") else False
+                ),
                 "delete": lambda: delete_mongodb_collection(
                     db,
                     args.start_date if hasattr(args, "start_date") else None,
@@ -398,7 +425,7 @@ def main():
                 "eda": lambda: run_eda_analysis(db),
                 "ml": lambda: run_ml_analysis(db),
                 "info": lambda: get_available_date_range(
-                    args.month if hasattr(args, "month") else None
+                    args.month if hasattr(args, "month") else None, db
                 ),
                 "head": lambda: show_head(args.date if hasattr(args, "date") else None),
                 "tail": lambda: show_tail(args.date if hasattr(args, "date") else None),
@@ -414,7 +441,7 @@ def main():
                     spit_csv_data(start, end)[1].getvalue()
                 ),
                 "plot": lambda start, end: handle_plot_command(
-                    start, end, save_locally=True
+                    start, end, save_locally=True, profile=args.profile
                 ),
             }
 
@@ -9,7 +9,7 @@ from .tail import show_tail
 from .upload import upload_csv_to_mongodb
 from .utils import print_banner, connect_to_mongodb
 from .spit import spit_csv_data
-from .plot import create_weather_plot
+from .plot import create_weather_plot, DEFAULT_PROFILE, RENDER_PROFILES
 from .monitor import toggle_monitor
 from .ifconfig import get_pi_ip
 from .top import get_system_stats
@@ -31,6 +31,8 @@ __all__ = [
     "connect_to_mongodb",
     "spit_csv_data",
     "create_weather_plot",
+    "DEFAULT_PROFILE",
+    "RENDER_PROFILES",
     "toggle_monitor",
     "get_pi_ip",
     "get_system_stats",
@@ -15,6 +15,7 @@ import streamlit as st
 from ollama import AsyncClient, Client
 from rich import print as rprint
 
+from processing.circular import resample_direction
 from src import CSV_DIR
 
 # Constants from secrets
@@ -473,7 +474,6 @@ def read_weather_data(date: str) -> Optional[Dict[str, Any]]:
             "u_m_s": ["mean", "min", "max"],
             "v_m_s": ["mean", "min", "max"],
             "w_m_s": ["mean", "min", "max"],
-            "Azimuth_deg": "mean",
             "Elev_deg": ["mean", "min", "max"],
             "Press_Pa": ["mean", "min", "max"],
             "Hum_RH": ["mean", "min", "max"],
@@ -482,6 +482,12 @@ def read_weather_data(date: str) -> Optional[Dict[str, Any]]:
         # Resample with fixed 24-hour periods
         df_hourly = df.resample(rule="h", closed="left", label="left").agg(agg_dict)
 
+        # Direction needs a circular mean; an arithmetic mean breaks across north
+        direction = resample_direction(df.index, df["Azimuth_deg"], "h")
+        direction = direction.reindex(df_hourly.index)
+        df_hourly[("Azimuth_deg", "mean")] = direction["mean"]
+        df_hourly[("Azimuth_deg", "std")] = direction["std"]
+
         if DEBUG:
             debug_print(f"Original records: {len(df)}", "blue")
             debug_print(f"Resampled to {len(df_hourly)} hourly intervals", "blue")
@@ -492,7 +498,9 @@ def read_weather_data(date: str) -> Optional[Dict[str, Any]]:
             "date": date,
             "total_records": len(df),
             "hours_recorded": len(df_hourly),
-            "data_columns": list(agg_dict.keys()),  # List available columns
+            "data_columns": list(  # List available columns
+                df_hourly.columns.get_level_values(0).unique()
+            ),
             "sample_hour": {  # Show just one hour as example
                 "hour": 0,
                 "timestamp": df_hourly.index[0].strftime("%Y-%m-%d %H:%M:%S"),
@@ -524,7 +532,10 @@ def read_weather_data(date: str) -> Optional[Dict[str, Any]]:
                     },
                     "direction": {
                         "azimuth": {
-                            "mean": safe_float(df_hourly["Azimuth_deg"].iloc[0])
+                            "mean": safe_float(
+                                df_hourly["Azimuth_deg"]["mean"].iloc[0]
+                            ),
+                            "std": safe_float(df_hourly["Azimuth_deg"]["std"].iloc[0]),
                         },
                         "elevation": {
                             "mean": safe_float(df_hourly["Elev_deg"]["mean"].iloc[0]),
@@ -643,8 +654,27 @@ def parse_date_reference(text: str) -> List[str]:
     return []
 
 
-async def chat_with_llm(prompt: str, model: str = None) -> str:
-    """Chat with Ollama LLM model with structured function calling."""
+def build_data_context(dates: List[str]) -> str:
+    """Weather statistics for the available `dates`, as text for the model."""
+    data_context = ""
+    available_dates = get_available_dates()
+    for date in dates:
+        if date in available_dates:
+            data = read_weather_data(date)
+            if data:
+                data_context += f"\nData for {date}:\n"
+                data_context += json.dumps(data, indent=2)
+                data_context += "\n"
+                rprint(f"[blue]Got data for date {date}[/blue]")
+    return data_context
+
+
+async def chat_with_llm(prompt: str, model: str = None, load_context=None) -> str:
+    """Chat with Ollama LLM model with structured function calling.
+
+    `load_context`, if given, is awaited with the dates found in the prompt
+    and replaces build_data_context, so callers can share the data read.
+    """
     DEBUG = True
 
     def debug_print(message: str, color: str = "blue"):
@@ -718,18 +748,10 @@ Remember to:
 
             if dates:
                 debug_print(f"Found dates in prompt: {dates}", "yellow")
-                data_context = ""
-
-                # Get data for each date
-                available_dates = get_available_dates()
-                for date in dates:
-                    if date in available_dates:
-                        data = read_weather_data(date)
-                        if data:
-                            data_context += f"\nData for {date}:\n"
-                            data_context += json.dumps(data, indent=2)
-                            data_context += "\n"
-                            debug_print(f"Got data for date {date}")
+                if load_context is None:
+                    data_context = build_data_context(dates)
+                else:
+                    data_context = await load_context(dates)
 
                 if data_context:
                     # Remove redundant debug prints
@@ -805,7 +827,7 @@ Sign with "🌦️[Meteorix](https://github.com/Sang-Buster/weather-dashboard)
         ssh_forwarder.release()
 
 
-def handle_chat_command(args):
+def handle_chat_command(args, load_context=None):
     """Handle the chat command with arguments."""
     # Handle 'chat models' subcommand
     if args.action_or_prompt == "models":
@@ -836,7 +858,7 @@ def handle_chat_command(args):
         return
 
     # Return the chat coroutine
-    return chat_with_llm(prompt, args.model)
+    return chat_with_llm(prompt, args.model, load_context)
 
 
 async def run_cli_command(ctx, args):
@@ -1,10 +1,21 @@
 from rich import print as rprint
 from .utils import print_collection_stats
-from datetime import datetime, timedelta
+from .metadata import (
+    get_day_metadata,
+    get_metadata_summary,
+    metadata_drift,
+    rebuild_metadata,
+)
+from datetime import timedelta
 
 
-def check_analysis_results(db):
-    """Check contents of analysis collections"""
+def check_analysis_results(db, verify=False):
+    """Check contents of analysis collections
+
+    Args:
+        db: MongoDB database connection
+        verify (bool): Rebuild the metadata from weather_data and report drift
+    """
     rprint(f"\n[bold blue]{'='*60}[/bold blue]")
     rprint("[bold green]Analysis Collections Status[/bold green]")
     rprint(f"[bold blue]{'='*60}[/bold blue]\n")
@@ -13,21 +24,38 @@ def check_analysis_results(db):
     for collection_name in ["weather_data", "eda_results", "pca_results", "ml_results"]:
         print_collection_stats(db[collection_name], collection_name)
 
-    # Then analyze and print date range for weather_data
-    collection = db["weather_data"]
-
-    # Find earliest and latest dates
-    earliest = collection.find_one({}, sort=[("tNow", 1)])
-    latest = collection.find_one({}, sort=[("tNow", -1)])
+    # Date range and per-day counts come from the metadata collection, which
+    # is rebuilt when its summary does not match weather_data
+    drift = metadata_drift(db, count=True)
+    for reason in drift:
+        rprint(f"[yellow]Warning: Metadata out of date: {reason}[/yellow]")
+    if verify or drift:
+        rprint("\n[bold cyan]Rebuilding metadata from weather_data...[/bold cyan]")
+        mismatched = rebuild_metadata(db)
+        if verify and not mismatched:
+            rprint("[green]Metadata matches weather_data.[/green]")
+    summary = get_metadata_summary(db)
 
-    if earliest and latest:
-        earliest_date = earliest["tNow"].date()
-        latest_date = latest["tNow"].date()
+    if summary:
+        earliest_date = summary["min_date"].date()
+        latest_date = summary["max_date"].date()
+        day_counts = {
+            day: stats["count"] for day, stats in get_day_metadata(db).items()
+        }
 
         # Print overall range with proper formatting
         rprint("\n[bold cyan]Date Range in Database:[/bold cyan]")
         rprint("[cyan]From: {0}[/cyan]".format(earliest_date))
         rprint("[cyan]To:   {0}[/cyan]".format(latest_date))
+        rprint(
+            f"[cyan]Records: {summary['count']:,} over {summary['days']} days[/cyan]"
+        )
+        if summary.get("last_upload"):
+            rprint(
+                "[cyan]Last upload: {0}[/cyan]".format(
+                    summary["last_upload"].strftime("%Y-%m-%d %H:%M:%S UTC")
+                )
+            )
 
         # Check for missing dates
         current_date = earliest_date
@@ -36,12 +64,7 @@ def check_analysis_results(db):
 
         while current_date <= latest_date:
             # Check if this date exists in the database
-            start_of_day = datetime.combine(current_date, datetime.min.time())
-            end_of_day = datetime.combine(current_date, datetime.max.time())
-
-            count = collection.count_documents(
-                {"tNow": {"$gte": start_of_day, "$lte": end_of_day}}
-            )
+            count = day_counts.get(current_date.strftime("%Y-%m-%d"), 0)
 
             if count == 0:
                 if not gap_start:
@@ -1,5 +1,8 @@
 from rich import print as rprint
 from datetime import datetime, timedelta
+from .wind_histogram import delete_wind_histograms
+from .rollup import delete_rollups
+from .metadata import delete_day_metadata
 
 
 def delete_mongodb_collection(db, start_date=None, end_date=None):
@@ -16,6 +19,9 @@ def delete_mongodb_collection(db, start_date=None, end_date=None):
         # Case 1: No dates specified - delete everything
         if not start_date:
             result = collection.delete_many({})
+            delete_wind_histograms(db)
+            delete_rollups(db)
+            delete_day_metadata(db)
             rprint(
                 f"[green]Deleted {result.deleted_count:,} documents from the collection.[/green]"
             )
@@ -29,6 +35,9 @@ def delete_mongodb_collection(db, start_date=None, end_date=None):
             next_day = start + timedelta(days=1)
             query = {"tNow": {"$gte": start, "$lt": next_day}}
             result = collection.delete_many(query)
+            delete_wind_histograms(db, start, next_day)
+            delete_rollups(db, start, next_day)
+            delete_day_metadata(db, start, next_day)
             rprint(
                 f"[green]Deleted {result.deleted_count:,} documents for {start_date}.[/green]"
             )
@@ -49,6 +58,9 @@ def delete_mongodb_collection(db, start_date=None, end_date=None):
             }
         }
         result = collection.delete_many(query)
+        delete_wind_histograms(db, start, end)
+        delete_rollups(db, start, end)
+        delete_day_metadata(db, start, end)
         rprint(
             f"[green]Deleted {result.deleted_count:,} documents from {start_date} to {end_date}.[/green]"
         )
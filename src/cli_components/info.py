@@ -1,14 +1,32 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, UTC
 from rich import print as rprint
 from pathlib import Path
 import pandas as pd
 
 from src import CSV_DIR
+from .metadata import get_day_metadata
 
 
-def get_available_date_range(month=None):
+def uploaded_row_count(file, day_metadata):
+    """Row count recorded at upload, if the file has not changed since."""
+    if not day_metadata or not day_metadata.get("uploaded"):
+        return None
+    uploaded = day_metadata["uploaded"].replace(tzinfo=UTC).timestamp()
+    if file.stat().st_mtime > uploaded:
+        return None
+    return day_metadata["count"]
+
+
+def get_available_date_range(month=None, db=None):
     data_dir = Path(CSV_DIR)
 
+    # Row counts of uploaded files come from the metadata collection, so only
+    # new or changed files are parsed
+    try:
+        uploaded_days = get_day_metadata(db) if db is not None else {}
+    except Exception:
+        uploaded_days = {}
+
     if not data_dir.exists():
         rprint("[red]Data directory not found.[/red]")
         return False
@@ -46,8 +64,11 @@ def get_available_date_range(month=None):
             total_size += size_mb
 
             # Get row count
-            df = pd.read_csv(file)
-            row_count = len(df)
+            row_count = uploaded_row_count(
+                file, uploaded_days.get(date.strftime("%Y-%m-%d"))
+            )
+            if row_count is None:
+                row_count = len(pd.read_csv(file))
             total_rows += row_count
 
             file_info.append((date, row_count, size_mb))
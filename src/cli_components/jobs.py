@@ -0,0 +1,211 @@
+import asyncio
+import functools
+import math
+import multiprocessing
+import time
+import weakref
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# Bot jobs (plot, spit): worker processes, jobs admitted at once (running or
+# waiting) and seconds a job may run before it is abandoned
+BOT_JOB_WORKERS = 2
+BOT_JOB_QUEUE_LIMIT = 6
+BOT_JOB_TIMEOUT = 600
+
+# Seconds between progress callbacks while a job is pending
+PROGRESS_INTERVAL = 10
+
+# Seconds a finished shared result is handed to identical requests
+SHARED_RESULT_TTL = 30
+
+
+class JobQueueFull(Exception):
+    """Raised when a job runner already holds its limit of jobs."""
+
+
+class JobRunner:
+    """Runs blocking jobs in a process pool without blocking the event loop.
+
+    At most `queue_limit` jobs are admitted; further submissions raise
+    JobQueueFull instead of piling up. Jobs wait here until a worker is free,
+    so the pool only ever holds running jobs, and `timeout` counts from the
+    moment a job starts. A job that runs past it cannot be cancelled inside
+    its worker, so the pool is restarted; the other job it was running is
+    resubmitted to the new pool and queued jobs are not affected.
+    """
+
+    def __init__(
+        self, workers, queue_limit, timeout, progress_interval=PROGRESS_INTERVAL
+    ):
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self.timeout = timeout
+        self.progress_interval = progress_interval
+        self.pending = 0
+        self.durations = deque(maxlen=20)
+        self._executor = None
+        self._slots = asyncio.Semaphore(workers)
+        # Pools killed on purpose; their jobs are resubmitted, not failed
+        self._restarted = weakref.WeakSet()
+
+    def _get_executor(self):
+        if self._executor is None:
+            # The bot process runs threads, so do not fork it directly. Workers
+            # live as long as the pool, so their start-up imports are paid once.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("forkserver"),
+            )
+        return self._executor
+
+    def _restart(self, executor):
+        """Kill the workers of `executor` and start a fresh pool on next use."""
+        self._restarted.add(executor)
+        if self._executor is executor:
+            self._executor = None
+        for process in list((executor._processes or {}).values()):
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def estimate(self, position):
+        """Seconds until the job at queue `position` (1 = first) is done."""
+        if not self.durations:
+            return None
+        mean = sum(self.durations) / len(self.durations)
+        return mean * math.ceil(position / self.workers)
+
+    async def submit(self, func, *args, on_progress=None):
+        """Run func(*args) in the pool and return its (picklable) result.
+
+        Args:
+            func: Module-level function, so the workers can import it
+            on_progress: Optional coroutine function called as
+                on_progress(position, elapsed, eta) when the job is queued
+                and every `progress_interval` seconds until it finishes
+
+        Raises:
+            JobQueueFull: If `queue_limit` jobs are already admitted
+            TimeoutError: If the job ran for longer than `timeout`
+            BrokenProcessPool: If the job's worker died twice
+        """
+        if self.pending >= self.queue_limit:
+            raise JobQueueFull(f"{self.pending} jobs are already queued")
+
+        self.pending += 1
+        position = self.pending
+        eta = self.estimate(position)
+        progress = functools.partial(self._progress, on_progress, position, eta)
+        started = time.monotonic()
+        try:
+            if on_progress:
+                await on_progress(position, 0, eta)
+            await self._acquire_slot(progress, started)
+            try:
+                return await self._run(func, args, progress, started)
+            finally:
+                self._slots.release()
+        finally:
+            self.pending -= 1
+
+    async def _progress(self, on_progress, position, eta, started):
+        if on_progress:
+            await on_progress(position, time.monotonic() - started, eta)
+
+    async def _acquire_slot(self, progress, started):
+        """Wait for a free worker, reporting progress meanwhile."""
+        acquire = asyncio.ensure_future(self._slots.acquire())
+        try:
+            while True:
+                done, _ = await asyncio.wait({acquire}, timeout=self.progress_interval)
+                if done:
+                    return
+                await progress(started)
+        except BaseException:
+            if acquire.done() and not acquire.cancelled():
+                self._slots.release()
+            else:
+                acquire.cancel()
+            raise
+
+    async def _run(self, func, args, progress, started):
+        deadline = time.monotonic() + self.timeout
+        crashed = False
+        while True:
+            executor = self._get_executor()
+            try:
+                future = asyncio.wrap_future(executor.submit(func, *args))
+                result = await self._wait(executor, future, deadline, progress, started)
+            except BrokenProcessPool:
+                # A pool restarted for another job's timeout is not this job's
+                # fault; a worker that died on its own gets one more try
+                if executor not in self._restarted:
+                    if crashed:
+                        raise
+                    crashed = True
+                    self._restart(executor)
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"Job did not finish within {self.timeout}s")
+                continue
+            self.durations.append(time.monotonic() - (deadline - self.timeout))
+            return result
+
+    async def _wait(self, executor, future, deadline, progress, started):
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                future.cancel()
+                self._restart(executor)
+                raise TimeoutError(f"Job did not finish within {self.timeout}s")
+
+            done, _ = await asyncio.wait(
+                {future}, timeout=min(self.progress_interval, remaining)
+            )
+            if done:
+                # Futures still queued in a restarted pool are cancelled
+                if future.cancelled():
+                    raise BrokenProcessPool("The job pool was restarted")
+                return future.result()
+            await progress(started)
+
+
+class SingleFlight:
+    """Coalesces identical concurrent requests into one job.
+
+    The first caller for a key starts the job; callers arriving while it runs
+    await the same task, and callers within `ttl` seconds after it succeeded
+    get its result without running it again. Failures are not kept. Every
+    caller gets the same object, so results should be immutable.
+    """
+
+    def __init__(self, ttl=SHARED_RESULT_TTL):
+        self.ttl = ttl
+        self._running = {}
+        self._results = {}
+
+    def running(self, key):
+        """Whether a job for `key` is in flight."""
+        return key in self._running
+
+    async def run(self, key, job):
+        """Result of awaiting job() for `key`, shared with identical requests."""
+        now = time.monotonic()
+        for expired in [k for k, (until, _) in self._results.items() if until <= now]:
+            del self._results[expired]
+        if key in self._results:
+            return self._results[key][1]
+
+        task = self._running.get(key)
+        if task is None:
+            task = asyncio.ensure_future(job())
+            self._running[key] = task
+            task.add_done_callback(functools.partial(self._finish, key))
+
+        # A requester that gives up must not cancel the job for the others
+        return await asyncio.shield(task)
+
+    def _finish(self, key, task):
+        del self._running[key]
+        if not task.cancelled() and task.exception() is None:
+            self._results[key] = (time.monotonic() + self.ttl, task.result())
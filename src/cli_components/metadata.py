@@ -0,0 +1,189 @@
+from datetime import datetime, timedelta, UTC
+from rich import print as rprint
+
+from .utils import wait_for_readings
+
+# Small collection describing weather_data: one document per uploaded day
+# (_id "YYYY-MM-DD") and a SUMMARY_ID document with the dataset bounds
+METADATA_COLLECTION = "weather_metadata"
+SUMMARY_ID = "summary"
+
+
+def _day_documents(collection, start=None, end=None):
+    """Per-day count and first/last reading of weather_data, keyed by day."""
+    pipeline = []
+    if start is not None:
+        pipeline.append({"$match": {"tNow": {"$gte": start, "$lt": end}}})
+    pipeline += [
+        {
+            "$group": {
+                "_id": {"$dateTrunc": {"date": "$tNow", "unit": "day"}},
+                "count": {"$sum": 1},
+                "first": {"$min": "$tNow"},
+                "last": {"$max": "$tNow"},
+            }
+        },
+        {"$sort": {"_id": 1}},
+    ]
+    return {
+        doc["_id"].strftime("%Y-%m-%d"): {
+            "count": doc["count"],
+            "first": doc["first"],
+            "last": doc["last"],
+        }
+        for doc in collection.aggregate(pipeline)
+    }
+
+
+def refresh_summary(db, last_upload=None):
+    """Recompute the bounds document from the per-day documents."""
+    metadata = db[METADATA_COLLECTION]
+    days = list(metadata.find({"_id": {"$ne": SUMMARY_ID}}).sort("_id", 1))
+
+    update = {
+        "min_date": days[0]["first"] if days else None,
+        "max_date": max(day["last"] for day in days) if days else None,
+        "days": len(days),
+        "count": sum(day["count"] for day in days),
+        "updated": datetime.now(UTC),
+    }
+    if last_upload is not None:
+        update["last_upload"] = last_upload
+    metadata.update_one({"_id": SUMMARY_ID}, {"$set": update}, upsert=True)
+
+
+def metadata_drift(db, count=False):
+    """Ways the summary disagrees with weather_data; empty when it matches.
+
+    The bounds come off the tNow index. Comparing the number of readings
+    scans the collection, so it is only done when `count` is set.
+    """
+    collection = db["weather_data"]
+    projection = {"_id": 0, "tNow": 1}
+    earliest = collection.find_one({}, projection, sort=[("tNow", 1)])
+    latest = collection.find_one({}, projection, sort=[("tNow", -1)])
+
+    summary = get_metadata_summary(db)
+    if summary is None:
+        return ["no metadata summary"] if earliest else []
+    if earliest is None:
+        return ["weather_data is empty"]
+
+    drift = []
+    if summary["min_date"] != earliest["tNow"]:
+        drift.append(f"first reading {earliest['tNow']}, summary {summary['min_date']}")
+    if summary["max_date"] != latest["tNow"]:
+        drift.append(f"last reading {latest['tNow']}, summary {summary['max_date']}")
+    if count:
+        readings = collection.count_documents({})
+        if summary["count"] != readings:
+            drift.append(f"{readings:,} readings, summary {summary['count']:,}")
+    return drift
+
+
+def update_day_metadata(db, date, expected=None):
+    """Record the count and bounds of one uploaded day.
+
+    Metadata written before this day was uploaded may not describe the
+    rest of weather_data (e.g. on the first upload after it was introduced);
+    it is then rebuilt from the collection.
+
+    Args:
+        db: MongoDB database connection
+        date (str): Date in YYYY_MM_DD format
+        expected (int, optional): Number of readings uploaded for the day
+    """
+    try:
+        start = datetime.strptime(date, "%Y_%m_%d")
+        end = start + timedelta(days=1)
+        now = datetime.now(UTC)
+
+        collection = db["weather_data"]
+        if expected and not wait_for_readings(collection, start, end, expected):
+            rprint(
+                f"[yellow]Warning: Not all readings for {date} are visible yet, "
+                "metadata may be incomplete[/yellow]"
+            )
+
+        metadata = db[METADATA_COLLECTION]
+        day = start.strftime("%Y-%m-%d")
+        stats = _day_documents(collection, start, end).get(day)
+        if stats is None:
+            metadata.delete_one({"_id": day})
+        else:
+            metadata.replace_one({"_id": day}, {**stats, "uploaded": now}, upsert=True)
+
+        # The summary has to include the new day before it is compared, or
+        # every upload of a new day would look like drift
+        refresh_summary(db, last_upload=now)
+        if metadata_drift(db):
+            rprint(
+                "[cyan]Metadata does not cover weather_data, rebuilding it...[/cyan]"
+            )
+            rebuild_metadata(db, report=False)
+        return True
+    except Exception as e:
+        rprint(f"[yellow]Warning: Could not update metadata for {date}: {e}[/yellow]")
+        return False
+
+
+def delete_day_metadata(db, start=None, end=None):
+    """Remove metadata of days in [start, end), or of all days."""
+    metadata = db[METADATA_COLLECTION]
+    if start is None:
+        metadata.delete_many({"_id": {"$ne": SUMMARY_ID}})
+    else:
+        days = []
+        current = start
+        while current < end:
+            days.append(current.strftime("%Y-%m-%d"))
+            current += timedelta(days=1)
+        metadata.delete_many({"_id": {"$in": days}})
+    refresh_summary(db)
+
+
+def get_metadata_summary(db):
+    """The bounds document, or None when metadata has not been built."""
+    summary = db[METADATA_COLLECTION].find_one({"_id": SUMMARY_ID})
+    if not summary or summary.get("min_date") is None:
+        return None
+    return summary
+
+
+def get_day_metadata(db):
+    """Per-day documents keyed by day (YYYY-MM-DD)."""
+    return {
+        doc.pop("_id"): doc
+        for doc in db[METADATA_COLLECTION].find({"_id": {"$ne": SUMMARY_ID}})
+    }
+
+
+def rebuild_metadata(db, report=True):
+    """Rebuild all metadata from weather_data and report any drift.
+
+    Returns the list of days whose stored counts did not match; they are
+    only printed when `report` is set.
+    """
+    stored = get_day_metadata(db)
+    actual = _day_documents(db["weather_data"])
+
+    mismatched = []
+    for day in sorted(set(stored) | set(actual)):
+        stored_count = stored.get(day, {}).get("count", 0)
+        actual_count = actual.get(day, {}).get("count", 0)
+        if stored_count != actual_count:
+            mismatched.append(day)
+            if report:
+                rprint(
+                    f"[yellow]• {day}: metadata {stored_count:,}, "
+                    f"weather_data {actual_count:,}[/yellow]"
+                )
+
+    metadata = db[METADATA_COLLECTION]
+    metadata.delete_many({"_id": {"$nin": [SUMMARY_ID, *actual]}})
+    for day, stats in actual.items():
+        # Keep the upload time of days that were already recorded
+        uploaded = stored.get(day, {}).get("uploaded")
+        metadata.replace_one({"_id": day}, {**stats, "uploaded": uploaded}, upsert=True)
+    refresh_summary(db)
+    return mismatched
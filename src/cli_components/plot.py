@@ -1,13 +1,28 @@
+import os
+import multiprocessing
 import pandas as pd
 import matplotlib.pyplot as plt
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 import io
 from pathlib import Path
 from rich import print as rprint
 import numpy as np
 from mpl_toolkits.mplot3d import Axes3D
+from processing.circular import circular_stats
+from processing.downsample import downsample, point_budget
+from processing.surface import direction_time_surface
+from processing.wind_rose import (
+    SECTOR_LABELS,
+    SPEED_BINS_MPH,
+    SPEED_COLORS,
+    SPEED_LABELS,
+    wind_rose_counts,
+)
 
 from src import CSV_DIR, BOT_FIGURE_DIR
+from .plot_cache import load_cached_plots, plot_cache_key, store_cached_plots
 
 DATA_DIR = Path(CSV_DIR)
 Path(BOT_FIGURE_DIR).mkdir(parents=True, exist_ok=True)
@@ -35,80 +50,34 @@ def categorize_wind_direction(degrees):
     return directions[idx]
 
 
-def create_wind_rose(ax, wind_speed, wind_dir, title="Wind Rose"):
-    """Create wind rose using matplotlib."""
-    # Set up directional bins (every 45 degrees)
-    dir_bins = np.arange(-11.25, 360 - 11.25 + 22.5, 22.5)
-    dir_labels = [
-        "N",
-        "NNE",
-        "NE",
-        "ENE",
-        "E",
-        "ESE",
-        "SE",
-        "SSE",
-        "S",
-        "SSW",
-        "SW",
-        "WSW",
-        "W",
-        "WNW",
-        "NW",
-        "NNW",
-    ]
-    # Set up more speed bins (in mph)
-    speed_bins = [0, 5, 10, 15, 20, 25, 30, 35, 40, 45, 50, 55, 60, float("inf")]
-    speed_labels = [
-        "0-5",
-        "5-10",
-        "10-15",
-        "15-20",
-        "20-25",
-        "25-30",
-        "30-35",
-        "35-40",
-        "40-45",
-        "45-50",
-        "50-55",
-        "55-60",
-        "60+",
-    ]
+def plot_envelope(ax, x, y, **kwargs):
+    """Plot y over x reduced to a min/max envelope per horizontal pixel.
 
-    # Extended color palette with more distinct colors for higher speeds
-    colors = [
-        "#2ecc71",  # Light breeze (green)
-        "#3498db",  # Gentle breeze (blue)
-        "#f1c40f",  # Moderate breeze (yellow)
-        "#e67e22",  # Fresh breeze (orange)
-        "#e74c3c",  # Strong breeze (red)
-        "#9b59b6",  # Near gale (purple)
-        "#34495e",  # Gale (dark blue)
-        "#c0392b",  # Strong gale (dark red)
-        "#d35400",  # Storm (dark orange)
-        "#8e44ad",  # Violent storm (dark purple)
-        "#ff1493",  # Deep pink for 50-55
-        "#00ffff",  # Cyan for 55-60
-        "#ff0000",  # Bright red for 60+
-    ]
+    The point budget comes from the axes width at the figure's dpi, so the
+    number of vertices no longer grows with the date range while peaks and
+    gusts are kept.
+    """
+    width_px = ax.get_position().width * ax.figure.get_figwidth() * ax.figure.dpi
+    x, y = downsample(x, y, point_budget(width_px), mode="minmax")
+    return ax.plot(x, y, **kwargs)
 
-    # Convert angles to 0-360
-    wind_dir = wind_dir % 360
 
-    # Initialize frequency array
-    freq = np.zeros((len(speed_bins) - 1, len(dir_bins) - 1))
+def create_wind_rose(ax, wind_speed, wind_dir, title="Wind Rose"):
+    """Create wind rose using matplotlib."""
+    # Shared 16-sector / 5 mph layout, identical to the dashboard wind rose
+    dir_labels = SECTOR_LABELS
+    speed_bins = SPEED_BINS_MPH
+    speed_labels = SPEED_LABELS
+    colors = SPEED_COLORS
 
-    # Count frequencies
-    for i in range(len(speed_bins) - 1):
-        if i == len(speed_bins) - 2:  # Last bin (60+)
-            mask = wind_speed >= speed_bins[i]
-        else:
-            mask = (wind_speed >= speed_bins[i]) & (wind_speed < speed_bins[i + 1])
-        dir_hist, _ = np.histogram(wind_dir[mask], bins=dir_bins)
-        freq[i] = dir_hist
+    # Count frequencies per speed bin and sector in a single pass
+    freq = wind_rose_counts(wind_speed, wind_dir).astype(float)
 
     # Convert to percentages
-    freq = freq * 100.0 / len(wind_speed)
+    freq = freq * 100.0 / max(freq.sum(), 1)
+
+    # Each speed bin is stacked on the cumulative sum of the bins below it
+    bottoms = np.vstack([np.zeros(freq.shape[1]), np.cumsum(freq, axis=0)[:-1]])
 
     # Plot each speed bin
     width = np.pi / 8
@@ -125,7 +94,7 @@ def create_wind_rose(ax, wind_speed, wind_dir, title="Wind Rose"):
                 theta,
                 freq[i],
                 width=width,
-                bottom=np.sum(freq[:i], axis=0),
+                bottom=bottoms[i],
                 color=colors[i],
                 label=f"{speed_labels[i]} mph",
                 edgecolor="white",
@@ -150,11 +119,9 @@ def create_wind_rose(ax, wind_speed, wind_dir, title="Wind Rose"):
         )
 
 
-def create_wind_plots(
-    combined_df, start_date, end_date=None
-) -> tuple[plt.Figure, plt.Figure]:
-    """Create wind-specific plots: time series and wind rose."""
-    # Create first figure for time series with arrows
+def create_wind_timeseries_plot(combined_df, start_date, end_date=None) -> plt.Figure:
+    """Create wind component and speed time series with direction arrows."""
+    # Create figure for time series with arrows
     fig1 = plt.figure(figsize=(15, 12))
 
     # Create subplot grid with specific spacing
@@ -179,11 +146,21 @@ def create_wind_plots(
     wind_speed_mph = ms_to_mph(combined_df["3DSpeed_m_s"])
 
     # Plot U/V components
-    ax1.plot(
-        combined_df["tNow"], u_mph, color="red", alpha=0.7, label="U (E-W) Component"
+    plot_envelope(
+        ax1,
+        combined_df["tNow"],
+        u_mph,
+        color="red",
+        alpha=0.7,
+        label="U (E-W) Component",
     )
-    ax1.plot(
-        combined_df["tNow"], v_mph, color="green", alpha=0.7, label="V (N-S) Component"
+    plot_envelope(
+        ax1,
+        combined_df["tNow"],
+        v_mph,
+        color="green",
+        alpha=0.7,
+        label="V (N-S) Component",
     )
     ax1.set_ylabel("Wind Component Speed (mph)")
     ax1.legend()
@@ -192,16 +169,23 @@ def create_wind_plots(
     ax1.tick_params(axis="x", length=0)  # Hide x-axis ticks
 
     # Plot wind speed as line
-    ax2.plot(
-        combined_df["tNow"], wind_speed_mph, color="blue", alpha=0.3, label="Wind Speed"
+    plot_envelope(
+        ax2,
+        combined_df["tNow"],
+        wind_speed_mph,
+        color="blue",
+        alpha=0.3,
+        label="Wind Speed",
     )
     ax2.set_ylabel("Wind Speed (mph)")
 
-    # Add arrows for direction
+    # Add arrows for direction, each the circular mean of its group of readings
     n = max(1, len(combined_df) // 200)  # Increased sampling to show more arrows
-    times = combined_df["tNow"][::n]
-    speeds = wind_speed_mph[::n]
-    directions = np.radians(combined_df["Azimuth_deg"][::n])
+    starts = np.arange(0, len(combined_df), n)
+    times = combined_df["tNow"].iloc[starts]
+    speeds = np.asarray(wind_speed_mph)[starts]
+    mean_dir, _, _ = circular_stats(combined_df["Azimuth_deg"], starts)
+    directions = np.radians(mean_dir)
 
     # Plot arrows using Azimuth directly
     q = ax2.quiver(
@@ -233,16 +217,34 @@ def create_wind_plots(
     else:
         fig1.suptitle(f"Wind Patterns: {start_date}", y=0.98)
 
-    # Create second figure for wind rose - make it square with more legend space
+    return fig1
+
+
+def create_wind_rose_plot(combined_df) -> plt.Figure:
+    """Create the wind rose figure."""
+    # Square figure with more legend space
     fig2 = plt.figure(figsize=(10, 10))
     ax2 = fig2.add_subplot(111, projection="polar")
 
-    create_wind_rose(ax2, wind_speed_mph, combined_df["Azimuth_deg"].values)
+    # The rose bins horizontal speed, like the dashboard
+    create_wind_rose(
+        ax2, ms_to_mph(combined_df["2dSpeed_m_s"]), combined_df["Azimuth_deg"].values
+    )
 
     # Adjust layout with more space for legend
     fig2.subplots_adjust(right=0.8)  # More space on right for legend
 
-    return fig1, fig2
+    return fig2
+
+
+def create_wind_plots(
+    combined_df, start_date, end_date=None
+) -> tuple[plt.Figure, plt.Figure]:
+    """Create wind-specific plots: time series and wind rose."""
+    return (
+        create_wind_timeseries_plot(combined_df, start_date, end_date),
+        create_wind_rose_plot(combined_df),
+    )
 
 
 def create_3d_wind_plot(combined_df, start_date, end_date=None) -> plt.Figure:
@@ -254,30 +256,12 @@ def create_3d_wind_plot(combined_df, start_date, end_date=None) -> plt.Figure:
     # Convert wind speed to mph
     wind_speed_mph = ms_to_mph(combined_df["3DSpeed_m_s"])
 
-    # Create direction and time meshgrid
-    dir_bins = np.linspace(0, 360, 73)  # 5-degree bins
-
-    # Use simple indices for the time axis calculations
-    time_bins = np.linspace(0, len(combined_df) - 1, 100)
-
+    # Aggregate every reading into the time x direction grid, using simple
+    # indices for the time axis
+    time_bins, dir_bins, Speed = direction_time_surface(
+        wind_speed_mph, combined_df["Azimuth_deg"], n_time_bins=100, dir_step_deg=5.0
+    )
     Dir, Time = np.meshgrid(dir_bins, time_bins)
-    Speed = np.zeros_like(Dir)
-
-    # For each time bin, interpolate speeds across directions
-    for i, t in enumerate(time_bins):
-        idx = int(round(t))
-        if idx >= len(combined_df):
-            idx = len(combined_df) - 1
-
-        actual_dir = combined_df["Azimuth_deg"].iloc[idx]
-        actual_speed = wind_speed_mph.iloc[idx]
-
-        sigma = 15  # Width of gaussian in degrees
-        dir_diff = np.minimum(
-            np.abs(Dir[i] - actual_dir), np.abs(Dir[i] - (actual_dir + 360))
-        )
-        dir_diff = np.minimum(dir_diff, np.abs(Dir[i] - (actual_dir - 360)))
-        Speed[i] = actual_speed * np.exp(-(dir_diff**2) / (2 * sigma**2))
 
     # Create the surface plot
     surf = ax.plot_surface(
@@ -306,7 +290,7 @@ def create_3d_wind_plot(combined_df, start_date, end_date=None) -> plt.Figure:
     # Set labels with adjusted padding
     ax.set_xlabel("Time", labelpad=30)
     ax.set_ylabel("Wind Direction", labelpad=10)
-    ax.set_zlabel("Wind Speed (mph)", labelpad=5)
+    ax.set_zlabel("Frequency-Weighted Speed (mph)", labelpad=5)
 
     # Set direction ticks
     dir_ticks = np.arange(0, 361, 45)
@@ -314,8 +298,8 @@ def create_3d_wind_plot(combined_df, start_date, end_date=None) -> plt.Figure:
     ax.set_yticks(dir_ticks)
     ax.set_yticklabels(dir_labels)
 
-    # Adjust z-axis limits
-    max_speed = wind_speed_mph.max()
+    # Adjust z-axis limits to the aggregated surface
+    max_speed = Speed.max()
     ax.set_zlim(0, max_speed * 1.1)
 
     # Add title
@@ -330,158 +314,316 @@ def create_3d_wind_plot(combined_df, start_date, end_date=None) -> plt.Figure:
     cbar_ax = fig.add_axes(
         [0.3, 0.05, 0.4, 0.03]
     )  # Moved colorbar much lower (y position now 0.05)
-    fig.colorbar(surf, cax=cbar_ax, orientation="horizontal", label="Wind Speed (mph)")
+    fig.colorbar(
+        surf,
+        cax=cbar_ax,
+        orientation="horizontal",
+        label="Frequency-Weighted Speed (mph)",
+    )
 
     return fig
 
 
-def create_weather_plot(
-    start_date: str, end_date: str = None, save_locally: bool = False
-) -> tuple[
-    tuple[str, str, str, str],
-    tuple[io.BytesIO, io.BytesIO, io.BytesIO, io.BytesIO],
-    tuple[Path, Path, Path, Path],
-]:
-    """Create weather plots and return filename and buffer."""
-    try:
-        # Generate list of dates
-        start = datetime.strptime(start_date, "%Y_%m_%d")
-        end = datetime.strptime(end_date, "%Y_%m_%d") if end_date else start
-
-        # Initialize empty list to store DataFrames
-        dfs = []
-
-        # Read and combine data
-        current = start
-        while current <= end:
-            date_str = current.strftime("%Y_%m_%d")
-            filename = DATA_DIR / f"{date_str}_weather_station_data.csv"
-
-            if not filename.exists():
-                rprint(f"[red]Warning: File not found for {date_str}[/red]")
-            else:
-                try:
-                    # Read CSV with explicit dtypes for each column
-                    df = pd.read_csv(
-                        filename,
-                        parse_dates=["tNow"],  # Parse tNow as datetime
-                        dtype={
-                            "u_m_s": float,
-                            "v_m_s": float,
-                            "w_m_s": float,
-                            "2dSpeed_m_s": float,
-                            "3DSpeed_m_s": float,
-                            "Azimuth_deg": float,
-                            "Elev_deg": float,
-                            "Press_Pa": float,
-                            "Temp_C": float,
-                            "Hum_RH": float,
-                            "SonicTemp_C": float,
-                            "Error": float,
-                        },
-                        on_bad_lines="skip",
-                    )
+def plot_source_files(start_date: str, end_date: str = None) -> list[Path]:
+    """CSV files that exist for the days of a date range."""
+    start = datetime.strptime(start_date, "%Y_%m_%d")
+    end = datetime.strptime(end_date, "%Y_%m_%d") if end_date else start
 
-                    # Verify we have data
-                    if len(df) == 0:
-                        rprint(
-                            f"[yellow]Warning: No valid data in file {date_str}[/yellow]"
-                        )
-                        continue
+    files = []
+    current = start
+    while current <= end:
+        filename = DATA_DIR / f"{current.strftime('%Y_%m_%d')}_weather_station_data.csv"
+        if filename.exists():
+            files.append(filename)
+        current += pd.Timedelta(days=1)
+    return files
 
-                    dfs.append(df)
+
+def load_plot_data(start_date: str, end_date: str = None) -> pd.DataFrame:
+    """Read the CSVs of a date range and add the derived plot columns."""
+    # Generate list of dates
+    start = datetime.strptime(start_date, "%Y_%m_%d")
+    end = datetime.strptime(end_date, "%Y_%m_%d") if end_date else start
+
+    # Initialize empty list to store DataFrames
+    dfs = []
+
+    # Read and combine data
+    current = start
+    while current <= end:
+        date_str = current.strftime("%Y_%m_%d")
+        filename = DATA_DIR / f"{date_str}_weather_station_data.csv"
+
+        if not filename.exists():
+            rprint(f"[red]Warning: File not found for {date_str}[/red]")
+        else:
+            try:
+                # Read CSV with explicit dtypes for each column
+                df = pd.read_csv(
+                    filename,
+                    parse_dates=["tNow"],  # Parse tNow as datetime
+                    dtype={
+                        "u_m_s": float,
+                        "v_m_s": float,
+                        "w_m_s": float,
+                        "2dSpeed_m_s": float,
+                        "3DSpeed_m_s": float,
+                        "Azimuth_deg": float,
+                        "Elev_deg": float,
+                        "Press_Pa": float,
+                        "Temp_C": float,
+                        "Hum_RH": float,
+                        "SonicTemp_C": float,
+                        "Error": float,
+                    },
+                    on_bad_lines="skip",
+                )
+
+                # Verify we have data
+                if len(df) == 0:
                     rprint(
-                        f"[green]Successfully read {len(df)} rows from {date_str}[/green]"
+                        f"[yellow]Warning: No valid data in file {date_str}[/yellow]"
                     )
-
-                except Exception as e:
-                    rprint(f"[red]Error reading file {date_str}: {str(e)}[/red]")
                     continue
 
-            current += pd.Timedelta(days=1)
+                dfs.append(df)
+                rprint(
+                    f"[green]Successfully read {len(df)} rows from {date_str}[/green]"
+                )
 
-        if not dfs:
-            raise FileNotFoundError("No data files found for the specified date range")
+            except Exception as e:
+                rprint(f"[red]Error reading file {date_str}: {str(e)}[/red]")
+                continue
 
-        # Combine all DataFrames
-        combined_df = pd.concat(dfs, ignore_index=True)
+        current += pd.Timedelta(days=1)
 
-        # Calculate dew point and convert temperatures
-        combined_df["Dew_Point_C"] = calculate_dewpoint(
-            combined_df["Temp_C"], combined_df["Hum_RH"]
-        )
+    if not dfs:
+        raise FileNotFoundError("No data files found for the specified date range")
 
-        # Convert to Fahrenheit
-        combined_df["Temp_F"] = celsius_to_fahrenheit(combined_df["Temp_C"])
-        combined_df["Dew_Point_F"] = celsius_to_fahrenheit(combined_df["Dew_Point_C"])
+    # Combine all DataFrames
+    combined_df = pd.concat(dfs, ignore_index=True)
 
-        # Create four figures
-        fig1 = plt.figure(figsize=(12, 10))
-        gs = fig1.add_gridspec(
-            3, 1, height_ratios=[1, 1, 1], hspace=0.4
-        )  # Increased hspace
+    # Calculate dew point and convert temperatures
+    combined_df["Dew_Point_C"] = calculate_dewpoint(
+        combined_df["Temp_C"], combined_df["Hum_RH"]
+    )
 
-        # Plot temperature and dew point in Fahrenheit
-        ax1 = fig1.add_subplot(gs[0])
-        ax1.plot(
-            combined_df["tNow"], combined_df["Temp_F"], label="Temperature", color="red"
-        )
-        ax1.plot(
-            combined_df["tNow"],
-            combined_df["Dew_Point_F"],
-            label="Dew Point",
-            color="blue",
-        )
-        ax1.set_ylabel("Temperature (°F)")
-        ax1.legend()
-        ax1.grid(True)
-        ax1.set_xticklabels([])  # Hide x-axis labels
-        ax1.tick_params(axis="x", length=0)  # Hide x-axis ticks
-
-        # Plot humidity
-        ax2 = fig1.add_subplot(gs[1])
-        ax2.plot(combined_df["tNow"], combined_df["Hum_RH"], color="green")
-        ax2.set_ylabel("Relative Humidity (%)")
-        ax2.grid(True)
-        ax2.set_xticklabels([])  # Hide x-axis labels
-        ax2.tick_params(axis="x", length=0)  # Hide x-axis ticks
-
-        # Plot pressure
-        ax3 = fig1.add_subplot(gs[2])
-        ax3.plot(
-            combined_df["tNow"], combined_df["Press_Pa"] / 100, color="purple"
-        )  # Convert Pa to hPa
-        ax3.set_ylabel("Pressure (hPa)")
-        ax3.grid(True)
-
-        # Format x-axis for bottom subplot only
-        ax3.tick_params(axis="x", rotation=45)
-
-        # Add overall title
-        if end_date:
-            title = f"Weather Conditions: {start_date} to {end_date}"
-        else:
-            title = f"Weather Conditions: {start_date}"
-        fig1.suptitle(title, y=0.95)  # Adjust title position
+    # Convert to Fahrenheit
+    combined_df["Temp_F"] = celsius_to_fahrenheit(combined_df["Temp_C"])
+    combined_df["Dew_Point_F"] = celsius_to_fahrenheit(combined_df["Dew_Point_C"])
+
+    return combined_df
+
+
+def create_conditions_plot(combined_df, start_date, end_date=None) -> plt.Figure:
+    """Create temperature/dew point, humidity and pressure panels."""
+    fig1 = plt.figure(figsize=(12, 10))
+    gs = fig1.add_gridspec(
+        3, 1, height_ratios=[1, 1, 1], hspace=0.4
+    )  # Increased hspace
+
+    # Plot temperature and dew point in Fahrenheit
+    ax1 = fig1.add_subplot(gs[0])
+    plot_envelope(
+        ax1,
+        combined_df["tNow"],
+        combined_df["Temp_F"],
+        label="Temperature",
+        color="red",
+    )
+    plot_envelope(
+        ax1,
+        combined_df["tNow"],
+        combined_df["Dew_Point_F"],
+        label="Dew Point",
+        color="blue",
+    )
+    ax1.set_ylabel("Temperature (°F)")
+    ax1.legend()
+    ax1.grid(True)
+    ax1.set_xticklabels([])  # Hide x-axis labels
+    ax1.tick_params(axis="x", length=0)  # Hide x-axis ticks
 
-        # Ensure proper spacing
-        fig1.subplots_adjust(top=0.92, bottom=0.1, left=0.1, right=0.95, hspace=0.4)
+    # Plot humidity
+    ax2 = fig1.add_subplot(gs[1])
+    plot_envelope(ax2, combined_df["tNow"], combined_df["Hum_RH"], color="green")
+    ax2.set_ylabel("Relative Humidity (%)")
+    ax2.grid(True)
+    ax2.set_xticklabels([])  # Hide x-axis labels
+    ax2.tick_params(axis="x", length=0)  # Hide x-axis ticks
+
+    # Plot pressure
+    ax3 = fig1.add_subplot(gs[2])
+    plot_envelope(
+        ax3, combined_df["tNow"], combined_df["Press_Pa"] / 100, color="purple"
+    )  # Convert Pa to hPa
+    ax3.set_ylabel("Pressure (hPa)")
+    ax3.grid(True)
 
-        # Wind figures
-        fig2, fig3 = create_wind_plots(combined_df, start_date, end_date)
-        fig4 = create_3d_wind_plot(combined_df, start_date, end_date)
+    # Format x-axis for bottom subplot only
+    ax3.tick_params(axis="x", rotation=45)
 
-        # Save all plots to buffers
-        weather_buf = io.BytesIO()
-        wind_ts_buf = io.BytesIO()
-        wind_rose_buf = io.BytesIO()
-        wind_3d_buf = io.BytesIO()
+    # Add overall title
+    if end_date:
+        title = f"Weather Conditions: {start_date} to {end_date}"
+    else:
+        title = f"Weather Conditions: {start_date}"
+    fig1.suptitle(title, y=0.95)  # Adjust title position
+
+    # Ensure proper spacing
+    fig1.subplots_adjust(top=0.92, bottom=0.1, left=0.1, right=0.95, hspace=0.4)
+
+    return fig1
+
+
+# Figures of `plot`, in output order: file prefix -> (builder, columns it reads)
+PLOT_FIGURES = {
+    "weather_plot": (
+        create_conditions_plot,
+        ["tNow", "Temp_F", "Dew_Point_F", "Hum_RH", "Press_Pa"],
+    ),
+    "wind_timeseries": (
+        create_wind_timeseries_plot,
+        ["tNow", "u_m_s", "v_m_s", "3DSpeed_m_s", "Azimuth_deg"],
+    ),
+    "wind_rose": (
+        lambda df, start_date, end_date: create_wind_rose_plot(df),
+        ["2dSpeed_m_s", "Azimuth_deg"],
+    ),
+    "wind_3d": (create_3d_wind_plot, ["tNow", "3DSpeed_m_s", "Azimuth_deg"]),
+}
+
+# Render profiles of `plot`: output resolution, image format, encoder options
+# (Pillow pil_kwargs for raster formats) and figure size. Layouts are in
+# points, so with figsize None (each figure's own size) dpi alone sets the
+# pixel size; a figsize in inches replaces it, e.g. so thumbnail text stays
+# legible. svg is vector output, where dpi only sizes line decimation.
+RENDER_PROFILES = {
+    "report": {"dpi": 300, "format": "png", "pil_kwargs": None, "figsize": None},
+    "discord": {
+        "dpi": 120,
+        "format": "webp",
+        "pil_kwargs": {"quality": 85},
+        "figsize": None,
+    },
+    "thumbnail": {
+        "dpi": 50,
+        "format": "jpeg",
+        "pil_kwargs": {"quality": 70},
+        "figsize": (8, 6),
+    },
+    "svg": {"dpi": 150, "format": "svg", "pil_kwargs": None, "figsize": None},
+}
+DEFAULT_PROFILE = "report"
+
+# File extension per output format
+FORMAT_EXTENSIONS = {"png": "png", "webp": "webp", "jpeg": "jpg", "svg": "svg"}
+
+# Worker processes rendering the figures of one `plot` call from the CLI;
+# calls made inside a worker process (e.g. the bot's job pool) render serially
+RENDER_WORKERS = min(len(PLOT_FIGURES), os.cpu_count() or 1)
+
+
+def render_figure(fig, format="png", dpi=300, pil_kwargs=None) -> bytes:
+    """Rasterize a figure once and close it; the bytes can go to any sink."""
+    buf = io.BytesIO()
+    options = {"pil_kwargs": pil_kwargs} if pil_kwargs else {}
+    fig.savefig(buf, format=format, bbox_inches="tight", dpi=dpi, **options)
+    plt.close(fig)
+    return buf.getvalue()
+
+
+def render_plot(name, df, start_date, end_date=None, profile=DEFAULT_PROFILE) -> bytes:
+    """Build and render one of PLOT_FIGURES (runs in a worker process).
+
+    The figure is created at the profile's dpi so line decimation can size
+    itself to the rendered pixel width, then resized to the profile's
+    figsize if it has one.
+    """
+    builder, _ = PLOT_FIGURES[name]
+    options = RENDER_PROFILES[profile]
+    with plt.rc_context({"figure.dpi": options["dpi"]}):
+        fig = builder(df, start_date, end_date)
+    if options["figsize"]:
+        fig.set_size_inches(options["figsize"])
+    return render_figure(fig, options["format"], options["dpi"], options["pil_kwargs"])
+
+
+def render_plots(
+    combined_df, start_date, end_date=None, profile=DEFAULT_PROFILE
+) -> dict[str, bytes]:
+    """Render every figure of PLOT_FIGURES, in parallel where possible.
+
+    Each worker only receives the columns its figure reads. Inside a worker
+    process the figures are rendered serially: its pool already runs jobs
+    side by side, and a pool per job would multiply the processes.
+    """
+    jobs = {name: combined_df[columns] for name, (_, columns) in PLOT_FIGURES.items()}
+
+    in_worker = multiprocessing.parent_process() is not None
+    if RENDER_WORKERS > 1 and not in_worker:
+        try:
+            with ProcessPoolExecutor(max_workers=RENDER_WORKERS) as pool:
+                futures = {
+                    name: pool.submit(
+                        render_plot, name, df, start_date, end_date, profile
+                    )
+                    for name, df in jobs.items()
+                }
+                return {name: future.result() for name, future in futures.items()}
+        except (OSError, BrokenProcessPool) as e:
+            rprint(
+                f"[yellow]Warning: Parallel rendering unavailable ({e}), "
+                "rendering serially[/yellow]"
+            )
 
-        # Save to buffers with higher DPI
-        fig1.savefig(weather_buf, format="png", bbox_inches="tight", dpi=300)
-        fig2.savefig(wind_ts_buf, format="png", bbox_inches="tight", dpi=300)
-        fig3.savefig(wind_rose_buf, format="png", bbox_inches="tight", dpi=300)
-        fig4.savefig(wind_3d_buf, format="png", bbox_inches="tight", dpi=300)
+    return {
+        name: render_plot(name, df, start_date, end_date, profile)
+        for name, df in jobs.items()
+    }
+
+
+def create_weather_plot(
+    start_date: str,
+    end_date: str = None,
+    save_locally: bool = False,
+    use_cache: bool = True,
+    profile: str = DEFAULT_PROFILE,
+) -> tuple[
+    tuple[str, str, str, str],
+    tuple[io.BytesIO, io.BytesIO, io.BytesIO, io.BytesIO],
+    tuple[Path, Path, Path, Path],
+]:
+    """Create weather plots and return filename and buffer.
+
+    Each figure is rendered once; the same bytes back the returned buffers
+    and, with save_locally, the files under BOT_FIGURE_DIR. Renders are
+    cached by date range, source file versions and render options.
+
+    `profile` names one of RENDER_PROFILES (report, discord, thumbnail, svg).
+    """
+    try:
+        if profile not in RENDER_PROFILES:
+            raise ValueError(
+                f"Unknown render profile '{profile}', "
+                f"choose from {', '.join(RENDER_PROFILES)}"
+            )
+        options = RENDER_PROFILES[profile]
+
+        # Finished days are served from the plot cache without reading CSVs
+        names = list(PLOT_FIGURES)
+        source_files = plot_source_files(start_date, end_date)
+        cache_key = None
+        images = None
+        if use_cache and source_files:
+            cache_key = plot_cache_key(start_date, end_date, source_files, options)
+            images = load_cached_plots(cache_key, names)
+
+        if images is None:
+            combined_df = load_plot_data(start_date, end_date)
+            images = render_plots(combined_df, start_date, end_date, profile)
+            if cache_key is not None:
+                store_cached_plots(cache_key, images)
 
         # Create filenames with consistent formatting
         if end_date:
@@ -489,41 +631,17 @@ def create_weather_plot(
         else:
             base_name = f"{start_date}"
 
-        weather_filename = f"weather_plot_{base_name}.png"
-        wind_ts_filename = f"wind_timeseries_{base_name}.png"
-        wind_rose_filename = f"wind_rose_{base_name}.png"
-        wind_3d_filename = f"wind_3d_{base_name}.png"
+        extension = FORMAT_EXTENSIONS[options["format"]]
+        filenames = tuple(f"{name}_{base_name}.{extension}" for name in PLOT_FIGURES)
+        buffers = tuple(io.BytesIO(images[name]) for name in PLOT_FIGURES)
+        filepaths = tuple(Path(BOT_FIGURE_DIR) / filename for filename in filenames)
 
         # Only save locally if explicitly requested
         if save_locally:
-            weather_filepath = Path(BOT_FIGURE_DIR) / weather_filename
-            wind_ts_filepath = Path(BOT_FIGURE_DIR) / wind_ts_filename
-            wind_rose_filepath = Path(BOT_FIGURE_DIR) / wind_rose_filename
-            wind_3d_filepath = Path(BOT_FIGURE_DIR) / wind_3d_filename
-
-            fig1.savefig(weather_filepath, format="png", bbox_inches="tight", dpi=300)
-            fig2.savefig(wind_ts_filepath, format="png", bbox_inches="tight", dpi=300)
-            fig3.savefig(wind_rose_filepath, format="png", bbox_inches="tight", dpi=300)
-            fig4.savefig(wind_3d_filepath, format="png", bbox_inches="tight", dpi=300)
-        else:
-            # If not saving locally, just create Path objects but don't save
-            weather_filepath = Path(BOT_FIGURE_DIR) / weather_filename
-            wind_ts_filepath = Path(BOT_FIGURE_DIR) / wind_ts_filename
-            wind_rose_filepath = Path(BOT_FIGURE_DIR) / wind_rose_filename
-            wind_3d_filepath = Path(BOT_FIGURE_DIR) / wind_3d_filename
-
-        weather_buf.seek(0)
-        wind_ts_buf.seek(0)
-        wind_rose_buf.seek(0)
-        wind_3d_buf.seek(0)
-
-        plt.close("all")
-
-        return (
-            (weather_filename, wind_ts_filename, wind_rose_filename, wind_3d_filename),
-            (weather_buf, wind_ts_buf, wind_rose_buf, wind_3d_buf),
-            (weather_filepath, wind_ts_filepath, wind_rose_filepath, wind_3d_filepath),
-        )
+            for filepath, name in zip(filepaths, PLOT_FIGURES):
+                filepath.write_bytes(images[name])
+
+        return filenames, buffers, filepaths
 
     except Exception as e:
         raise Exception(f"Error creating plots: {str(e)}")
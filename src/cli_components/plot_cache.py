@@ -0,0 +1,90 @@
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from rich import print as rprint
+
+from src import BOT_FIGURE_DIR
+
+# Rendered `plot` figures, one directory per cache key
+PLOT_CACHE_DIR = Path(BOT_FIGURE_DIR) / "cache"
+PLOT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# Bump when the figure code changes so stale renders are not served
+PLOT_CACHE_VERSION = 2
+
+
+def plot_cache_key(start_date, end_date, source_files, options):
+    """Content address of a plot request.
+
+    Source files are identified by name, size and modification time, so a
+    finished day always maps to the same key while a file that is still
+    being written (today) gets a new key whenever it grows.
+    """
+    sources = []
+    for path in source_files:
+        stat = Path(path).stat()
+        sources.append([Path(path).name, stat.st_size, stat.st_mtime_ns])
+
+    payload = json.dumps(
+        {
+            "version": PLOT_CACHE_VERSION,
+            "start": start_date,
+            "end": end_date,
+            "sources": sources,
+            "options": options,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def load_cached_plots(key, names):
+    """Cached images for `names`, or None on a miss. Marks the entry as used."""
+    entry = PLOT_CACHE_DIR / key
+    try:
+        images = {name: (entry / name).read_bytes() for name in names}
+    except OSError:
+        return None
+
+    # Directory mtime is the LRU clock
+    os.utime(entry)
+    return images
+
+
+def store_cached_plots(key, images):
+    """Store rendered images under `key`, then evict down to the size bound."""
+    entry = PLOT_CACHE_DIR / key
+    staging = PLOT_CACHE_DIR / f".{key}.{os.getpid()}"
+    try:
+        staging.mkdir(parents=True, exist_ok=True)
+        for name, data in images.items():
+            (staging / name).write_bytes(data)
+
+        # Publish the entry atomically; a concurrent writer may have won
+        try:
+            os.replace(staging, entry)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+
+        evict_plot_cache()
+    except OSError as e:
+        shutil.rmtree(staging, ignore_errors=True)
+        rprint(f"[yellow]Warning: Could not cache plots: {e}[/yellow]")
+
+
+def evict_plot_cache(max_bytes=PLOT_CACHE_MAX_BYTES):
+    """Remove least recently used entries until the cache fits in max_bytes."""
+    entries = []
+    for entry in PLOT_CACHE_DIR.iterdir():
+        if entry.is_dir() and not entry.name.startswith("."):
+            size = sum(f.stat().st_size for f in entry.iterdir())
+            entries.append((entry.stat().st_mtime, size, entry))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, entry in sorted(entries, key=lambda e: e[0]):
+        if total <= max_bytes:
+            break
+        shutil.rmtree(entry, ignore_errors=True)
+        total -= size
@@ -0,0 +1,155 @@
+import math
+from datetime import datetime, timedelta
+from rich import print as rprint
+
+from processing.schema import SENSOR_FIELDS
+from .utils import wait_for_readings
+
+# Server-side rollups of weather_data: bucket unit -> collection
+ROLLUP_COLLECTIONS = {"minute": "weather_1min", "hour": "weather_1h"}
+
+# Fields averaged per bucket (with _min/_max); direction is averaged circularly
+ROLLUP_FIELDS = [field for field in SENSOR_FIELDS if field != "Azimuth_deg"]
+
+
+def _circular_mean_stage():
+    """$set stage turning the sin/cos sums into a mean direction in [0, 360)."""
+    degrees = {
+        "$multiply": [
+            {"$atan2": ["$Azimuth_sin", "$Azimuth_cos"]},
+            180 / math.pi,
+        ]
+    }
+    return {
+        "$set": {
+            "Azimuth_deg": {
+                "$cond": [
+                    {"$gt": ["$Azimuth_n", 0]},
+                    {"$mod": [{"$add": [degrees, 360]}, 360]},
+                    None,
+                ]
+            }
+        }
+    }
+
+
+def _minute_pipeline(start, end):
+    """Raw readings in [start, end) grouped into one-minute buckets."""
+    azimuth_rad = {"$degreesToRadians": "$Azimuth_deg"}
+    is_number = {"$isNumber": "$Azimuth_deg"}
+    group = {
+        "_id": {"$dateTrunc": {"date": "$tNow", "unit": "minute"}},
+        "count": {"$sum": 1},
+        "Azimuth_sin": {"$sum": {"$cond": [is_number, {"$sin": azimuth_rad}, 0]}},
+        "Azimuth_cos": {"$sum": {"$cond": [is_number, {"$cos": azimuth_rad}, 0]}},
+        "Azimuth_n": {"$sum": {"$cond": [is_number, 1, 0]}},
+    }
+    for field in ROLLUP_FIELDS:
+        group[field] = {"$avg": f"${field}"}
+        group[f"{field}_min"] = {"$min": f"${field}"}
+        group[f"{field}_max"] = {"$max": f"${field}"}
+
+    return [
+        {"$match": {"tNow": {"$gte": start, "$lt": end}}},
+        {"$group": group},
+        {"$set": {"tNow": "$_id"}},
+        {"$unset": "_id"},
+        _circular_mean_stage(),
+        {
+            "$merge": {
+                "into": ROLLUP_COLLECTIONS["minute"],
+                "on": "tNow",
+                "whenMatched": "replace",
+                "whenNotMatched": "insert",
+            }
+        },
+    ]
+
+
+def _hour_pipeline(start, end):
+    """Minute rollups in [start, end) combined into hourly buckets.
+
+    Means are weighted by the minute counts, so they equal the mean of the
+    raw readings without reading them again.
+    """
+    group = {
+        "_id": {"$dateTrunc": {"date": "$tNow", "unit": "hour"}},
+        "count": {"$sum": "$count"},
+        "Azimuth_sin": {"$sum": "$Azimuth_sin"},
+        "Azimuth_cos": {"$sum": "$Azimuth_cos"},
+        "Azimuth_n": {"$sum": "$Azimuth_n"},
+    }
+    weighted = {}
+    for field in ROLLUP_FIELDS:
+        group[f"{field}_sum"] = {"$sum": {"$multiply": [f"${field}", "$count"]}}
+        group[f"{field}_n"] = {
+            "$sum": {"$cond": [{"$isNumber": f"${field}"}, "$count", 0]}
+        }
+        group[f"{field}_min"] = {"$min": f"${field}_min"}
+        group[f"{field}_max"] = {"$max": f"${field}_max"}
+        weighted[field] = {
+            "$cond": [
+                {"$gt": [f"${field}_n", 0]},
+                {"$divide": [f"${field}_sum", f"${field}_n"]},
+                None,
+            ]
+        }
+
+    return [
+        {"$match": {"tNow": {"$gte": start, "$lt": end}}},
+        {"$group": group},
+        {"$set": {"tNow": "$_id", **weighted}},
+        {
+            "$unset": ["_id"]
+            + [f"{field}_sum" for field in ROLLUP_FIELDS]
+            + [f"{field}_n" for field in ROLLUP_FIELDS]
+        },
+        _circular_mean_stage(),
+        {
+            "$merge": {
+                "into": ROLLUP_COLLECTIONS["hour"],
+                "on": "tNow",
+                "whenMatched": "replace",
+                "whenNotMatched": "insert",
+            }
+        },
+    ]
+
+
+def update_rollups(db, date, expected=None):
+    """Rebuild the minute and hour rollups of one uploaded day.
+
+    Args:
+        db: MongoDB database connection
+        date (str): Date in YYYY_MM_DD format
+        expected (int, optional): Number of readings uploaded for the day
+    """
+    try:
+        start = datetime.strptime(date, "%Y_%m_%d")
+        end = start + timedelta(days=1)
+
+        collection = db["weather_data"]
+        if expected and not wait_for_readings(collection, start, end, expected):
+            rprint(
+                f"[yellow]Warning: Not all readings for {date} are visible yet, "
+                "rollups may be incomplete[/yellow]"
+            )
+
+        for name in ROLLUP_COLLECTIONS.values():
+            db[name].create_index("tNow", unique=True)
+
+        # Buckets that no longer have readings must not survive a re-upload
+        delete_rollups(db, start, end)
+        collection.aggregate(_minute_pipeline(start, end))
+        db[ROLLUP_COLLECTIONS["minute"]].aggregate(_hour_pipeline(start, end))
+        return True
+    except Exception as e:
+        rprint(f"[yellow]Warning: Could not update rollups for {date}: {e}[/yellow]")
+        return False
+
+
+def delete_rollups(db, start=None, end=None):
+    """Remove rollup buckets in [start, end), or all of them."""
+    query = {} if start is None else {"tNow": {"$gte": start, "$lt": end}}
+    for name in ROLLUP_COLLECTIONS.values():
+        db[name].delete_many(query)
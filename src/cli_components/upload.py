@@ -16,6 +16,9 @@ from rich.progress import (
 from rich.console import Console
 import streamlit as st
 from .utils import print_collection_stats
+from .wind_histogram import update_wind_histogram
+from .rollup import update_rollups
+from .metadata import update_day_metadata
 from typing import Any
 from pathlib import Path
 import sys
@@ -147,6 +150,9 @@ def upload_csv_to_mongodb(
                         else:
                             rprint(f"[red]Error in chunk: {result}[/red]")
 
+                update_wind_histogram(db, df, date)
+                update_rollups(db, date, expected=total_rows)
+                update_day_metadata(db, date, expected=total_rows)
                 rprint(f"[green]Processed {date}: {total_rows:,} records[/green]")
         else:
             # Original progress bar output for CLI
@@ -210,6 +216,13 @@ def upload_csv_to_mongodb(
                             else:
                                 rprint(f"[red]Error in chunk: {result}[/red]")
 
+                    # Per-day wind histogram for the dashboard wind rose
+                    update_wind_histogram(db, df, date)
+                    # Minute/hour rollups for long-range dashboard views
+                    update_rollups(db, date, expected=total_rows)
+                    # Bounds and per-day counts read by check and the dashboard
+                    update_day_metadata(db, date, expected=total_rows)
+
         # Summary
         rprint(f"\n[bold blue]{'='*50}[/bold blue]")
         rprint("[bold]Upload Summary:[/bold]")
@@ -4,8 +4,12 @@ from pymongo import MongoClient
 import streamlit as st
 from rich import print as rprint
 import json
+import time
 from typing import Any
 
+# Uploads are written unacknowledged, so wait this long for them to land
+READINGS_WAIT_SECONDS = 30
+
 
 def print_banner():
     colorama.init()
@@ -86,5 +90,16 @@ def print_collection_stats(collection: Any, collection_name: str) -> None:
     rprint(f"[bold blue]{'='*60}[/bold blue]\n")
 
 
+def wait_for_readings(collection, start, end, expected):
+    """Wait until `expected` readings of [start, end) are visible."""
+    query = {"tNow": {"$gte": start, "$lt": end}}
+    deadline = time.monotonic() + READINGS_WAIT_SECONDS
+    while collection.count_documents(query) < expected:
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(1)
+    return True
+
+
 def print_usage(usage_text):
     print(f"{Fore.YELLOW}Usage:{Style.RESET_ALL} {usage_text}\n")
@@ -0,0 +1,52 @@
+from datetime import datetime, timedelta, UTC
+from rich import print as rprint
+
+from processing.wind_rose import MS_TO_MPH, fine_histogram, histogram_to_document
+
+HISTOGRAM_COLLECTION = "wind_histograms"
+
+
+def update_wind_histogram(db, df, date):
+    """Store the fine wind histogram for one uploaded day.
+
+    Args:
+        db: MongoDB database connection
+        df: DataFrame holding that day's readings
+        date (str): Date in YYYY_MM_DD format
+    """
+    try:
+        day = datetime.strptime(date, "%Y_%m_%d").strftime("%Y-%m-%d")
+        hist = fine_histogram(df["2dSpeed_m_s"] * MS_TO_MPH, df["Azimuth_deg"])
+
+        collection = db[HISTOGRAM_COLLECTION]
+        collection.create_index("date", unique=True)
+        collection.replace_one(
+            {"date": day},
+            {
+                "date": day,
+                "total": int(hist.sum()),
+                **histogram_to_document(hist),
+                "timestamp": datetime.now(UTC),
+            },
+            upsert=True,
+        )
+        return True
+    except Exception as e:
+        rprint(
+            f"[yellow]Warning: Could not store wind histogram for {date}: {e}[/yellow]"
+        )
+        return False
+
+
+def delete_wind_histograms(db, start=None, end=None):
+    """Remove stored histograms for days in [start, end), or all of them."""
+    collection = db[HISTOGRAM_COLLECTION]
+    if start is None:
+        return collection.delete_many({})
+
+    days = []
+    current = start
+    while current < end:
+        days.append(current.strftime("%Y-%m-%d"))
+        current += timedelta(days=1)
+    return collection.delete_many({"date": {"$in": days}})
@@ -9,19 +9,21 @@ import json
 import sys
 from pathlib import Path
 
-# Add project root to Python path
+# Add project root (for src) and src (for processing) to Python path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "src"))
 
 from src import ANALYSIS_RESULTS_DIR  # noqa: E402
+from processing.circular import rolling_circular_std  # noqa: E402
+from processing.schema import apply_weather_schema  # noqa: E402
 
 
 # Read the CSV file
 def load_weather_data(file_path):
     df = pd.read_csv(file_path)
-    # Convert timestamp to datetime
-    df["tNow"] = pd.to_datetime(df["tNow"])
-    return df
+    # Parse tNow as UTC and store sensors as float32
+    return apply_weather_schema(df)
 
 
 def analyze_wind_patterns(df):
@@ -36,8 +38,10 @@ def analyze_wind_patterns(df):
     # Calculate wind gustiness (standard deviation of wind speed)
     wind_gustiness = df["3DSpeed_m_s"].rolling(window=10).std()
 
-    # Calculate wind variability
-    wind_direction_variability = df["Azimuth_deg"].rolling(window=10).std()
+    # Calculate wind variability (circular, so 350° and 10° are 20° apart)
+    wind_direction_variability = pd.Series(
+        rolling_circular_std(df["Azimuth_deg"], 10), index=df.index
+    )
 
     # Add wind rose analysis
     wind_rose_data = pd.DataFrame(
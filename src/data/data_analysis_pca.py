@@ -9,22 +9,22 @@ import json
 from pathlib import Path
 import sys
 
-# Add project root to Python path
+# Add project root (for src) and src (for processing) to Python path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "src"))
 
 from src import ANALYSIS_RESULTS_DIR  # noqa: E402
+from processing.schema import add_time_columns, apply_weather_schema  # noqa: E402
 
 
 def load_and_prepare_data(file_path: str) -> tuple[pd.DataFrame, list]:
     """Load and prepare data for PCA analysis."""
     # Load data
-    df = pd.read_csv(file_path)
-    df["tNow"] = pd.to_datetime(df["tNow"])
+    df = apply_weather_schema(pd.read_csv(file_path))
 
     # Add temporal features
-    df["hour"] = df["tNow"].dt.hour
-    df["day"] = df["tNow"].dt.day
+    add_time_columns(df)
 
     # Update features list
     features = [
@@ -49,7 +49,8 @@ def perform_pca_analysis(df: pd.DataFrame, features: list) -> tuple:
     """Perform PCA analysis and save results."""
     # Standardize the features
     scaler = StandardScaler()
-    scaled_features = scaler.fit_transform(df[features])
+    # Fit in float64 so the stored model does not depend on the frame dtypes
+    scaled_features = scaler.fit_transform(df[features].astype(np.float64))
 
     # Perform PCA
     pca = PCA()
@@ -77,6 +78,9 @@ def perform_pca_analysis(df: pd.DataFrame, features: list) -> tuple:
             "pc_coordinates": pca.components_[:3].T.tolist(),  # First 3 PCs for 3D
             "explained_variance_3d": explained_variance_ratio[:3].tolist(),
             "feature_names": features,
+            # Scaler parameters, so the dashboard can project without refitting
+            "scaler_mean": scaler.mean_.tolist(),
+            "scaler_scale": scaler.scale_.tolist(),
         },
     }
 
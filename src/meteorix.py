@@ -1,3 +1,4 @@
+import functools
 import io
 import sys
 from contextlib import redirect_stdout
@@ -8,13 +9,22 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 import asyncio
+from concurrent.futures.process import BrokenProcessPool
 
 # Add the project root to Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from cli import main as cli_main  # noqa: E402
-from cli_components.plot import create_weather_plot  # noqa: E402
+from cli_components.plot import create_weather_plot, RENDER_PROFILES  # noqa: E402
+from cli_components.jobs import (  # noqa: E402
+    JobRunner,
+    JobQueueFull,
+    SingleFlight,
+    BOT_JOB_WORKERS,
+    BOT_JOB_QUEUE_LIMIT,
+    BOT_JOB_TIMEOUT,
+)
 from cli_components.monitor import (  # noqa: E402
     toggle_monitor,
     check_data_freshness,
@@ -23,7 +33,9 @@ from cli_components.monitor import (  # noqa: E402
 from cli_components import (  # noqa: E402
     get_available_models,
     handle_chat_command,
+    spit_csv_data,
 )
+from cli_components.chat import build_data_context  # noqa: E402
 
 # Set up the bot with required intents
 intents = discord.Intents.default()
@@ -65,6 +77,125 @@ ALLOWED_CHANNEL_IDS = [
 ]
 
 
+# Plots sent to Discord are downscaled by the client, so render them smaller
+BOT_PLOT_PROFILE = "discord"
+
+
+def plot_arguments(args):
+    """Split ["plot", start, [end], ["--profile", name]] into call arguments."""
+    args = list(args[1:])
+    profile = BOT_PLOT_PROFILE
+    if "--profile" in args:
+        i = args.index("--profile")
+        profile = args[i + 1]
+        del args[i : i + 2]
+    return args[0], args[1] if len(args) > 1 else None, profile
+
+
+# Plot and spit run in worker processes so the event loop keeps serving
+bot_jobs = JobRunner(BOT_JOB_WORKERS, BOT_JOB_QUEUE_LIMIT, BOT_JOB_TIMEOUT)
+
+# Identical plot/spit requests arriving together share one job. Chat replies
+# are not shared, since they are not deterministic and belong to whoever
+# asked, but the weather data they are built from is
+bot_flights = SingleFlight()
+
+
+def format_seconds(seconds):
+    minutes, seconds = divmod(round(seconds), 60)
+    return f"{minutes}m {seconds}s" if minutes else f"{seconds}s"
+
+
+async def send_plots(send, start_date, end_date=None, profile=BOT_PLOT_PROFILE):
+    """Render plots in the job pool and send them, with a progress message.
+
+    `send` is ctx.send or an interaction followup that returns the message.
+    """
+    label = start_date + (f" to {end_date}" if end_date else "")
+    key = ("plot", start_date, end_date, profile)
+    status = None
+
+    async def report_progress(position, elapsed, eta):
+        nonlocal status
+        text = f"⏳ Rendering plots for {label}"
+        text += f" (job {position} in queue)" if position > 1 else ""
+        if elapsed:
+            text += f", {format_seconds(elapsed)} elapsed"
+        if eta is not None:
+            text += f", ETA ~{format_seconds(max(eta - elapsed, 0))}"
+        try:
+            if status is None:
+                status = await send(text)
+            else:
+                await status.edit(content=text)
+        except discord.HTTPException:
+            pass
+
+    async def render():
+        filenames, plot_buffers, _ = await bot_jobs.submit(
+            create_weather_plot,
+            start_date,
+            end_date,
+            False,
+            True,
+            profile,
+            on_progress=report_progress,
+        )
+        return filenames, [buffer.getvalue() for buffer in plot_buffers]
+
+    try:
+        if bot_flights.running(key):
+            status = await send(f"⏳ Already rendering plots for {label}, sharing them")
+        filenames, images = await bot_flights.run(key, render)
+
+        # Each message needs its own buffers
+        files = [
+            discord.File(fp=io.BytesIO(data), filename=fname)
+            for fname, data in zip(filenames, images)
+        ]
+        await send(f"📊 Weather plots for {label}", files=files)
+    except JobQueueFull:
+        await send("🚦 Too many plots are being rendered, please try again shortly.")
+    except TimeoutError:
+        await send(f"⌛ Plot for {label} took longer than {BOT_JOB_TIMEOUT}s.")
+    except BrokenProcessPool:
+        await send("💥 The plot worker crashed, please try again.")
+    except Exception as e:
+        await send(f"Error creating plots: {str(e)}")
+    finally:
+        if status is not None:
+            try:
+                await status.delete()
+            except discord.HTTPException:
+                pass
+
+
+async def spit_output(args):
+    """CSV for ["spit", start, [end]], shared with identical concurrent requests."""
+    start_date = args[1] if len(args) > 1 else None
+    end_date = args[2] if len(args) > 2 else None
+
+    async def render():
+        _, buffer = await bot_jobs.submit(spit_csv_data, start_date, end_date)
+        return buffer.getvalue()
+
+    return await bot_flights.run(("spit", start_date, end_date), render)
+
+
+async def chat_context(dates):
+    """Weather data for `dates`, read once for identical concurrent chats."""
+    return await bot_flights.run(
+        ("chat", *dates),
+        functools.partial(asyncio.to_thread, build_data_context, dates),
+    )
+
+
+async def chat_response(args):
+    """Chat answer for `args`, or None if the command produced none."""
+    coroutine = handle_chat_command(args, chat_context)
+    return await coroutine if coroutine is not None else None
+
+
 # Update the channel check functions
 def check_channel():
     async def predicate(ctx):
@@ -123,14 +254,14 @@ async def help_command(ctx, command_name=None):
 **Available Commands:**
 • `upload [start_date] [end_date]` - Upload weather data to database
 • `delete [start_date] [end_date]` - Delete weather data from database
-• `check` - Check database collections
+• `check [verify]` - Check database collections (verify rebuilds the metadata)
 • `head [date]` - Show earliest logged timestamp or first 5 rows if date specified
 • `tail [date]` - Show latest logged timestamp or last 5 rows if date specified
 • `info [month]` - Show available date range and file statistics for a specific month (format: YYYY_MM)
 • `spit <start_date> [end_date]` - Get raw CSV data for specified dates
 • `eda` - Run exploratory data analysis
 • `ml` - Run machine learning analysis
-• `plot <start_date> [end_date]` - Generate weather plots for specified dates
+• `plot <start_date> [end_date] [profile]` - Generate weather plots for specified dates (profile: discord, report, thumbnail or svg)
 • `monitor <action>` - Monitor data collection status (action: enable, disable, status)
 • `freq <action>` - Control data logging frequency (action: 0=1Hz, 1=32Hz, status)
 • `ifconfig` - Show Raspberry Pi network information
@@ -173,14 +304,14 @@ async def help_command(ctx, command_name=None):
 **Available Commands:**
 • `upload [start_date] [end_date]` - Upload weather data to database
 • `delete [start_date] [end_date]` - Delete weather data from database
-• `check` - Check database collections
+• `check [verify]` - Check database collections (verify rebuilds the metadata)
 • `head [date]` - Show earliest logged timestamp or first 5 rows if date specified
 • `tail [date]` - Show latest logged timestamp or last 5 rows if date specified
 • `info [month]` - Show available date range and file statistics for a specific month (format: YYYY_MM)
 • `spit <start_date> [end_date]` - Get raw CSV data for specified dates
 • `eda` - Run exploratory data analysis
 • `ml` - Run machine learning analysis
-• `plot <start_date> [end_date]` - Generate weather plots for specified dates
+• `plot <start_date> [end_date] [profile]` - Generate weather plots for specified dates (profile: discord, report, thumbnail or svg)
 • `monitor <action>` - Monitor data collection status (action: enable, disable, status)
 • `freq <action>` - Control data logging frequency (action: 0=1Hz, 1=32Hz, status)
 • `ifconfig` - Show Raspberry Pi network information
@@ -215,14 +346,14 @@ Try `@meteorix help` for more information."""
 **Available Commands:**
 • `upload [start_date] [end_date]` - Upload weather data to database
 • `delete [start_date] [end_date]` - Delete weather data from database
-• `check` - Check database collections
+• `check [verify]` - Check database collections (verify rebuilds the metadata)
 • `head [date]` - Show earliest logged timestamp or first 5 rows if date specified
 • `tail [date]` - Show latest logged timestamp or last 5 rows if date specified
 • `info [month]` - Show available date range and file statistics for a specific month (format: YYYY_MM)
 • `spit <start_date> [end_date]` - Get raw CSV data for specified dates
 • `eda` - Run exploratory data analysis
 • `ml` - Run machine learning analysis
-• `plot <start_date> [end_date]` - Generate weather plots for specified dates
+• `plot <start_date> [end_date] [profile]` - Generate weather plots for specified dates (profile: discord, report, thumbnail or svg)
 • `monitor <action>` - Monitor data collection status (action: enable, disable, status)
 • `freq <action>` - Control data logging frequency (action: 0=1Hz, 1=32Hz, status)
 • `ifconfig` - Show Raspberry Pi network information
@@ -283,8 +414,11 @@ async def delete(ctx, start_date=None, end_date=None):
 
 @bot.command(name="check")
 @check_channel()
-async def check(ctx):
-    await run_cli_command(ctx, ["check"])
+async def check(ctx, mode=None):
+    if mode == "verify":
+        await run_cli_command(ctx, ["check", "--verify"])
+    else:
+        await run_cli_command(ctx, ["check"])
 
 
 @bot.command(name="head")
@@ -343,25 +477,11 @@ async def who(ctx):
 
 @bot.command(name="plot")
 @check_channel()
-async def plot(ctx, start_date, end_date=None):
-    try:
-        # Generate plots in memory only (bypass CLI completely)
-        filenames, plot_buffers, _ = create_weather_plot(
-            start_date, end_date, save_locally=False
-        )
-
-        files = [
-            discord.File(fp=buffer, filename=fname)
-            for fname, buffer in zip(filenames, plot_buffers)
-        ]
-
-        await ctx.send(
-            f"📊 Weather plots for {start_date}"
-            + (f" to {end_date}" if end_date else ""),
-            files=files,
-        )
-    except Exception as e:
-        await ctx.send(f"Error creating plots: {str(e)}")
+async def plot(ctx, start_date, end_date=None, profile=BOT_PLOT_PROFILE):
+    # `!plot <start> <profile>` is allowed as well as `!plot <start> <end> <profile>`
+    if end_date in RENDER_PROFILES:
+        end_date, profile = None, end_date
+    await send_plots(ctx.send, start_date, end_date, profile)
 
 
 @bot.command(name="monitor")
@@ -454,28 +574,23 @@ async def chat_command(ctx, *, prompt=None):
             await ctx.send(response)
             return
 
-        # Get the coroutine from handle_chat_command
-        coroutine = handle_chat_command(args)
-
         # Send typing indicator while processing
         async with ctx.typing():
-            # Only await if it's a coroutine
-            if coroutine is not None:
-                response = await coroutine
-
-                if response:
-                    # Split long messages if needed
-                    MAX_LENGTH = 2000
-                    messages = [
-                        response[i : i + MAX_LENGTH]
-                        for i in range(0, len(response), MAX_LENGTH)
-                    ]
-                    for message in messages:
-                        await ctx.send(message)
-                else:
-                    await ctx.send(
-                        "Sorry, I couldn't process your request. Please try again."
-                    )
+            response = await chat_response(args)
+
+            if response:
+                # Split long messages if needed
+                MAX_LENGTH = 2000
+                messages = [
+                    response[i : i + MAX_LENGTH]
+                    for i in range(0, len(response), MAX_LENGTH)
+                ]
+                for message in messages:
+                    await ctx.send(message)
+            else:
+                await ctx.send(
+                    "Sorry, I couldn't process your request. Please try again."
+                )
 
     except Exception as e:
         await ctx.send(f"Error: {str(e)}")
@@ -543,9 +658,15 @@ async def ml_slash(interaction: discord.Interaction):
 
 
 @bot.tree.command(name="check", description="Check database collections")
+@app_commands.describe(
+    verify="Rebuild the metadata from the raw data and report mismatches"
+)
 @app_commands.check(check_channel_slash)
-async def check_slash(interaction: discord.Interaction):
-    await run_cli_command_slash(interaction, ["check"])
+async def check_slash(interaction: discord.Interaction, verify: bool = False):
+    if verify:
+        await run_cli_command_slash(interaction, ["check", "--verify"])
+    else:
+        await run_cli_command_slash(interaction, ["check"])
 
 
 @bot.tree.command(name="who", description="Show information about the bot")
@@ -596,15 +717,23 @@ async def spit_slash(
 @app_commands.describe(
     start_date="Start date in YYYY_MM_DD format",
     end_date="End date in YYYY_MM_DD format (optional)",
+    profile="Render profile: discord (default), report (full quality), thumbnail or svg",
+)
+@app_commands.choices(
+    profile=[app_commands.Choice(name=name, value=name) for name in RENDER_PROFILES]
 )
 @app_commands.check(check_channel_slash)
 async def plot_slash(
-    interaction: discord.Interaction, start_date: str, end_date: str = None
+    interaction: discord.Interaction,
+    start_date: str,
+    end_date: str = None,
+    profile: str = BOT_PLOT_PROFILE,
 ):
     if end_date:
-        await run_cli_command_slash(interaction, ["plot", start_date, end_date])
+        args = ["plot", start_date, end_date]
     else:
-        await run_cli_command_slash(interaction, ["plot", start_date])
+        args = ["plot", start_date]
+    await run_cli_command_slash(interaction, args + ["--profile", profile])
 
 
 @bot.tree.command(name="monitor", description="Monitor data collection status")
@@ -697,31 +826,22 @@ async def chat_slash(
 
         args = Args(prompt, model)
 
-        # Get and await the coroutine
-        coroutine = handle_chat_command(args)
-
-        # Only await if it's a coroutine
-        if coroutine is not None:
-            response = await coroutine
+        response = await chat_response(args)
 
-            if response:
-                # Split long messages if needed
-                MAX_LENGTH = 2000
-                messages = [
-                    response[i : i + MAX_LENGTH]
-                    for i in range(0, len(response), MAX_LENGTH)
-                ]
+        if response:
+            # Split long messages if needed
+            MAX_LENGTH = 2000
+            messages = [
+                response[i : i + MAX_LENGTH]
+                for i in range(0, len(response), MAX_LENGTH)
+            ]
 
-                # Send first message as followup
-                await interaction.followup.send(messages[0])
+            # Send first message as followup
+            await interaction.followup.send(messages[0])
 
-                # Send remaining messages if any
-                for message in messages[1:]:
-                    await interaction.channel.send(message)
-            else:
-                await interaction.followup.send(
-                    "Sorry, I couldn't process your request. Please try again."
-                )
+            # Send remaining messages if any
+            for message in messages[1:]:
+                await interaction.channel.send(message)
         else:
             await interaction.followup.send(
                 "Sorry, I couldn't process your request. Please try again."
@@ -799,14 +919,14 @@ async def help_slash(interaction: discord.Interaction, command_name: str = None)
 **Available Commands:**
 • `upload [start_date] [end_date]` - Upload weather data to database
 • `delete [start_date] [end_date]` - Delete weather data from database
-• `check` - Check database collections
+• `check [verify]` - Check database collections (verify rebuilds the metadata)
 • `head [date]` - Show earliest logged timestamp or first 5 rows if date specified
 • `tail [date]` - Show latest logged timestamp or last 5 rows if date specified
 • `info [month]` - Show available date range and file statistics for a specific month (format: YYYY_MM)
 • `spit <start_date> [end_date]` - Get raw CSV data for specified dates
 • `eda` - Run exploratory data analysis
 • `ml` - Run machine learning analysis
-• `plot <start_date> [end_date]` - Generate weather plots for specified dates
+• `plot <start_date> [end_date] [profile]` - Generate weather plots for specified dates (profile: discord, report, thumbnail or svg)
 • `monitor <action>` - Monitor data collection status (action: enable, disable, status)
 • `freq <action>` - Control data logging frequency (action: 0=1Hz, 1=32Hz, status)
 • `ifconfig` - Show Raspberry Pi network information
@@ -864,14 +984,14 @@ async def help_slash(interaction: discord.Interaction, command_name: str = None)
 **Available Commands:**
 • `upload [start_date] [end_date]` - Upload weather data to database
 • `delete [start_date] [end_date]` - Delete weather data from database
-• `check` - Check database collections
+• `check [verify]` - Check database collections (verify rebuilds the metadata)
 • `head [date]` - Show earliest logged timestamp or first 5 rows if date specified
 • `tail [date]` - Show latest logged timestamp or last 5 rows if date specified
 • `info [month]` - Show available date range and file statistics for a specific month (format: YYYY_MM)
 • `spit <start_date> [end_date]` - Get raw CSV data for specified dates
 • `eda` - Run exploratory data analysis
 • `ml` - Run machine learning analysis
-• `plot <start_date> [end_date]` - Generate weather plots for specified dates
+• `plot <start_date> [end_date] [profile]` - Generate weather plots for specified dates (profile: discord, report, thumbnail or svg)
 • `monitor <action>` - Monitor data collection status (action: enable, disable, status)
 • `freq <action>` - Control data logging frequency (action: 0=1Hz, 1=32Hz, status)
 • `ifconfig` - Show Raspberry Pi network information
@@ -911,34 +1031,22 @@ async def help_slash(interaction: discord.Interaction, command_name: str = None)
 # Helper functions
 async def run_cli_command(ctx, args):
     try:
-        # For plot command, bypass cli_main entirely and use create_weather_plot directly
+        # For plot command, bypass cli_main entirely and render in the job pool
         if args[0] == "plot":
-            # Generate plots in memory
-            filenames, plot_buffers, _ = create_weather_plot(
-                args[1], args[2] if len(args) > 2 else None
-            )
-
-            # Create discord.File objects directly from memory buffers
-            files = [
-                discord.File(fp=buffer, filename=fname)
-                for fname, buffer in zip(filenames, plot_buffers)
-            ]
-
-            await ctx.send(
-                f"📊 Weather plots for {args[1]}"
-                + (f" to {args[2]}" if len(args) > 2 else ""),
-                files=files,
-            )
-            return  # Ensure the function exits here to prevent further processing
+            await send_plots(ctx.send, *plot_arguments(args))
+            return
 
         # For other commands, use the normal CLI output handling
-        f = io.StringIO()
-        with redirect_stdout(f):
-            sys.argv = ["meteorix"] + args
-            cli_main()
+        if args[0] == "spit":
+            output = await spit_output(args)
+        else:
+            f = io.StringIO()
+            with redirect_stdout(f):
+                sys.argv = ["meteorix"] + args
+                cli_main()
+            output = f.getvalue()
 
         # Rest of the command handling...
-        output = f.getvalue()
         if not output.strip():
             output = "Command completed successfully with no output."
 
@@ -970,38 +1078,27 @@ async def run_cli_command(ctx, args):
 
 async def run_cli_command_slash(interaction: discord.Interaction, args):
     await interaction.response.defer()
-    f = io.StringIO()
+    if args[0] == "plot":
+        # For plot command, only send the plots without running CLI output
+        send = functools.partial(interaction.followup.send, wait=True)
+        await send_plots(send, *plot_arguments(args))
+        return
+
     try:
-        with redirect_stdout(f):
-            sys.argv = ["meteorix"] + args
-            if args[0] == "plot":
-                # For plot command, only get the plots without running CLI output
-                filenames, plot_buffers, _ = create_weather_plot(
-                    args[1], args[2] if len(args) > 2 else None
-                )
-            else:
+        if args[0] == "spit":
+            output = await spit_output(args)
+        else:
+            f = io.StringIO()
+            with redirect_stdout(f):
+                sys.argv = ["meteorix"] + args
                 cli_main()
-
-        output = f.getvalue()
+            output = f.getvalue()
 
         if not output.strip():
             output = "Command completed successfully with no output."
 
-        # For plot command, send all generated images
-        if args[0] == "plot":
-            # Create discord.File objects for each plot
-            files = [
-                discord.File(fp=buffer, filename=fname)
-                for fname, buffer in zip(filenames, plot_buffers)
-            ]
-
-            await interaction.followup.send(
-                f"📊 Weather plots for {args[1]}"
-                + (f" to {args[2]}" if len(args) > 2 else ""),
-                files=files,
-            )
         # For spit command, always send as file
-        elif args[0] == "spit":
+        if args[0] == "spit":
             temp_file = io.StringIO(output)
             file = discord.File(
                 fp=temp_file,
@@ -1067,14 +1164,14 @@ async def on_command_error(ctx, error):
 **Available Commands:**
 • `upload [start_date] [end_date]` - Upload weather data to database
 • `delete [start_date] [end_date]` - Delete weather data from database
-• `check` - Check database collections
+• `check [verify]` - Check database collections (verify rebuilds the metadata)
 • `head [date]` - Show earliest logged timestamp or first 5 rows if date specified
 • `tail [date]` - Show latest logged timestamp or last 5 rows if date specified
 • `info [month]` - Show available date range and file statistics for a specific month (format: YYYY_MM)
 • `spit <start_date> [end_date]` - Get raw CSV data for specified dates
 • `eda` - Run exploratory data analysis
 • `ml` - Run machine learning analysis
-• `plot <start_date> [end_date]` - Generate weather plots for specified dates
+• `plot <start_date> [end_date] [profile]` - Generate weather plots for specified dates (profile: discord, report, thumbnail or svg)
 • `monitor <action>` - Monitor data collection status (action: enable, disable, status)
 • `freq <action>` - Control data logging frequency (action: 0=1Hz, 1=32Hz, status)
 • `ifconfig` - Show Raspberry Pi network information
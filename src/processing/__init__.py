@@ -0,0 +1,71 @@
+from .density import binned_mean
+from .downsample import (
+    DOWNSAMPLE_MODES,
+    point_budget,
+    lttb_indices,
+    minmax_indices,
+    interleave_extremes,
+    downsample,
+)
+from .circular import (
+    circular_stats,
+    circular_stats_from_sums,
+    time_bucket_starts,
+    resample_direction,
+    rolling_circular_std,
+)
+from .gust import rolling_max, rolling_max_windows
+from .pca import (
+    standardize_params,
+    project_scores,
+    fit_incremental_pca,
+    subsample_indices,
+)
+from .schema import (
+    SENSOR_FIELDS,
+    EXTREME_FIELDS,
+    apply_weather_schema,
+    add_time_columns,
+    memory_report,
+)
+from .surface import wrapped_gaussian_weights, direction_time_surface
+from .wind_rose import (
+    fine_histogram,
+    wind_rose_counts,
+    rebin_histogram,
+    histogram_to_document,
+    histogram_from_document,
+)
+
+__all__ = [
+    "binned_mean",
+    "DOWNSAMPLE_MODES",
+    "point_budget",
+    "lttb_indices",
+    "minmax_indices",
+    "interleave_extremes",
+    "downsample",
+    "circular_stats",
+    "circular_stats_from_sums",
+    "time_bucket_starts",
+    "resample_direction",
+    "rolling_circular_std",
+    "rolling_max",
+    "rolling_max_windows",
+    "standardize_params",
+    "project_scores",
+    "fit_incremental_pca",
+    "subsample_indices",
+    "SENSOR_FIELDS",
+    "EXTREME_FIELDS",
+    "apply_weather_schema",
+    "add_time_columns",
+    "memory_report",
+    "wrapped_gaussian_weights",
+    "direction_time_surface",
+    "fine_histogram",
+    "wind_rose_counts",
+    "rebin_histogram",
+    "histogram_to_document",
+    "histogram_from_document",
+]
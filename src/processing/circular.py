@@ -0,0 +1,128 @@
+import numpy as np
+import pandas as pd
+
+# Yamartino (1984) correction factor 2/sqrt(3) - 1
+_YAMARTINO_K = 2.0 / np.sqrt(3.0) - 1.0
+
+
+def _unit_components(directions_deg):
+    """sin, cos and validity mask of directions; NaN readings contribute 0."""
+    radians = np.radians(np.asarray(directions_deg, dtype=np.float64))
+    sin_v, cos_v = np.sin(radians), np.cos(radians)
+    missing = np.isnan(radians)
+    if missing.any():
+        sin_v[missing] = 0.0
+        cos_v[missing] = 0.0
+    return sin_v, cos_v, (~missing).astype(np.float64)
+
+
+def circular_stats_from_sums(sin_sum, cos_sum, count):
+    """Circular mean, resultant length and Yamartino std from sin/cos sums.
+
+    Sums can come from numpy reductions or a MongoDB $group; means (with
+    count 1) work as well. Buckets with count 0 give NaN.
+
+    Returns:
+        tuple of (mean direction in degrees [0, 360), mean resultant length
+        in [0, 1], Yamartino standard deviation in degrees)
+    """
+    sin_sum = np.asarray(sin_sum, dtype=np.float64)
+    cos_sum = np.asarray(cos_sum, dtype=np.float64)
+    count = np.asarray(count, dtype=np.float64)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        sin_mean = np.where(count > 0, sin_sum / count, np.nan)
+        cos_mean = np.where(count > 0, cos_sum / count, np.nan)
+
+    mean_deg = np.degrees(np.arctan2(sin_mean, cos_mean)) % 360
+    # Tiny negative angles round up to 360 under the modulo
+    mean_deg = np.where(mean_deg >= 360.0, 0.0, mean_deg)
+    resultant = np.minimum(np.hypot(sin_mean, cos_mean), 1.0)
+
+    epsilon = np.sqrt(1.0 - resultant**2)
+    std_deg = np.degrees(np.arcsin(epsilon) * (1.0 + _YAMARTINO_K * epsilon**3))
+    return mean_deg, resultant, std_deg
+
+
+def circular_stats(directions_deg, starts=None):
+    """Circular statistics of directions, overall or per contiguous group.
+
+    Args:
+        directions_deg: Directions in degrees, NaN readings are ignored
+        starts: Sorted start positions of contiguous groups (as for
+            np.add.reduceat); None treats all readings as one group
+
+    Returns:
+        tuple of (mean, resultant length, Yamartino std) arrays per group
+    """
+    sin_v, cos_v, valid = _unit_components(directions_deg)
+    if starts is None:
+        return circular_stats_from_sums(sin_v.sum(), cos_v.sum(), valid.sum())
+    if len(sin_v) == 0 or len(starts) == 0:
+        empty = np.array([], dtype=np.float64)
+        return empty, empty.copy(), empty.copy()
+
+    starts = np.asarray(starts, dtype=np.intp)
+    return circular_stats_from_sums(
+        np.add.reduceat(sin_v, starts),
+        np.add.reduceat(cos_v, starts),
+        np.add.reduceat(valid, starts),
+    )
+
+
+def time_bucket_starts(times, freq):
+    """Start positions and labels of fixed time buckets over sorted times.
+
+    Buckets are aligned to midnight of the first day like pandas' resample
+    default; only buckets holding at least one reading are returned.
+
+    Returns:
+        tuple of (start positions, bucket start timestamps)
+    """
+    times = pd.DatetimeIndex(times)
+    if len(times) == 0:
+        return np.array([], dtype=np.intp), times[:0]
+
+    # Bucket edges are found by binary search, so the cost is
+    # O(buckets * log n) rather than a pass over every reading
+    edges = pd.date_range(times[0].normalize(), times[-1], freq=freq)
+    starts = np.searchsorted(times, edges, side="left")
+    stops = np.append(starts[1:], len(times))
+    occupied = stops > starts
+    return starts[occupied], edges[occupied]
+
+
+def resample_direction(times, directions_deg, freq):
+    """Circular mean, resultant length and Yamartino std per time bucket.
+
+    Vectorised replacement for ``resample(freq).agg(circular_mean)``; empty
+    buckets are left out instead of yielding NaN rows.
+
+    Returns:
+        DataFrame indexed by bucket start with columns mean, resultant, std
+    """
+    starts, labels = time_bucket_starts(times, freq)
+    mean_deg, resultant, std_deg = circular_stats(directions_deg, starts)
+    return pd.DataFrame(
+        {"mean": mean_deg, "resultant": resultant, "std": std_deg}, index=labels
+    )
+
+
+def rolling_circular_std(directions_deg, window):
+    """Yamartino std over a trailing window of ``window`` readings.
+
+    Uses running sin/cos sums, so the cost is O(n) for any window; the first
+    window - 1 positions are NaN like pandas' ``rolling(window).std()``.
+    """
+    sin_v, cos_v, valid = _unit_components(directions_deg)
+
+    def trailing_sum(values):
+        csum = np.concatenate(([0.0], np.cumsum(values)))
+        out = np.full(len(values), np.nan)
+        out[window - 1 :] = csum[window:] - csum[:-window]
+        return out
+
+    _, _, std_deg = circular_stats_from_sums(
+        trailing_sum(sin_v), trailing_sum(cos_v), trailing_sum(valid)
+    )
+    return std_deg
@@ -0,0 +1,53 @@
+import numpy as np
+
+
+def binned_mean(x, y, values, bins=200):
+    """Mean of ``values`` and point count on a regular 2-D grid over x and y.
+
+    A vectorised 2-D histogram (two np.bincount calls), used to draw very
+    large scatter plots as a density image. Points with a NaN coordinate or
+    value are ignored; empty cells hold NaN.
+
+    Args:
+        x: X coordinates
+        y: Y coordinates
+        values: Value per point to average in each cell
+        bins: Number of cells along each axis
+
+    Returns:
+        tuple of (x cell centres, y cell centres, mean grid, count grid); the
+        grids have shape (len(y centres), len(x centres)) for heatmaps
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+
+    valid = ~(np.isnan(x) | np.isnan(y) | np.isnan(values))
+    if not valid.all():
+        x, y, values = x[valid], y[valid], values[valid]
+
+    if len(x) == 0:
+        empty = np.full((bins, bins), np.nan)
+        centres = np.arange(bins, dtype=np.float64)
+        return centres, centres.copy(), empty, np.zeros((bins, bins), np.int64)
+
+    def edges(v):
+        lo, hi = v.min(), v.max()
+        if hi == lo:
+            lo, hi = lo - 0.5, hi + 0.5
+        return lo, (hi - lo) / bins
+
+    x_lo, x_step = edges(x)
+    y_lo, y_step = edges(y)
+    ix = np.minimum(((x - x_lo) / x_step).astype(np.int64), bins - 1)
+    iy = np.minimum(((y - y_lo) / y_step).astype(np.int64), bins - 1)
+    cell = iy * bins + ix
+
+    counts = np.bincount(cell, minlength=bins * bins).reshape(bins, bins)
+    sums = np.bincount(cell, weights=values, minlength=bins * bins).reshape(bins, bins)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = np.where(counts > 0, sums / counts, np.nan)
+
+    x_centres = x_lo + (np.arange(bins) + 0.5) * x_step
+    y_centres = y_lo + (np.arange(bins) + 0.5) * y_step
+    return x_centres, y_centres, means, counts
@@ -0,0 +1,128 @@
+import numpy as np
+
+# Downsampling modes understood by downsample()
+DOWNSAMPLE_MODES = ("lttb", "minmax")
+
+
+def point_budget(width_px, points_per_px=2, min_points=200):
+    """Number of points worth sending for a chart that is width_px wide."""
+    return max(int(width_px * points_per_px), min_points)
+
+
+def _as_float(x):
+    """View timestamps as int64 nanoseconds so they can be binned numerically."""
+    # Series/Index .values gives UTC datetime64 even for tz-aware timestamps
+    x = np.asarray(getattr(x, "values", x))
+    if np.issubdtype(x.dtype, np.datetime64):
+        return x.astype("datetime64[ns]").astype(np.int64).astype(np.float64)
+    return x.astype(np.float64)
+
+
+def lttb_indices(x, y, n_out):
+    """Largest-Triangle-Three-Buckets selection; returns indices into x/y.
+
+    NaN samples are skipped. The first and last valid samples are always kept.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    valid = np.flatnonzero(np.isfinite(y))
+    n = len(valid)
+    if n_out >= n or n_out < 3:
+        return valid
+
+    xv = _as_float(x)[valid]
+    yv = y[valid]
+
+    # Bucket edges for the n_out - 2 interior buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], max(edges[i + 1], edges[i] + 1)
+
+        # Average of the next bucket (or the last point for the final bucket)
+        if i + 2 < len(edges):
+            nlo, nhi = edges[i + 1], max(edges[i + 2], edges[i + 1] + 1)
+            avg_x = xv[nlo:nhi].mean()
+            avg_y = yv[nlo:nhi].mean()
+        else:
+            avg_x, avg_y = xv[-1], yv[-1]
+
+        # Pick the point forming the largest triangle with a and the average
+        area = np.abs(
+            (xv[a] - avg_x) * (yv[lo:hi] - yv[a])
+            - (xv[a] - xv[lo:hi]) * (avg_y - yv[a])
+        )
+        a = lo + int(np.argmax(area))
+        selected[i + 1] = a
+
+    return valid[selected]
+
+
+def minmax_indices(x, y, n_out):
+    """Min/max envelope selection over n_out // 2 equal-width x buckets.
+
+    Each bucket contributes the index of its minimum and maximum, so peaks
+    survive regardless of how many samples are dropped. Returns sorted indices.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    valid = np.flatnonzero(np.isfinite(y))
+    n = len(valid)
+    n_buckets = max(n_out // 2, 1)
+    if n <= n_out:
+        return valid
+
+    xv = _as_float(x)[valid]
+    yv = y[valid]
+
+    # Bucket by position along the x range, i.e. per horizontal pixel
+    span = xv[-1] - xv[0]
+    if span > 0:
+        bucket = ((xv - xv[0]) / span * n_buckets).astype(np.int64)
+        np.minimum(bucket, n_buckets - 1, out=bucket)
+    else:
+        bucket = np.arange(n) * n_buckets // n
+
+    # x is sorted, so buckets are contiguous runs
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    counts = np.diff(np.r_[starts, n])
+
+    def first_match(values):
+        hits = np.flatnonzero(yv == np.repeat(values, counts))
+        return hits[np.searchsorted(hits, starts)]
+
+    idx_min = first_match(np.minimum.reduceat(yv, starts))
+    idx_max = first_match(np.maximum.reduceat(yv, starts))
+
+    return valid[np.unique(np.concatenate([idx_min, idx_max]))]
+
+
+def interleave_extremes(x, y_min, y_max):
+    """One series through the minimum then the maximum of every bucket.
+
+    Drawn as a line it spans each bucket's full range, like the min/max
+    envelope of the samples the buckets summarise. Returns (x, y) with two
+    points per bucket.
+    """
+    x = x.repeat(2) if hasattr(x, "repeat") else np.repeat(np.asarray(x), 2)
+    y = np.column_stack(
+        [np.asarray(y_min, dtype=np.float64), np.asarray(y_max, dtype=np.float64)]
+    ).ravel()
+    return x, y
+
+
+def downsample(x, y, n_out, mode="lttb"):
+    """Reduce a series to about n_out points; returns (x, y) arrays."""
+    if mode == "lttb":
+        idx = lttb_indices(x, y, n_out)
+    elif mode == "minmax":
+        idx = minmax_indices(x, y, n_out)
+    else:
+        raise ValueError(f"Unknown downsample mode: {mode}")
+
+    # Positional take keeps pandas objects (and their timezone) intact
+    if not hasattr(x, "take"):
+        x = np.asarray(x)
+    return x.take(idx), np.asarray(y)[idx]
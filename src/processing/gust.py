@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+
+
+def rolling_max(times, values, window):
+    """Time-based rolling maximum of values over a trailing window.
+
+    For every sample i the result is max(values[j]) over the samples with
+    times[i] - window < times[j] <= times[i]. NaN samples are skipped; a
+    window holding only NaN gives NaN.
+
+    Args:
+        times: Sorted timestamps (datetime64 values or DatetimeIndex)
+        values: Sample values, same length as times
+        window: Window length (pandas offset string or Timedelta)
+
+    Returns:
+        float64 array of rolling maxima
+    """
+    return rolling_max_windows(times, values, [window])[window]
+
+
+def rolling_max_windows(times, values, windows):
+    """rolling_max for several windows over the same samples.
+
+    The time index is built once and shared; pandas evaluates each window
+    with a monotonic deque, so every window costs one O(n) pass.
+
+    Returns:
+        Dict of window -> float64 array of rolling maxima
+    """
+    series = pd.Series(
+        np.asarray(values, dtype=np.float64), index=pd.DatetimeIndex(times)
+    )
+    return {
+        window: series.rolling(pd.Timedelta(window)).max().to_numpy()
+        for window in windows
+    }
@@ -0,0 +1,58 @@
+import numpy as np
+
+
+def standardize_params(X):
+    """Column mean and standard deviation (population, like StandardScaler)."""
+    X = np.asarray(X, dtype=np.float64)
+    mean = X.mean(axis=0)
+    scale = X.std(axis=0)
+    scale[scale == 0] = 1.0
+    return mean, scale
+
+
+def project_scores(X, mean, scale, coordinates):
+    """Principal component scores of X from a stored scaler and components.
+
+    Args:
+        X: Samples x features
+        mean: Feature means of the fitted scaler
+        scale: Feature standard deviations of the fitted scaler
+        coordinates: Features x components matrix (transposed PCA components)
+    """
+    X = np.asarray(X, dtype=np.float64)
+    return ((X - mean) / scale) @ np.asarray(coordinates, dtype=np.float64)
+
+
+def fit_incremental_pca(X, n_components=3, chunk_size=50_000):
+    """Fit scaler and PCA over chunks with bounded memory.
+
+    scikit-learn is imported here so callers that only project with stored
+    parameters do not pay for it.
+
+    Returns:
+        tuple of (mean, scale, coordinates as features x components,
+        explained variance ratio per component)
+    """
+    from sklearn.decomposition import IncrementalPCA
+
+    X = np.asarray(X, dtype=np.float64)
+    mean, scale = standardize_params(X)
+
+    n_components = min(n_components, X.shape[1], len(X))
+    # Every partial_fit batch needs at least n_components samples
+    chunk_size = max(chunk_size, n_components)
+    pca = IncrementalPCA(n_components=n_components)
+    for start in range(0, len(X), chunk_size):
+        chunk = X[start : start + chunk_size]
+        if len(chunk) < n_components:
+            break
+        pca.partial_fit((chunk - mean) / scale)
+
+    return mean, scale, pca.components_.T, pca.explained_variance_ratio_
+
+
+def subsample_indices(n, max_points):
+    """Evenly spaced indices selecting at most max_points of n samples."""
+    if n <= max_points:
+        return np.arange(n)
+    return np.linspace(0, n - 1, max_points).astype(np.int64)
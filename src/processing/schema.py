@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+
+# Sensor fields of every weather reading
+SENSOR_FIELDS = [
+    "Temp_C",
+    "Press_Pa",
+    "Hum_RH",
+    "2dSpeed_m_s",
+    "3DSpeed_m_s",
+    "u_m_s",
+    "v_m_s",
+    "w_m_s",
+    "Azimuth_deg",
+    "Elev_deg",
+    "SonicTemp_C",
+]
+
+# Per-bucket extremes kept next to the means in rollups and server-side
+# aggregates; direction is averaged circularly and has none
+EXTREME_FIELDS = [
+    f"{field}_{stat}"
+    for field in SENSOR_FIELDS
+    if field != "Azimuth_deg"
+    for stat in ("min", "max")
+]
+
+# Compact in-memory schema of weather frames. float32 keeps ~7 significant
+# digits, well beyond the sensors' resolution; numeric kernels in this
+# package accumulate in float64.
+SENSOR_DTYPE = np.float32
+TIME_DTYPE = "datetime64[ns, UTC]"
+DERIVED_DTYPES = {"hour": np.int8, "day": np.int8}
+
+
+def apply_weather_schema(df):
+    """Cast a weather frame to the compact schema, in place.
+
+    tNow becomes datetime64[ns, UTC] (naive times are taken as UTC), sensor
+    columns and their extremes float32 and the derived hour/day columns
+    int8. Other columns are left alone. Returns the frame for chaining.
+    """
+    if "tNow" in df:
+        times = pd.to_datetime(df["tNow"])
+        if times.dt.tz is None:
+            times = times.dt.tz_localize("UTC")
+        df["tNow"] = times.dt.tz_convert("UTC").astype(TIME_DTYPE)
+
+    for field in SENSOR_FIELDS + EXTREME_FIELDS:
+        if field in df and df[field].dtype != SENSOR_DTYPE:
+            df[field] = pd.to_numeric(df[field], errors="coerce").astype(SENSOR_DTYPE)
+
+    for column, dtype in DERIVED_DTYPES.items():
+        if column in df and df[column].dtype != dtype:
+            df[column] = df[column].astype(dtype)
+    return df
+
+
+def add_time_columns(df):
+    """Add the hour and day columns derived from tNow, in place."""
+    df["hour"] = df["tNow"].dt.hour.astype(DERIVED_DTYPES["hour"])
+    df["day"] = df["tNow"].dt.day.astype(DERIVED_DTYPES["day"])
+    return df
+
+
+def memory_report(df):
+    """Bytes per column against the wide 8-bytes-per-value layout.
+
+    Returns:
+        DataFrame with column, dtype, bytes and wide_bytes per column
+    """
+    usage = df.memory_usage(deep=True, index=False)
+    return pd.DataFrame(
+        {
+            "column": usage.index,
+            "dtype": [str(df[column].dtype) for column in usage.index],
+            "bytes": usage.to_numpy(),
+            "wide_bytes": [
+                usage[column] if df[column].dtype == object else 8 * len(df)
+                for column in usage.index
+            ],
+        }
+    )
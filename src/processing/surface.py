@@ -0,0 +1,70 @@
+import numpy as np
+
+
+def wrapped_gaussian_weights(centers_deg, grid_deg, sigma_deg):
+    """Gaussian weights on the circle between direction cells and grid points."""
+    diff = np.abs(np.subtract.outer(centers_deg, grid_deg)) % 360
+    diff = np.minimum(diff, 360 - diff)
+    return np.exp(-(diff**2) / (2 * sigma_deg**2))
+
+
+def direction_time_surface(
+    speed, direction_deg, n_time_bins=100, dir_step_deg=5.0, sigma_deg=15.0
+):
+    """Aggregate all readings into a time x direction frequency-weighted speed.
+
+    Readings are split into ``n_time_bins`` equal-count bins along their
+    order and into direction cells of ``dir_step_deg``. Every reading adds
+    a wrapped Gaussian bump of its speed around its direction, and each
+    time bin is the mean of its readings' bumps. The value is therefore
+    speed weighted by how often the wind blew from near that direction, not
+    a speed: a bin with steady wind from one direction peaks at that speed,
+    while wind spread over many directions gives lower, wider ridges.
+    Per-cell speed sums come from one np.bincount and the smoothing is a
+    single matrix product.
+
+    Args:
+        speed: Wind speed per reading
+        direction_deg: Wind direction per reading in degrees
+        n_time_bins: Number of rows (time bins) in the surface
+        dir_step_deg: Direction resolution in degrees, should divide 360
+        sigma_deg: Width of the Gaussian smoothing in degrees
+
+    Returns:
+        tuple of (time positions as mean reading index per bin, direction
+        grid 0..360 inclusive, surface of shape (time bins, directions))
+    """
+    speed = np.asarray(speed, dtype=np.float64)
+    direction = np.asarray(direction_deg, dtype=np.float64)
+    n = len(speed)
+    n_time_bins = max(1, min(n_time_bins, n))
+    n_dirs = int(round(360 / dir_step_deg))
+
+    # Equal-count time bins over reading positions
+    starts = -(-np.arange(n_time_bins + 1) * n // n_time_bins)
+    counts = np.diff(starts)
+    time_positions = (starts[:-1] + starts[1:] - 1) / 2
+    time_bin = np.repeat(np.arange(n_time_bins), counts)
+
+    # Only readings with both speed and direction contribute
+    valid = ~(np.isnan(speed) | np.isnan(direction))
+    if not valid.all():
+        speed, direction, time_bin = speed[valid], direction[valid], time_bin[valid]
+
+    # Nearest direction cell; the +360 offset keeps slightly negative
+    # directions on the right cell under integer truncation
+    cell = ((direction + 360 + dir_step_deg / 2) / dir_step_deg).astype(np.int64)
+    key = time_bin * n_dirs + cell % n_dirs
+
+    # Speed sums per (time bin, direction cell)
+    sums = np.bincount(key, weights=speed, minlength=n_time_bins * n_dirs).reshape(
+        n_time_bins, n_dirs
+    )
+    valid_counts = np.bincount(time_bin, minlength=n_time_bins)
+
+    dir_grid = np.linspace(0, 360, n_dirs + 1)
+    weights = wrapped_gaussian_weights(
+        np.arange(n_dirs) * dir_step_deg, dir_grid, sigma_deg
+    )
+    surface = (sums @ weights) / np.maximum(valid_counts, 1)[:, None]
+    return time_positions, dir_grid, surface
@@ -0,0 +1,155 @@
+import numpy as np
+
+MS_TO_MPH = 2.23694
+
+# Fine histogram grid: 64 direction bins of 5.625° starting at north, so four
+# of them make one 22.5° sector centred on its compass point, and 0.5 mph
+# speed bins up to 65 mph with the last bin open-ended.
+FINE_DIR_STEP = 5.625
+FINE_DIR_BINS = 64
+FINE_SPEED_STEP_MPH = 0.5
+FINE_SPEED_BINS = 130
+FINE_SHAPE = (FINE_DIR_BINS, FINE_SPEED_BINS)
+
+# Display layout shared by the dashboard and the bot/CLI wind roses
+SECTOR_LABELS = [
+    "N",
+    "NNE",
+    "NE",
+    "ENE",
+    "E",
+    "ESE",
+    "SE",
+    "SSE",
+    "S",
+    "SSW",
+    "SW",
+    "WSW",
+    "W",
+    "WNW",
+    "NW",
+    "NNW",
+]
+SPEED_BINS_MPH = [0, 5, 10, 15, 20, 25, 30, 35, 40, 45, 50, 55, 60, float("inf")]
+SPEED_LABELS = [
+    "0-5",
+    "5-10",
+    "10-15",
+    "15-20",
+    "20-25",
+    "25-30",
+    "30-35",
+    "35-40",
+    "40-45",
+    "45-50",
+    "50-55",
+    "55-60",
+    "60+",
+]
+SPEED_COLORS = [
+    "#2ecc71",  # Light breeze (green)
+    "#3498db",  # Gentle breeze (blue)
+    "#f1c40f",  # Moderate breeze (yellow)
+    "#e67e22",  # Fresh breeze (orange)
+    "#e74c3c",  # Strong breeze (red)
+    "#9b59b6",  # Near gale (purple)
+    "#34495e",  # Gale (dark blue)
+    "#c0392b",  # Strong gale (dark red)
+    "#d35400",  # Storm (dark orange)
+    "#8e44ad",  # Violent storm (dark purple)
+    "#ff1493",  # Deep pink for 50-55
+    "#00ffff",  # Cyan for 55-60
+    "#ff0000",  # Bright red for 60+
+]
+
+# Fine bin -> display bin lookup tables
+_SECTOR_OF_FINE_DIR = ((np.arange(FINE_DIR_BINS) + 2) // 4) % len(SECTOR_LABELS)
+_SPEED_BIN_OF_FINE_SPEED = np.minimum(
+    np.arange(FINE_SPEED_BINS) * FINE_SPEED_STEP_MPH // 5, len(SPEED_LABELS) - 1
+).astype(np.int64)
+
+
+def fine_histogram(speed_mph, direction_deg):
+    """Count readings on the fine direction x speed grid.
+
+    Readings with a missing speed or direction are ignored. The result is an
+    int64 array of shape FINE_SHAPE that can be summed across days.
+    """
+    speed = np.asarray(speed_mph, dtype=np.float64)
+    direction = np.asarray(direction_deg, dtype=np.float64)
+    valid = np.isfinite(speed) & np.isfinite(direction) & (speed >= 0)
+
+    dir_idx = (np.mod(direction[valid], 360) // FINE_DIR_STEP).astype(np.int64)
+    np.minimum(dir_idx, FINE_DIR_BINS - 1, out=dir_idx)
+    speed_idx = (speed[valid] // FINE_SPEED_STEP_MPH).astype(np.int64)
+    np.minimum(speed_idx, FINE_SPEED_BINS - 1, out=speed_idx)
+
+    flat = np.bincount(
+        dir_idx * FINE_SPEED_BINS + speed_idx,
+        minlength=FINE_DIR_BINS * FINE_SPEED_BINS,
+    )
+    return flat.reshape(FINE_SHAPE)
+
+
+def wind_rose_counts(speed_mph, direction_deg):
+    """Count readings per display speed bin and sector in one bincount pass.
+
+    Equivalent to rebin_histogram(fine_histogram(...)) without the fine grid.
+    Readings with a missing or negative speed or a missing direction are
+    ignored.
+
+    Returns:
+        int64 array of shape (len(SPEED_LABELS), len(SECTOR_LABELS))
+    """
+    speed = np.asarray(speed_mph, dtype=np.float64)
+    direction = np.asarray(direction_deg, dtype=np.float64)
+    n_sectors = len(SECTOR_LABELS)
+    n_cells = len(SPEED_LABELS) * n_sectors
+
+    with np.errstate(invalid="ignore"):
+        # Sectors are centred on their compass point: shift by half a sector,
+        # floor, and wrap (n_sectors is a power of two)
+        position = direction * (n_sectors / 360) + 0.5
+        sector = np.floor(position, out=position).astype(np.int64)
+        sector &= n_sectors - 1
+
+        speed_bin = (speed * (1 / 5)).astype(np.int64)
+        np.clip(speed_bin, 0, len(SPEED_LABELS) - 1, out=speed_bin)
+
+    cell = speed_bin * n_sectors + sector
+    # Invalid readings go to an extra cell that is dropped
+    cell[~(np.isfinite(speed) & np.isfinite(direction) & (speed >= 0))] = n_cells
+    counts = np.bincount(cell, minlength=n_cells + 1)[:n_cells]
+    return counts.reshape(len(SPEED_LABELS), n_sectors)
+
+
+def rebin_histogram(hist):
+    """Collapse a fine histogram to display counts (speed bins x sectors)."""
+    hist = np.asarray(hist)
+    counts = np.zeros((len(SPEED_LABELS), len(SECTOR_LABELS)), dtype=np.int64)
+    np.add.at(
+        counts,
+        (_SPEED_BIN_OF_FINE_SPEED[None, :], _SECTOR_OF_FINE_DIR[:, None]),
+        hist,
+    )
+    return counts
+
+
+def histogram_to_document(hist):
+    """Sparse, BSON-friendly representation of a fine histogram."""
+    flat = np.asarray(hist).ravel()
+    nonzero = np.flatnonzero(flat)
+    return {
+        "dir_step": FINE_DIR_STEP,
+        "speed_step_mph": FINE_SPEED_STEP_MPH,
+        "shape": list(FINE_SHAPE),
+        "index": nonzero.tolist(),
+        "counts": flat[nonzero].tolist(),
+    }
+
+
+def histogram_from_document(doc):
+    """Inverse of histogram_to_document."""
+    flat = np.zeros(FINE_DIR_BINS * FINE_SPEED_BINS, dtype=np.int64)
+    flat[np.asarray(doc["index"], dtype=np.int64)] = doc["counts"]
+    return flat.reshape(FINE_SHAPE)
@@ -1,29 +1,37 @@
-from .wind_rose import wind_rose_component
-from .wind_time_series import wind_time_series_component
-from .env_time_series import environmental_time_series_component
-from .time_selection import time_selection_component
-from .corre_plot import correlation_plot_component
-from .scatter_plot import scatter_plot_component
-from .explained_var_plot import pca_explained_variance_component
-from .pca_biplot import pca_biplot_components
-from .ml import (
-    roc_curve_plot_component,
-    pr_curve_plot_component,
-    predicted_plot_components,
-)
-from .wind_3d import wind_3d_component
-
-__all__ = [
-    "wind_rose_component",
-    "wind_time_series_component",
-    "environmental_time_series_component",
-    "time_selection_component",
-    "correlation_plot_component",
-    "scatter_plot_component",
-    "pca_explained_variance_component",
-    "pca_biplot_components",
-    "roc_curve_plot_component",
-    "pr_curve_plot_component",
-    "predicted_plot_components",
-    "wind_3d_component",
-]
+import importlib
+
+# Component registry: name -> defining module. Modules are imported on first
+# attribute access, so sections that are never shown (and their heavy
+# dependencies such as scikit-learn) are never imported.
+_COMPONENTS = {
+    "wind_rose_component": ".wind_rose",
+    "wind_time_series_component": ".wind_time_series",
+    "environmental_time_series_component": ".env_time_series",
+    "time_selection_component": ".time_selection",
+    "refine_data_component": ".time_selection",
+    "correlation_plot_component": ".corre_plot",
+    "scatter_plot_component": ".scatter_plot",
+    "pca_explained_variance_component": ".explained_var_plot",
+    "pca_biplot_components": ".pca_biplot",
+    "roc_curve_plot_component": ".ml",
+    "pr_curve_plot_component": ".ml",
+    "predicted_plot_components": ".ml",
+    "wind_3d_component": ".wind_3d",
+}
+
+
+def __getattr__(name):
+    module_name = _COMPONENTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    component = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = component  # Later lookups skip __getattr__
+    return component
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_COMPONENTS))
+
+
+__all__ = list(_COMPONENTS)
@@ -1,8 +1,10 @@
 import streamlit as st
 import plotly.express as px
 from web_components.utils import get_analysis_data
+from web_components.perf import timed_component
 
 
+@timed_component("correlation")
 def correlation_plot_component():
     try:
         # Load correlation data from MongoDB
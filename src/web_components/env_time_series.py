@@ -2,6 +2,12 @@ import streamlit as st
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
+from processing import downsample, point_budget
+from web_components.figure_cache import cached_figure
+from web_components.perf import timed_component
+
+# Plot width in pixels, shared by the layout and the point budget
+ENV_PLOT_WIDTH_PX = 520
 
 
 def celsius_to_fahrenheit(temp_c):
@@ -18,32 +24,18 @@ def calculate_dew_point(temp, rel_humidity):
 
 
 @st.fragment
+@timed_component("env_time_series")
 def environmental_time_series_component():
     # Check if filtered_df exists and is not None
     if "filtered_df" not in st.session_state or st.session_state.filtered_df is None:
         st.warning("Please select a date range first.")
         return
 
-    # Make an explicit copy of the filtered DataFrame
-    df = st.session_state.filtered_df.copy()
-
-    # Calculate dew point in Celsius
-    df.loc[:, "DewPoint_C"] = calculate_dew_point(df["Temp_C"], df["Hum_RH"])
-
-    # Convert temperatures to Fahrenheit
-    df.loc[:, "Temp_F"] = celsius_to_fahrenheit(df["Temp_C"])
-    df.loc[:, "SonicTemp_F"] = celsius_to_fahrenheit(df["SonicTemp_C"])
-    df.loc[:, "DewPoint_F"] = celsius_to_fahrenheit(df["DewPoint_C"])
-
-    # Updated default variables to include humidity
-    default_vars = ["SonicTemp_F", "Temp_F", "DewPoint_F", "Hum_RH"]
-    fig = create_env_plot(df, default_vars)
-
-    # Display the plot
+    # Display the plot above the selector
     plot_placeholder = st.empty()
-    plot_placeholder.plotly_chart(fig, use_container_width=True)
 
     # UI elements below the plot
+    default_vars = ["SonicTemp_F", "Temp_F", "DewPoint_F", "Hum_RH"]
     env_options = ["SonicTemp_F", "Temp_F", "DewPoint_F", "Hum_RH", "Press_Pa"]
     selected_vars = st.multiselect(
         "Select environmental variables to display:",
@@ -51,15 +43,27 @@ def environmental_time_series_component():
         default=default_vars,
     )
 
-    # If selections change, update the plot
-    if selected_vars != default_vars:
-        updated_fig = create_env_plot(df, selected_vars)
-        plot_placeholder.plotly_chart(updated_fig, use_container_width=True)
+    def build():
+        # Make an explicit copy of the filtered DataFrame
+        df = st.session_state.filtered_df.copy()
+
+        # Calculate dew point in Celsius
+        df.loc[:, "DewPoint_C"] = calculate_dew_point(df["Temp_C"], df["Hum_RH"])
+
+        # Convert temperatures to Fahrenheit
+        df.loc[:, "Temp_F"] = celsius_to_fahrenheit(df["Temp_C"])
+        df.loc[:, "SonicTemp_F"] = celsius_to_fahrenheit(df["SonicTemp_C"])
+        df.loc[:, "DewPoint_F"] = celsius_to_fahrenheit(df["DewPoint_C"])
+
+        return create_env_plot(df, selected_vars)
+
+    fig = cached_figure("env_time_series", tuple(selected_vars), build)
+    plot_placeholder.plotly_chart(fig, use_container_width=True)
 
 
 def create_env_plot(df, selected_vars):
-    # Downsample data more efficiently - using iloc
-    df_plot = df.iloc[::10]
+    # Fixed per-trace point budget derived from the chart width
+    n_points = point_budget(ENV_PLOT_WIDTH_PX)
 
     # Define color scheme for each variable
     color_scheme = {
@@ -89,9 +93,10 @@ def create_env_plot(df, selected_vars):
     fig = make_subplots(specs=[[{"secondary_y": True}]])
 
     for var in selected_vars:
+        x_plot, y_plot = downsample(df["tNow"], df[var], n_points, mode="lttb")
         trace_data = {
-            "x": df_plot["tNow"],
-            "y": df_plot[var],
+            "x": x_plot,
+            "y": y_plot,
             "name": var,
             "mode": "lines",  # Remove markers for better performance
             "line": dict(
@@ -124,7 +129,7 @@ def create_env_plot(df, selected_vars):
             side="right",
             range=[0, 100],
         ),
-        width=520,
+        width=ENV_PLOT_WIDTH_PX,
         height=520,
         legend=dict(orientation="h", yanchor="bottom", y=-0.4, xanchor="center", x=0.5),
         hovermode="x unified",
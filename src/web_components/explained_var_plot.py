@@ -2,8 +2,10 @@ import streamlit as st
 import plotly.express as px
 import pandas as pd
 from web_components.utils import get_analysis_data
+from web_components.perf import timed_component
 
 
+@timed_component("pca_explained_variance")
 def pca_explained_variance_component():
     try:
         # Load PCA data from MongoDB
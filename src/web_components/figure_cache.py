@@ -0,0 +1,116 @@
+import threading
+import time
+from collections import OrderedDict
+
+import plotly.io as pio
+import streamlit as st
+from web_components.perf import add_bytes, cache_call, cache_miss, timed
+from web_components.utils import fetch_dataset_version
+
+# Bounds of the process-wide figure cache (serialized JSON size)
+FIGURE_CACHE_MAX_ENTRIES = 128
+FIGURE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Entries expire like the cached queries they are built from, so data
+# changed without a new dataset version is picked up eventually
+FIGURE_CACHE_TTL_SECONDS = 1800
+
+
+class FigureCache:
+    """Thread-safe LRU of serialized Plotly figures bounded by count and bytes.
+
+    Entries older than ``ttl`` seconds count as misses.
+    """
+
+    def __init__(self, max_entries, max_bytes, ttl):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.ttl:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, figure_json):
+        size = len(figure_json)
+        if size > self.max_bytes:
+            return
+        with self.lock:
+            if key in self.entries:
+                self.total_bytes -= len(self.entries.pop(key)[1])
+            self.entries[key] = (time.monotonic(), figure_json)
+            self.total_bytes += size
+            while (
+                len(self.entries) > self.max_entries
+                or self.total_bytes > self.max_bytes
+            ):
+                _, (_, evicted) = self.entries.popitem(last=False)
+                self.total_bytes -= len(evicted)
+
+
+@st.cache_resource
+def get_figure_cache():
+    """Figure cache shared by all sessions of this server process."""
+    return FigureCache(
+        FIGURE_CACHE_MAX_ENTRIES, FIGURE_CACHE_MAX_BYTES, FIGURE_CACHE_TTL_SECONDS
+    )
+
+
+def data_version(df):
+    """Cheap identity of a time-sorted frame.
+
+    Row count and first/last tNow, plus the dataset version so a re-upload
+    with the same bounds and row count still rebuilds the figures.
+    """
+    if df is None or df.empty:
+        return (0, None, None, None)
+    times = df["tNow"]
+    return (len(df), str(times.iloc[0]), str(times.iloc[-1]), fetch_dataset_version())
+
+
+def cached_figure(component, key, build):
+    """Return the figure for (component, data version, key), building it once.
+
+    The data version of the session's filtered frame is added to the key, so
+    a new selection, live rows or the switch from coarse to raw data rebuild
+    the figure while reruns with the same inputs load the stored JSON.
+
+    Args:
+        component: Name of the calling component
+        key: Hashable widget state and any other inputs of the figure
+        build: Zero-argument callable returning a Plotly figure, or None
+            when there is nothing to plot (not cached)
+    """
+    cache_key = (
+        component,
+        data_version(st.session_state.get("filtered_df")),
+        st.session_state.get("selected_dates"),
+        key,
+    )
+    cache = get_figure_cache()
+    cache_call("figure_cache")
+
+    figure_json = cache.get(cache_key)
+    if figure_json is not None:
+        with timed(f"figure load: {component}"):
+            return pio.from_json(figure_json)
+
+    cache_miss("figure_cache")
+    with timed(f"figure build: {component}"):
+        fig = build()
+    if fig is not None:
+        figure_json = fig.to_json()
+        add_bytes("figure JSON", len(figure_json))
+        cache.put(cache_key, figure_json)
+    return fig
@@ -2,6 +2,7 @@ import streamlit as st
 import plotly.graph_objects as go
 from web_components.utils import get_analysis_data
 import pandas as pd
+from web_components.perf import timed_component
 
 
 def load_plot_data():
@@ -12,10 +13,15 @@ def load_plot_data():
     return plot_data
 
 
+@timed_component("roc_curve")
 def roc_curve_plot_component():
     """ROC Curve Component"""
     # Load saved data
-    plot_data = load_plot_data()
+    try:
+        plot_data = load_plot_data()
+    except FileNotFoundError as e:
+        st.error(f"{e}. Please run the analysis first.")
+        return
 
     # Create ROC curve plot
     fig = go.Figure()
@@ -52,10 +58,15 @@ def roc_curve_plot_component():
     st.plotly_chart(fig, use_container_width=True)
 
 
+@timed_component("pr_curve")
 def pr_curve_plot_component():
     """PR Curve Component"""
     # Load saved data
-    plot_data = load_plot_data()
+    try:
+        plot_data = load_plot_data()
+    except FileNotFoundError as e:
+        st.error(f"{e}. Please run the analysis first.")
+        return
 
     # Create PR curve plot
     fig = go.Figure()
@@ -90,6 +101,7 @@ def pr_curve_plot_component():
     st.plotly_chart(fig, use_container_width=True)
 
 
+@timed_component("predictions")
 def predicted_plot_components():
     """Predictions Plot Component"""
     try:
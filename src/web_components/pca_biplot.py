@@ -1,11 +1,24 @@
 import streamlit as st
 import plotly.graph_objects as go
 import numpy as np
-from sklearn.preprocessing import StandardScaler
-from sklearn.decomposition import PCA
-from web_components.utils import get_analysis_data
+from processing.pca import (
+    fit_incremental_pca,
+    project_scores,
+    standardize_params,
+    subsample_indices,
+)
+from web_components.figure_cache import cached_figure
+from web_components.utils import get_analysis_data, get_analysis_version
+from web_components.perf import timed_component
 
+# Most points drawn in the 3D biplot; scores are projected for these only
+BIPLOT_MAX_POINTS = 5000
 
+# The biplot draws three components, so a refit needs at least as many rows
+BIPLOT_COMPONENTS = 3
+
+
+@timed_component("pca_biplot")
 def pca_biplot_components():
     try:
         # Load PCA data from MongoDB
@@ -30,93 +43,127 @@ def pca_biplot_components():
             st.error(f"Missing required features: {missing_features}")
             return
 
-        pc_coordinates = np.array(biplot_data["pc_coordinates"])
-        explained_variance_3d = biplot_data["explained_variance_3d"]
-
-        # Create the 3D scatter plot
-        fig = go.Figure()
+        refit = st.toggle(
+            "Refit PCA on the selected range",
+            key="pca_refit",
+            help="Fit scaler and PCA incrementally over the selection instead "
+            "of projecting with the stored model.",
+        )
 
-        # Get PC scores from the data
-        df = st.session_state.filtered_df
+        fig = cached_figure(
+            "pca_biplot",
+            (get_analysis_version("pca_results", "pca_data"), refit),
+            lambda: create_pca_biplot(st.session_state.filtered_df, biplot_data, refit),
+        )
+        if fig is None:
+            st.error("No valid data points after removing missing values.")
+            return
 
-        # Handle missing values
-        df_clean = df[features].copy()
+        # Display the plot
+        st.plotly_chart(fig, use_container_width=True)
 
-        # Option 1: Drop rows with any missing values
-        df_clean = df_clean.dropna()
+    except ValueError as e:
+        st.warning(str(e))
+    except Exception as e:
+        st.error(f"Error loading PCA biplot: {str(e)}")
 
-        # Option 2: Or impute missing values with mean (uncomment if you prefer this approach)
-        # df_clean = df_clean.fillna(df_clean.mean())
 
-        if len(df_clean) == 0:
-            st.error("No valid data points after removing missing values.")
-            return
+def create_pca_biplot(df, biplot_data, refit=False):
+    """3D biplot of PC scores for a subsample of df plus the loading vectors.
 
-        # Standardize the features
-        scaler = StandardScaler()
-        scaled_features = scaler.fit_transform(df_clean)
+    Scores come from the stored scaler and components, or from an
+    incremental refit over all of df when ``refit`` is set. Raises
+    ValueError when there are too few complete rows to refit.
+    """
+    features = biplot_data["features"]
 
-        # Perform PCA to get scores
-        pca = PCA()
-        pc_scores = pca.fit_transform(scaled_features)
+    # Handle missing values: drop rows with any missing values
+    values = df[features].dropna().to_numpy(dtype=np.float64)
+    if len(values) == 0:
+        return None
 
-        # Determine dominant PC for each point
-        pc_abs = np.abs(pc_scores[:, :3])
-        dominant_pc = np.argmax(pc_abs, axis=1)
-        colors = [
+    if refit:
+        if len(values) < BIPLOT_COMPONENTS:
+            raise ValueError(
+                f"Refitting PCA needs at least {BIPLOT_COMPONENTS} rows without "
+                f"missing values; the selection has {len(values)}. Select a "
+                "longer range or use the stored model."
+            )
+        mean, scale, pc_coordinates, explained_variance_3d = fit_incremental_pca(
+            values, n_components=BIPLOT_COMPONENTS
+        )
+    else:
+        pc_coordinates = np.array(biplot_data["pc_coordinates"])
+        explained_variance_3d = biplot_data["explained_variance_3d"]
+        if "scaler_mean" in biplot_data:
+            mean = np.array(biplot_data["scaler_mean"])
+            scale = np.array(biplot_data["scaler_scale"])
+        else:
+            # Results stored before the scaler was saved: standardize locally
+            mean, scale = standardize_params(values)
+
+    # Project only the points that are drawn
+    sample = values[subsample_indices(len(values), BIPLOT_MAX_POINTS)]
+    pc_scores = project_scores(sample, mean, scale, pc_coordinates)
+
+    # Create the 3D scatter plot
+    fig = go.Figure()
+
+    # Determine dominant PC for each point
+    pc_abs = np.abs(pc_scores[:, :3])
+    dominant_pc = np.argmax(pc_abs, axis=1)
+    colors = np.array(
+        [
             "#1f77b4",
             "#ff7f0e",
             "#2ca02c",
-        ]  # Blue, Orange, Green for PC1, PC2, PC3
-        point_colors = [colors[pc] for pc in dominant_pc]
+        ]
+    )  # Blue, Orange, Green for PC1, PC2, PC3
+    point_colors = colors[dominant_pc]
+
+    # Add scatter points with color based on dominant PC
+    fig.add_trace(
+        go.Scatter3d(
+            x=pc_scores[:, 0],
+            y=pc_scores[:, 1],
+            z=pc_scores[:, 2],
+            mode="markers",
+            marker=dict(size=4, opacity=0.6, color=point_colors),
+            hovertemplate=(
+                "PC1: %{x:.2f}<br>"
+                + "PC2: %{y:.2f}<br>"
+                + "PC3: %{z:.2f}<extra></extra>"
+            ),
+            showlegend=False,
+        )
+    )
 
-        # Add scatter points with color based on dominant PC
+    # Add loading vectors
+    scaling_factor = 3
+    for i, feature in enumerate(features):
         fig.add_trace(
             go.Scatter3d(
-                x=pc_scores[:, 0],
-                y=pc_scores[:, 1],
-                z=pc_scores[:, 2],
-                mode="markers",
-                marker=dict(size=4, opacity=0.6, color=point_colors),
-                hovertemplate=(
-                    "PC1: %{x:.2f}<br>"
-                    + "PC2: %{y:.2f}<br>"
-                    + "PC3: %{z:.2f}<extra></extra>"
-                ),
+                x=[0, pc_coordinates[i, 0] * scaling_factor],
+                y=[0, pc_coordinates[i, 1] * scaling_factor],
+                z=[0, pc_coordinates[i, 2] * scaling_factor],
+                mode="lines+text",
+                line=dict(color="red", width=3),
+                text=["", feature],
+                textposition="top center",
+                textfont=dict(color="red", size=12),
                 showlegend=False,
+                hoverinfo="none",
             )
         )
 
-        # Add loading vectors
-        scaling_factor = 3
-        for i, feature in enumerate(features):
-            fig.add_trace(
-                go.Scatter3d(
-                    x=[0, pc_coordinates[i, 0] * scaling_factor],
-                    y=[0, pc_coordinates[i, 1] * scaling_factor],
-                    z=[0, pc_coordinates[i, 2] * scaling_factor],
-                    mode="lines+text",
-                    line=dict(color="red", width=3),
-                    text=["", feature],
-                    textposition="top center",
-                    textfont=dict(color="red", size=12),
-                    showlegend=False,
-                    hoverinfo="none",
-                )
-            )
-
-        # Update layout
-        fig.update_layout(
-            scene=dict(
-                xaxis_title=f"PC1 ({explained_variance_3d[0]:.1f}%)",
-                yaxis_title=f"PC2 ({explained_variance_3d[1]:.1f}%)",
-                zaxis_title=f"PC3 ({explained_variance_3d[2]:.1f}%)",
-            ),
-            margin=dict(l=0, r=0, b=0, t=0),
-        )
-
-        # Display the plot
-        st.plotly_chart(fig, use_container_width=True)
-
-    except Exception as e:
-        st.error(f"Error loading PCA biplot: {str(e)}")
+    # Update layout
+    fig.update_layout(
+        scene=dict(
+            xaxis_title=f"PC1 ({explained_variance_3d[0]:.1f}%)",
+            yaxis_title=f"PC2 ({explained_variance_3d[1]:.1f}%)",
+            zaxis_title=f"PC3 ({explained_variance_3d[2]:.1f}%)",
+        ),
+        margin=dict(l=0, r=0, b=0, t=0),
+    )
+
+    return fig
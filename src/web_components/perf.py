@@ -0,0 +1,268 @@
+import functools
+import json
+import os
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from processing.schema import memory_report
+
+# Number of reruns (full and fragment) kept in the rolling window
+PERF_HISTORY_SIZE = 50
+
+
+def perf_enabled():
+    """Instrumentation is opt-in via the ?debug=1 query parameter."""
+    return st.query_params.get("debug", "").lower() in ("1", "true", "perf")
+
+
+def _current_record():
+    history = st.session_state.get("perf_history")
+    return history[-1] if history else None
+
+
+def _fragment_rerun():
+    """Whether this rerun only runs fragments, e.g. after a widget inside one."""
+    ctx = get_script_run_ctx()
+    return bool(ctx and ctx.fragment_ids_this_run)
+
+
+def start_perf_run():
+    """Open a timing record for this rerun; call first thing in main()."""
+    if perf_enabled():
+        _open_record("page")
+
+
+def _open_record(scope):
+    if "perf_history" not in st.session_state:
+        st.session_state.perf_history = deque(maxlen=PERF_HISTORY_SIZE)
+        st.session_state.perf_run = 0
+
+    st.session_state.perf_run += 1
+    st.session_state.perf_started = time.perf_counter()
+    st.session_state.perf_history.append(
+        {
+            "run": st.session_state.perf_run,
+            "scope": scope,
+            "started": datetime.now().isoformat(timespec="seconds"),
+            "total_s": None,
+            "stages": {},
+            "calls": {},
+            "cache": {},
+            "bytes": {},
+            "memory": {},
+        }
+    )
+
+
+@contextmanager
+def timed(stage):
+    """Add the wall time of the block to ``stage`` in this rerun's record."""
+    record = _current_record() if perf_enabled() else None
+    if record is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        record["stages"][stage] = record["stages"].get(stage, 0.0) + elapsed
+        record["calls"][stage] = record["calls"].get(stage, 0) + 1
+
+
+def timed_component(name):
+    """Decorator timing a dashboard component (place under @st.fragment).
+
+    When a fragment reruns on its own, main() does not run, so the component
+    opens and closes its own record (scope "fragment: <name>") instead of
+    adding to the last page run.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # Components nested in a fragment rerun add to its record
+            if not (perf_enabled() and _fragment_rerun()) or st.session_state.get(
+                "perf_fragment_open"
+            ):
+                with timed(f"component: {name}"):
+                    return func(*args, **kwargs)
+
+            _open_record(f"fragment: {name}")
+            record = _current_record()
+            st.session_state.perf_fragment_open = True
+            try:
+                with timed(f"component: {name}"):
+                    return func(*args, **kwargs)
+            finally:
+                st.session_state.perf_fragment_open = False
+                _finish_run(record)
+
+        return wrapper
+
+    return decorator
+
+
+def _count_cache(name, field):
+    record = _current_record() if perf_enabled() else None
+    if record is not None:
+        stats = record["cache"].setdefault(name, {"calls": 0, "misses": 0})
+        stats[field] += 1
+
+
+def cache_call(name):
+    """Count a call to a cached function (from the caller)."""
+    _count_cache(name, "calls")
+
+
+def cache_miss(name):
+    """Count a miss (from inside the cached function's body)."""
+    _count_cache(name, "misses")
+
+
+def add_bytes(name, size):
+    """Add ``size`` bytes to the ``name`` counter of this rerun."""
+    record = _current_record() if perf_enabled() else None
+    if record is not None:
+        record["bytes"][name] = record["bytes"].get(name, 0) + int(size)
+
+
+def process_rss_bytes():
+    """Resident memory of this process, or None where /proc is unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _finish_run(record):
+    record["total_s"] = time.perf_counter() - st.session_state.perf_started
+
+    memory = {}
+    for key in ("full_df", "filtered_df"):
+        df = st.session_state.get(key)
+        if isinstance(df, pd.DataFrame):
+            memory[key] = int(df.memory_usage(deep=True).sum())
+    memory["process_rss"] = process_rss_bytes()
+    record["memory"] = memory
+
+
+def _stage_table(history):
+    rows = {}
+    for record in history:
+        for stage, seconds in record["stages"].items():
+            rows.setdefault(stage, []).append(seconds * 1000)
+    table = pd.DataFrame(
+        [
+            {
+                "stage": stage,
+                "runs": len(values),
+                "last_ms": values[-1],
+                "mean_ms": sum(values) / len(values),
+                "p95_ms": pd.Series(values).quantile(0.95),
+                "max_ms": max(values),
+            }
+            for stage, values in rows.items()
+        ]
+    )
+    if not table.empty:
+        table = table.sort_values("mean_ms", ascending=False)
+    return table
+
+
+def _cache_table(history):
+    totals = {}
+    for record in history:
+        for name, stats in record["cache"].items():
+            total = totals.setdefault(name, {"calls": 0, "misses": 0})
+            total["calls"] += stats["calls"]
+            total["misses"] += stats["misses"]
+    return pd.DataFrame(
+        [
+            {
+                "cache": name,
+                "calls": stats["calls"],
+                "misses": stats["misses"],
+                "hit_rate": (
+                    1 - stats["misses"] / stats["calls"] if stats["calls"] else None
+                ),
+            }
+            for name, stats in totals.items()
+        ]
+    )
+
+
+def perf_panel_component():
+    """Show the rolling timing window; call last in main()."""
+    record = _current_record() if perf_enabled() else None
+    if record is None:
+        return
+
+    _finish_run(record)
+    history = list(st.session_state.perf_history)
+
+    with st.expander("⏱️ Performance (debug)", expanded=True):
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Last rerun", f"{record['total_s'] * 1000:,.0f} ms")
+        # Page reruns only; reruns cut short by st.rerun() have no total
+        totals = [
+            r["total_s"]
+            for r in history
+            if r.get("scope") == "page" and r["total_s"] is not None
+        ]
+        col2.metric("Mean rerun", f"{sum(totals) / len(totals) * 1000:,.0f} ms")
+        rss = record["memory"].get("process_rss")
+        col3.metric(
+            "Process memory", f"{rss / 2**20:,.0f} MB" if rss is not None else "n/a"
+        )
+
+        fragments = sum(r.get("scope") != "page" for r in history)
+        st.markdown(
+            f"**Stages** (last {len(history)} reruns, {fragments} of them "
+            "fragment reruns)"
+        )
+        st.dataframe(_stage_table(history), hide_index=True, use_container_width=True)
+
+        st.markdown("**Caches**")
+        st.dataframe(_cache_table(history), hide_index=True, use_container_width=True)
+
+        st.markdown("**Bytes and memory** (last rerun)")
+        st.dataframe(
+            pd.DataFrame(
+                [{"counter": k, "bytes": v} for k, v in record["bytes"].items()]
+                + [
+                    {"counter": f"memory: {k}", "bytes": v}
+                    for k, v in record["memory"].items()
+                ]
+            ),
+            hide_index=True,
+            use_container_width=True,
+        )
+
+        # Per-column footprint of the largest loaded frame vs 8 bytes/value
+        frame_key = "full_df" if "full_df" in st.session_state else "filtered_df"
+        frame = st.session_state.get(frame_key)
+        if isinstance(frame, pd.DataFrame) and not frame.empty:
+            report = memory_report(frame)
+            used, wide = report["bytes"].sum(), report["wide_bytes"].sum()
+            st.markdown(
+                f"**Frame memory** ({frame_key}): {used / 2**20:,.1f} MB, "
+                f"{1 - used / wide:.0%} less than float64/int64 columns "
+                f"({wide / 2**20:,.1f} MB)"
+            )
+            st.dataframe(report, hide_index=True, use_container_width=True)
+
+        st.download_button(
+            "Download JSON log",
+            data=json.dumps(history, indent=2, default=str),
+            file_name=f"dashboard_perf_{datetime.now():%Y%m%d_%H%M%S}.json",
+            mime="application/json",
+        )
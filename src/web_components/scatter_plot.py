@@ -1,8 +1,28 @@
 import streamlit as st
 import plotly.express as px
+import plotly.graph_objects as go
+from processing import binned_mean
+from web_components.figure_cache import cached_figure
+from web_components.perf import timed_component
+
+# Above this many points the scatter is drawn with WebGL instead of SVG
+WEBGL_THRESHOLD = 10_000
+# Above this many points "Auto" mode draws a binned density image instead
+DENSITY_THRESHOLD = 200_000
+# Cells per axis in density mode
+DENSITY_BINS = 200
+
+PLOT_MODES = ["Auto", "Points", "Density"]
+
+AXIS_LABELS = {
+    "Temp_C": "Temperature (°C)",
+    "2dSpeed_m_s": "Wind Speed (m/s)",
+    "Hum_RH": "Relative Humidity (%)",
+}
 
 
 @st.fragment
+@timed_component("scatter_plot")
 def scatter_plot_component():
     # Check if filtered_df exists in session state
     if "filtered_df" not in st.session_state:
@@ -33,41 +53,9 @@ def scatter_plot_component():
         "SonicTemp_C",
     ]
 
-    # Create plot placeholder
+    # Create plot placeholder so the chart stays above the selectboxes
     plot_placeholder = st.empty()
 
-    # Create initial scatter plot
-    fig = px.scatter(
-        df,
-        x="Temp_C",
-        y="2dSpeed_m_s",
-        color="Hum_RH",
-        labels={
-            "Temp_C": "Temperature (°C)",
-            "2dSpeed_m_s": "Wind Speed (m/s)",
-            "Hum_RH": "Relative Humidity (%)",
-        },
-        color_continuous_scale="viridis",
-        opacity=0.5,
-    )
-
-    # Update layout
-    fig.update_layout(
-        width=600,
-        height=680,
-        title={
-            "text": "Wind Speed vs Temperature (colored by Relative Humidity)",
-            "x": 0.5,
-            "xanchor": "center",
-            "yanchor": "top",
-        },
-        hovermode="closest",
-        coloraxis_colorbar_title="Relative Humidity (%)",
-    )
-
-    # Display the plot in the placeholder
-    plot_placeholder.plotly_chart(fig, use_container_width=True)
-
     # Create three columns for selectboxes below the plot
     col1, col2, col3 = st.columns(3)
 
@@ -92,29 +80,83 @@ def scatter_plot_component():
             index=numeric_columns.index("Hum_RH"),
         )
 
-    # Update plot if selections change
-    if x_var != "Temp_C" or y_var != "2dSpeed_m_s" or color_var != "Hum_RH":
-        updated_fig = px.scatter(
+    plot_mode = st.radio(
+        "Plot mode:",
+        options=PLOT_MODES,
+        horizontal=True,
+        help=f"Auto draws a density image above {DENSITY_THRESHOLD:,} points.",
+    )
+
+    # Build the figure once for the current selection
+    fig = cached_figure(
+        "scatter_plot",
+        (x_var, y_var, color_var, plot_mode),
+        lambda: create_scatter_plot(df, x_var, y_var, color_var, plot_mode),
+    )
+    plot_placeholder.plotly_chart(fig, use_container_width=True)
+
+
+def create_scatter_plot(df, x_var, y_var, color_var, plot_mode="Auto"):
+    """Scatter of y against x coloured by a third variable, sized for len(df)."""
+    x_label = AXIS_LABELS.get(x_var, x_var)
+    y_label = AXIS_LABELS.get(y_var, y_var)
+    color_label = AXIS_LABELS.get(color_var, color_var)
+
+    use_density = plot_mode == "Density" or (
+        plot_mode == "Auto" and len(df) > DENSITY_THRESHOLD
+    )
+
+    if use_density:
+        # Mean colour variable per cell; hover shows how many points it holds
+        x_centres, y_centres, means, counts = binned_mean(
+            df[x_var], df[y_var], df[color_var], bins=DENSITY_BINS
+        )
+        fig = go.Figure(
+            go.Heatmap(
+                x=x_centres,
+                y=y_centres,
+                z=means,
+                customdata=counts,
+                colorscale="viridis",
+                colorbar=dict(title=color_label),
+                hovertemplate=(
+                    f"{x_label}: %{{x:.2f}}<br>"
+                    f"{y_label}: %{{y:.2f}}<br>"
+                    f"{color_label} (mean): %{{z:.2f}}<br>"
+                    "Points: %{customdata:,}<extra></extra>"
+                ),
+            )
+        )
+        fig.update_layout(xaxis_title=x_label, yaxis_title=y_label)
+    else:
+        fig = px.scatter(
             df,
             x=x_var,
             y=y_var,
             color=color_var,
-            labels={x_var: f"{x_var}", y_var: f"{y_var}", color_var: f"{color_var}"},
+            labels={x_var: x_label, y_var: y_label, color_var: color_label},
             color_continuous_scale="viridis",
             opacity=0.5,
+            render_mode="webgl" if len(df) > WEBGL_THRESHOLD else "svg",
         )
+        fig.update_layout(coloraxis_colorbar_title=color_label)
 
-        updated_fig.update_layout(
-            width=600,
-            height=680,
-            title={
-                "text": f"{y_var} vs {x_var} (colored by {color_var})",
-                "x": 0.5,
-                "xanchor": "center",
-                "yanchor": "top",
-            },
-            hovermode="closest",
-            coloraxis_colorbar_title=f"{color_var}",
-        )
+    if (x_var, y_var, color_var) == ("Temp_C", "2dSpeed_m_s", "Hum_RH"):
+        title = "Wind Speed vs Temperature (colored by Relative Humidity)"
+    else:
+        title = f"{y_var} vs {x_var} (colored by {color_var})"
+
+    # Update layout
+    fig.update_layout(
+        width=600,
+        height=680,
+        title={
+            "text": title,
+            "x": 0.5,
+            "xanchor": "center",
+            "yanchor": "top",
+        },
+        hovermode="closest",
+    )
 
-        plot_placeholder.plotly_chart(updated_fig, use_container_width=True)
+    return fig
@@ -1,17 +1,92 @@
 import streamlit as st
-from web_components.utils import load_data, filter_data, get_date_range
-from datetime import timedelta
+from web_components.utils import (
+    load_data,
+    load_coarse_data,
+    load_rollup_data,
+    filter_data,
+    get_date_range,
+    append_new_data,
+    select_resolution,
+    RAW_MAX_DAYS,
+)
+from datetime import datetime, timedelta
+from web_components.perf import timed_component
 
+# Polling intervals offered in live mode
+LIVE_INTERVALS = {
+    "10 seconds": timedelta(seconds=10),
+    "30 seconds": timedelta(seconds=30),
+    "1 minute": timedelta(minutes=1),
+    "5 minutes": timedelta(minutes=5),
+}
 
-def time_selection_component():
-    # Always try to load data and date range if not in session state
+
+def live_refresh_component(interval):
+    """Poll for new readings every `interval` and rerun the app when some arrive."""
+
+    @st.fragment(run_every=interval)
+    def poll():
+        # A changed selection is reloaded by refine_data_component first
+        start_date, end_date = st.session_state.selected_dates
+        added = append_new_data() if raw_data_covers(start_date, end_date) else 0
+        if added:
+            # Charts read the session data on the full rerun
+            st.rerun()
+
+        latest = st.session_state.date_range["max_date"].strftime("%m/%d/%Y %H:%M:%S")
+        st.caption(
+            f"🔴 Live: checked {datetime.now().strftime('%H:%M:%S')}, "
+            f"latest reading {latest}"
+        )
+
+    poll()
+
+
+def live_available(start_date, end_date, resolution):
+    """Whether live mode can follow a selection.
+
+    Only raw selections that end on the newest day are extended with new
+    readings; others would fetch everything since their end, or have no raw
+    frame to append to.
+    """
+    latest_day = st.session_state.date_range["max_date"].date()
+    return resolution == "raw" and end_date >= latest_day
+
+
+def raw_data_covers(start_date, end_date):
+    """Whether the loaded raw readings include the whole selection."""
     if "full_df" not in st.session_state:
-        df = load_data()
-        if df.empty:
-            st.error("Failed to load data. Please check the database connection.")
-            return st.stop()
-        st.session_state.full_df = df
+        return False
+    loaded_start, loaded_end = st.session_state.get("loaded_dates", (None, None))
+    return (loaded_start is None or loaded_start <= start_date) and (
+        loaded_end is None or end_date <= loaded_end
+    )
+
+
+def refine_data_component():
+    """Load full-resolution data once the coarse charts are drawn, then rerun.
+
+    Call at the end of the page so the preview is already on screen while
+    the raw readings download. Only short selections use raw readings.
+    """
+    if "selected_dates" not in st.session_state:
+        return
+    start_date, end_date = st.session_state.selected_dates
+    if select_resolution(start_date, end_date) != "raw" or raw_data_covers(
+        start_date, end_date
+    ):
+        return
+
+    df = load_data(start_date, end_date)
+    if df.empty:
+        st.error("Failed to load data. Please check the database connection.")
+        return
+    st.rerun()
+
 
+@timed_component("time_selection")
+def time_selection_component():
+    # The date range is cheap; raw data is loaded by refine_data_component
     if "date_range" not in st.session_state:
         date_range = get_date_range()
         if date_range is None:
@@ -50,14 +125,35 @@ def time_selection_component():
             st.error("Error: Start date must be before or equal to end date.")
             return st.stop()
 
-        # Always filter data when dates are selected
-        filtered_df = filter_data(st.session_state.full_df, start_date, end_date)
+        # Short selections use raw readings (previewed from aggregates until
+        # they have loaded); longer ones read the minute or hour rollups
+        resolution = select_resolution(start_date, end_date)
+        if resolution != "raw":
+            filtered_df = load_rollup_data(start_date, end_date, resolution)
+            if filtered_df.empty:
+                # Rollups not built for this range yet, bucket on the server
+                filtered_df = load_coarse_data(start_date, end_date)
+        elif raw_data_covers(start_date, end_date):
+            filtered_df = filter_data(st.session_state.full_df, start_date, end_date)
+        else:
+            filtered_df = load_coarse_data(start_date, end_date)
+            if filtered_df.empty:
+                # No preview available, fall back to loading the raw data now
+                df = load_data(start_date, end_date)
+                if df.empty:
+                    st.error(
+                        "Failed to load data. Please check the database connection."
+                    )
+                    return st.stop()
+                filtered_df = filter_data(df, start_date, end_date)
+
         if filtered_df.empty:
             st.error("No data available for the selected date range.")
             return st.stop()
 
-        # Store filtered DataFrame in session state
+        # Store filtered DataFrame and the selection in session state
         st.session_state.filtered_df = filtered_df
+        st.session_state.selected_dates = (start_date, end_date)
 
     except Exception as e:
         st.error(f"Error with date selection: {str(e)}")
@@ -77,3 +173,31 @@ def time_selection_component():
             "%m/%d/%Y %H:%M:%S"
         )
         st.markdown(f"**Data Range**: {first_update} - {last_update}")
+
+    bucket = filtered_df.attrs.get("resolution")
+    if bucket and resolution == "raw":
+        st.caption(f"⏳ Showing {bucket} averages while full-resolution data loads...")
+    elif bucket:
+        st.caption(f"Showing {bucket} averages for this date range.")
+
+    # Opt-in live mode: only readings newer than any seen so far are fetched
+    can_follow = live_available(start_date, end_date, resolution)
+    col3, col4 = st.columns([1, 1])
+    with col3:
+        live_mode = st.toggle(
+            "Live updates",
+            value=False,
+            disabled=not can_follow,
+            help=None
+            if can_follow
+            else f"Select up to {RAW_MAX_DAYS} days ending on the latest day.",
+        )
+    if live_mode and can_follow:
+        with col4:
+            live_interval = st.selectbox(
+                "Refresh interval",
+                options=list(LIVE_INTERVALS.keys()),
+                index=1,
+                label_visibility="collapsed",
+            )
+        live_refresh_component(LIVE_INTERVALS[live_interval])
@@ -1,7 +1,43 @@
 import pandas as pd
+import numpy as np
 import streamlit as st
+import bson
 from pymongo import MongoClient
+from datetime import datetime, timedelta
 import time
+from processing.circular import circular_stats_from_sums
+from processing.schema import (
+    EXTREME_FIELDS,
+    SENSOR_FIELDS,
+    add_time_columns,
+    apply_weather_schema,
+)
+from web_components.perf import add_bytes, cache_call, cache_miss, timed
+from processing.wind_rose import (
+    FINE_DIR_BINS,
+    FINE_DIR_STEP,
+    FINE_SPEED_BINS,
+    FINE_SPEED_STEP_MPH,
+    MS_TO_MPH,
+    histogram_from_document,
+)
+
+# Longest selection (days) previewed with 10-minute buckets; longer ones use hours
+COARSE_MINUTE_MAX_DAYS = 7
+
+# Longest selections (days) drawn from raw readings and from the minute
+# rollups; longer ones use the hourly rollups. 4 days covers the default view.
+RAW_MAX_DAYS = 4
+MINUTE_ROLLUP_MAX_DAYS = 31
+
+# Rollups maintained by `meteorix upload`: bucket unit -> collection
+ROLLUP_COLLECTIONS = {"minute": "weather_1min", "hour": "weather_1h"}
+
+# Per-day fine wind histograms written by `meteorix upload`
+HISTOGRAM_COLLECTION = "wind_histograms"
+
+# Dataset bounds and per-day counts maintained by `meteorix upload`/`delete`
+METADATA_COLLECTION = "weather_metadata"
 
 
 @st.cache_resource
@@ -24,18 +60,44 @@ def init_connection():
     )
 
 
-def get_analysis_data(collection_name, data_type):
-    """Get analysis data from MongoDB collection by type."""
-    try:
-        client = init_connection()
-        db = client["weather_dashboard"]
-        collection = db[collection_name]
+def get_analysis_version(collection_name, data_type):
+    """Timestamp of a stored analysis result, read without its payload."""
+    client = init_connection()
+    collection = client["weather_dashboard"][collection_name]
+    document = collection.find_one({"type": data_type}, {"_id": 0, "timestamp": 1})
+    if document is None:
+        return None
+    # Documents without a timestamp still get a stable (if never refreshed) key
+    return document.get("timestamp", "unversioned")
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def fetch_analysis_data(collection_name, data_type, version):
+    """Fetch an analysis result payload; ``version`` only keys the cache."""
+    cache_miss("fetch_analysis_data")
+    client = init_connection()
+    collection = client["weather_dashboard"][collection_name]
+    document = collection.find_one({"type": data_type}, {"_id": 0, "data": 1})
+
+    if document and "data" in document:
+        return document["data"]
+    return document if document else None
+
 
-        document = collection.find_one({"type": data_type}, {"_id": 0, "data": 1})
+def get_analysis_data(collection_name, data_type):
+    """Get analysis data from MongoDB collection by type.
 
-        if document and "data" in document:
-            return document["data"]
-        return document if document else None
+    Only the result's timestamp is queried on each call; the payload is
+    downloaded again only after ``eda``/``ml`` has stored a new version.
+    """
+    try:
+        with timed("mongo: get_analysis_version"):
+            version = get_analysis_version(collection_name, data_type)
+        if version is None:
+            return None
+        cache_call("fetch_analysis_data")
+        with timed("mongo: fetch_analysis_data"):
+            return fetch_analysis_data(collection_name, data_type, version)
 
     except Exception as e:
         st.error(f"Error connecting to MongoDB: {e}")
@@ -49,25 +111,25 @@ def get_date_range():
         db = client["weather_dashboard"]
         collection = db["weather_data"]
 
-        # Get min and max dates using aggregation
-        pipeline = [
-            {
-                "$group": {
-                    "_id": None,
-                    "min_date": {"$min": "$tNow"},
-                    "max_date": {"$max": "$tNow"},
-                }
-            }
-        ]
-
-        result = list(collection.aggregate(pipeline))
-
-        if not result:
-            return None
+        # Bounds are read from the metadata summary; without one, both ends
+        # come straight off the tNow index
+        projection = {"_id": 0, "tNow": 1}
+        with timed("mongo: get_date_range"):
+            summary = db[METADATA_COLLECTION].find_one(
+                {"_id": "summary"}, {"min_date": 1, "max_date": 1}
+            )
+            if summary and summary.get("min_date") and summary.get("max_date"):
+                bounds = summary["min_date"], summary["max_date"]
+            else:
+                earliest = collection.find_one({}, projection, sort=[("tNow", 1)])
+                latest = collection.find_one({}, projection, sort=[("tNow", -1)])
+                if not earliest or not latest:
+                    return None
+                bounds = earliest["tNow"], latest["tNow"]
 
         date_range = {
-            "min_date": pd.to_datetime(result[0]["min_date"]),
-            "max_date": pd.to_datetime(result[0]["max_date"]),
+            "min_date": pd.to_datetime(bounds[0]),
+            "max_date": pd.to_datetime(bounds[1]),
         }
 
         # Store in session state
@@ -79,9 +141,333 @@ def get_date_range():
         return None
 
 
+@st.cache_data(ttl=60, show_spinner=False)
+def fetch_dataset_version():
+    """When `meteorix upload`/`delete` last changed the data, or None.
+
+    Read from the metadata summary; cached for a minute so it is cheap
+    enough to key every figure on.
+    """
+    try:
+        client = init_connection()
+        summary = client["weather_dashboard"][METADATA_COLLECTION].find_one(
+            {"_id": "summary"}, {"_id": 0, "updated": 1}
+        )
+        return str(summary["updated"]) if summary and "updated" in summary else None
+    except Exception:
+        return None
+
+
+def day_bounds(start_date, end_date):
+    """Convert an inclusive date selection into a [start, end) datetime range."""
+    start = datetime.combine(start_date, datetime.min.time())
+    end = datetime.combine(end_date, datetime.min.time()) + timedelta(days=1)
+    return start, end
+
+
+def aggregate_wind_histogram(collection, ranges):
+    """Bin raw readings onto the fine wind histogram grid inside MongoDB."""
+    fine_dir = {
+        "$min": [
+            {"$floor": {"$divide": [{"$mod": ["$Azimuth_deg", 360]}, FINE_DIR_STEP]}},
+            FINE_DIR_BINS - 1,
+        ]
+    }
+    fine_speed = {
+        "$min": [
+            {
+                "$floor": {
+                    "$divide": [
+                        {"$multiply": ["$2dSpeed_m_s", MS_TO_MPH]},
+                        FINE_SPEED_STEP_MPH,
+                    ]
+                }
+            },
+            FINE_SPEED_BINS - 1,
+        ]
+    }
+    pipeline = [
+        {
+            "$match": {
+                "$or": [{"tNow": {"$gte": start, "$lt": end}} for start, end in ranges],
+                # $gte 0 also drops null and NaN readings
+                "Azimuth_deg": {"$gte": 0},
+                "2dSpeed_m_s": {"$gte": 0},
+            }
+        },
+        {"$group": {"_id": {"d": fine_dir, "s": fine_speed}, "count": {"$sum": 1}}},
+    ]
+
+    hist = np.zeros((FINE_DIR_BINS, FINE_SPEED_BINS), dtype=np.int64)
+    for doc in collection.aggregate(pipeline):
+        hist[int(doc["_id"]["d"]), int(doc["_id"]["s"])] += doc["count"]
+    return hist
+
+
+@st.cache_data(ttl=1800, show_spinner=False)
+def fetch_wind_histogram(start_date, end_date, version=None):
+    """Sum the stored per-day wind histograms over an inclusive date range.
+
+    Days without a stored histogram are binned on the server, so the cost is
+    O(days) rather than O(rows). Returns None if the lookup fails. `version`
+    only keys the cache, see fetch_dataset_version.
+    """
+    cache_miss("fetch_wind_histogram")
+    try:
+        client = init_connection()
+        db = client["weather_dashboard"]
+
+        days = pd.date_range(start_date, end_date, freq="D")
+        day_keys = [day.strftime("%Y-%m-%d") for day in days]
+
+        hist = np.zeros((FINE_DIR_BINS, FINE_SPEED_BINS), dtype=np.int64)
+        found = set()
+        for doc in db[HISTOGRAM_COLLECTION].find(
+            {"date": {"$in": day_keys}}, {"_id": 0, "date": 1, "index": 1, "counts": 1}
+        ):
+            hist += histogram_from_document(doc)
+            found.add(doc["date"])
+
+        missing = [
+            day_bounds(day.date(), day.date())
+            for day, key in zip(days, day_keys)
+            if key not in found
+        ]
+        if missing:
+            hist += aggregate_wind_histogram(db["weather_data"], missing)
+
+        return hist
+
+    except Exception as e:
+        st.error(f"Error loading wind histograms: {str(e)}")
+        return None
+
+
+@st.cache_data(ttl=1800, show_spinner=False)
+def fetch_time_summary(start_date, end_date, unit="hour", bin_size=1, version=None):
+    """Aggregate readings into time buckets inside MongoDB.
+
+    Each row holds the bucket start (tNow), the mean, minimum and maximum of
+    every sensor field (as in the rollups), the circular mean direction with
+    its Yamartino std (Azimuth_std) and the row count. `version` only keys
+    the cache.
+    """
+    cache_miss("fetch_time_summary")
+    try:
+        client = init_connection()
+        collection = client["weather_dashboard"]["weather_data"]
+
+        start, end = day_bounds(start_date, end_date)
+        azimuth_rad = {"$degreesToRadians": "$Azimuth_deg"}
+
+        group = {
+            "_id": {"$dateTrunc": {"date": "$tNow", "unit": unit, "binSize": bin_size}},
+            "count": {"$sum": 1},
+            "Azimuth_sin": {"$sum": {"$sin": azimuth_rad}},
+            "Azimuth_cos": {"$sum": {"$cos": azimuth_rad}},
+            "Azimuth_n": {"$sum": {"$cond": [{"$isNumber": "$Azimuth_deg"}, 1, 0]}},
+        }
+        for field in SENSOR_FIELDS:
+            if field != "Azimuth_deg":
+                group[field] = {"$avg": f"${field}"}
+                group[f"{field}_min"] = {"$min": f"${field}"}
+                group[f"{field}_max"] = {"$max": f"${field}"}
+
+        pipeline = [
+            {"$match": {"tNow": {"$gte": start, "$lt": end}}},
+            {"$group": group},
+            {"$sort": {"_id": 1}},
+        ]
+        df = pd.DataFrame(list(collection.aggregate(pipeline)))
+        if df.empty:
+            return df
+
+        df = df.rename(columns={"_id": "tNow"})
+        df["tNow"] = pd.to_datetime(df["tNow"], utc=True)
+        df["Azimuth_deg"], _, df["Azimuth_std"] = circular_stats_from_sums(
+            df.pop("Azimuth_sin"), df.pop("Azimuth_cos"), df.pop("Azimuth_n")
+        )
+        return df
+
+    except Exception as e:
+        st.error(f"Error aggregating time summary: {str(e)}")
+        return pd.DataFrame()
+
+
+def select_resolution(start_date, end_date):
+    """Data source for a selection: "raw", "minute" or "hour" rollups."""
+    span_days = (end_date - start_date).days + 1
+    if span_days <= RAW_MAX_DAYS:
+        return "raw"
+    if span_days <= MINUTE_ROLLUP_MAX_DAYS:
+        return "minute"
+    return "hour"
+
+
+@st.cache_data(ttl=1800, show_spinner=False)
+def fetch_rollup(start_date, end_date, unit, version=None):
+    """Read bucket means and extremes of a selection from the rollups.
+
+    `version` only keys the cache, see fetch_dataset_version.
+    """
+    cache_miss("fetch_rollup")
+    try:
+        client = init_connection()
+        collection = client["weather_dashboard"][ROLLUP_COLLECTIONS[unit]]
+
+        start, end = day_bounds(start_date, end_date)
+        fields = [*SENSOR_FIELDS, *EXTREME_FIELDS]
+        cursor = collection.find(
+            {"tNow": {"$gte": start, "$lt": end}},
+            {"_id": 0, "tNow": 1, **{field: 1 for field in fields}},
+        ).sort("tNow", 1)
+
+        documents = list(cursor)
+        add_bytes("mongo: rollup documents (est.)", estimate_documents_bytes(documents))
+        return documents_to_frame(documents)
+    except Exception as e:
+        st.error(f"Error loading rollups: {str(e)}")
+        return pd.DataFrame()
+
+
+@st.cache_data(ttl=1800, show_spinner=False)
+def fetch_rollup_gaps(start_date, end_date, unit, version=None):
+    """Days of a selection whose rollups do not hold all of their readings.
+
+    A day is complete when its buckets count as many readings as its
+    weather_metadata document, so days never rolled up and days rolled up
+    while an upload was still landing are both reported. Without metadata,
+    days without any bucket are reported. `version` only keys the cache.
+    """
+    cache_miss("fetch_rollup_gaps")
+    try:
+        db = init_connection()["weather_dashboard"]
+        start, end = day_bounds(start_date, end_date)
+        days = [day.date() for day in pd.date_range(start_date, end_date, freq="D")]
+
+        pipeline = [
+            {"$match": {"tNow": {"$gte": start, "$lt": end}}},
+            {
+                "$group": {
+                    "_id": {"$dateTrunc": {"date": "$tNow", "unit": "day"}},
+                    "count": {"$sum": "$count"},
+                }
+            },
+        ]
+        built = {
+            doc["_id"].date(): doc["count"]
+            for doc in db[ROLLUP_COLLECTIONS[unit]].aggregate(pipeline)
+        }
+
+        metadata = db[METADATA_COLLECTION]
+        if metadata.find_one({"_id": "summary"}, {"_id": 1}) is None:
+            return [day for day in days if not built.get(day)]
+
+        expected = {
+            datetime.strptime(doc["_id"], "%Y-%m-%d").date(): doc.get("count", 0)
+            for doc in metadata.find(
+                {"_id": {"$in": [day.isoformat() for day in days]}}, {"count": 1}
+            )
+        }
+        return [day for day in days if built.get(day, 0) != expected.get(day, 0)]
+    except Exception as e:
+        st.error(f"Error checking rollup coverage: {str(e)}")
+        return []
+
+
+def date_runs(days):
+    """Group sorted dates into inclusive (first, last) runs of consecutive days."""
+    runs = []
+    for day in days:
+        if runs and day - runs[-1][1] == timedelta(days=1):
+            runs[-1][1] = day
+        else:
+            runs.append([day, day])
+    return [tuple(run) for run in runs]
+
+
+def summary_to_frame(df):
+    """Shape a fetch_time_summary result like the rollup frame."""
+    columns = ["tNow", *SENSOR_FIELDS, *EXTREME_FIELDS]
+    return apply_weather_schema(add_time_columns(df[columns].copy()))
+
+
+def load_rollup_data(start_date, end_date, unit):
+    """Selection from the minute or hour rollups, shaped like the raw frame.
+
+    Days the rollups do not fully cover (see fetch_rollup_gaps) are bucketed
+    on the server at the same resolution instead, so a partly built range is
+    never charted as complete. Rows carry the bucket means and, in the
+    EXTREME_FIELDS columns, the bucket minima and maxima.
+    """
+    version = fetch_dataset_version()
+    cache_call("fetch_rollup")
+    with timed(f"mongo: fetch_rollup ({unit})"):
+        df = fetch_rollup(start_date, end_date, unit, version)
+
+    cache_call("fetch_rollup_gaps")
+    with timed("mongo: fetch_rollup_gaps"):
+        gaps = fetch_rollup_gaps(start_date, end_date, unit, version)
+
+    if gaps:
+        frames = []
+        if not df.empty:
+            frames.append(df[~df["tNow"].dt.date.isin(gaps)])
+        for first, last in date_runs(gaps):
+            cache_call("fetch_time_summary")
+            with timed(f"mongo: fetch_time_summary ({unit})"):
+                summary = fetch_time_summary(first, last, unit=unit, version=version)
+            if not summary.empty:
+                frames.append(summary_to_frame(summary))
+
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return pd.DataFrame()
+        df = pd.concat(frames, ignore_index=True)
+        df.sort_values("tNow", inplace=True, kind="stable")
+        df.reset_index(drop=True, inplace=True)
+
+    if not df.empty:
+        df.attrs["resolution"] = "1-minute" if unit == "minute" else "hourly"
+    return df
+
+
+def load_coarse_data(start_date, end_date):
+    """Bucketed preview of a selection, shaped like the raw frame.
+
+    Reads the minute rollups for up to COARSE_MINUTE_MAX_DAYS days and the
+    hourly rollups beyond, filling days they miss on the server. If that
+    fails, the whole range is bucketed on the server (10-minute or hourly)
+    so the first charts can be drawn before raw data loads.
+    """
+    span_days = (end_date - start_date).days + 1
+    unit = "minute" if span_days <= COARSE_MINUTE_MAX_DAYS else "hour"
+    df = load_rollup_data(start_date, end_date, unit)
+    if not df.empty:
+        return df
+
+    version = fetch_dataset_version()
+    cache_call("fetch_time_summary")
+    with timed("mongo: fetch_time_summary"):
+        if unit == "minute":
+            df = fetch_time_summary(
+                start_date, end_date, unit="minute", bin_size=10, version=version
+            )
+        else:
+            df = fetch_time_summary(start_date, end_date, unit="hour", version=version)
+
+    if df.empty:
+        return df
+
+    df = summary_to_frame(df)
+    df.attrs["resolution"] = "10-minute" if unit == "minute" else "hourly"
+    return df
+
+
 @st.cache_data(ttl=1800, show_spinner=False)
 def fetch_data_cached(min_date, max_date):
     """Cached version of data loading from MongoDB"""
+    cache_miss("fetch_data_cached")
     try:
         client = init_connection()
         db = client["weather_dashboard"]
@@ -95,32 +481,109 @@ def fetch_data_cached(min_date, max_date):
                     "$lte": max_date,
                 }
             },
-            {
-                "_id": 0,
-                "tNow": 1,
-                "Temp_C": 1,
-                "Press_Pa": 1,
-                "Hum_RH": 1,
-                "2dSpeed_m_s": 1,
-                "3DSpeed_m_s": 1,
-                "u_m_s": 1,
-                "v_m_s": 1,
-                "w_m_s": 1,
-                "Azimuth_deg": 1,
-                "Elev_deg": 1,
-                "SonicTemp_C": 1,
-            },
+            {"_id": 0, "tNow": 1, **{field: 1 for field in SENSOR_FIELDS}},
         )
 
         documents = list(cursor)
+        add_bytes("mongo: raw documents (est.)", estimate_documents_bytes(documents))
         return documents
     except Exception as e:
         st.error(f"Error loading data: {str(e)}")
         return []
 
 
-def load_data():
-    """Load weather data with progress updates and caching"""
+def estimate_documents_bytes(documents):
+    """Approximate BSON size of a batch from its first document."""
+    if not documents:
+        return 0
+    return len(documents) * len(bson.encode(documents[0]))
+
+
+def documents_to_frame(documents):
+    """Build the time-sorted weather frame used by the dashboard."""
+    df = pd.DataFrame(documents)
+
+    if len(df) > 0:
+        # Compact dtypes (float32 sensors, ns UTC time), then sort by
+        # timestamp; filter_data relies on this order
+        apply_weather_schema(df)
+        df.sort_values("tNow", inplace=True, kind="stable")
+        df.reset_index(drop=True, inplace=True)
+
+        # Add derived columns
+        add_time_columns(df)
+
+    return df
+
+
+def fetch_data_since(last_timestamp):
+    """Fetch only the documents newer than last_timestamp (uncached)."""
+    try:
+        client = init_connection()
+        collection = client["weather_dashboard"]["weather_data"]
+
+        cursor = collection.find(
+            {"tNow": {"$gt": pd.Timestamp(last_timestamp).to_pydatetime()}},
+            {"_id": 0, "tNow": 1, **{field: 1 for field in SENSOR_FIELDS}},
+        ).sort("tNow", 1)
+
+        documents = list(cursor)
+        add_bytes("mongo: new documents (est.)", estimate_documents_bytes(documents))
+        return documents_to_frame(documents)
+    except Exception as e:
+        st.error(f"Error fetching new data: {str(e)}")
+        return pd.DataFrame()
+
+
+def as_utc(timestamp):
+    """Timestamp in UTC; naive values (as stored in MongoDB) are taken as UTC."""
+    timestamp = pd.Timestamp(timestamp)
+    if timestamp.tzinfo is None:
+        return timestamp.tz_localize("UTC")
+    return timestamp.tz_convert("UTC")
+
+
+def newest_reading():
+    """Newest reading time the session has seen, loaded or live."""
+    newest = as_utc(st.session_state.date_range["max_date"])
+    full_df = st.session_state.get("full_df")
+    if full_df is not None and not full_df.empty:
+        newest = max(newest, as_utc(full_df["tNow"].iloc[-1]))
+    return newest
+
+
+def append_new_data():
+    """Append readings newer than any seen so far to the session's data.
+
+    The loaded frame has to end at the newest reading (see live_available),
+    so the appended rows keep it sorted and gap-free. The first day holding
+    live rows is kept in ``live_since_day`` for the wind rose. Returns the
+    number of rows added.
+    """
+    full_df = st.session_state.get("full_df")
+    if full_df is None or full_df.empty:
+        return 0
+
+    with timed("mongo: fetch_data_since"):
+        new_df = fetch_data_since(newest_reading())
+    if new_df.empty:
+        return 0
+
+    st.session_state.full_df = pd.concat([full_df, new_df], ignore_index=True)
+    st.session_state.date_range["max_date"] = new_df["tNow"].iloc[-1]
+    first_day = new_df["tNow"].iloc[0].date()
+    st.session_state.live_since_day = min(
+        st.session_state.get("live_since_day", first_day), first_day
+    )
+    return len(new_df)
+
+
+def load_data(start_date=None, end_date=None):
+    """Load raw weather data with progress updates and caching.
+
+    Loads the whole days [start_date, end_date] when given, otherwise every
+    reading in the database.
+    """
     try:
         if "date_range" not in st.session_state:
             date_range = get_date_range()
@@ -128,15 +591,20 @@ def load_data():
                 return pd.DataFrame()
             st.session_state["date_range"] = date_range
 
+        if start_date is not None:
+            min_date, max_date = day_bounds(start_date, end_date)
+        else:
+            min_date = st.session_state.date_range["min_date"]
+            max_date = st.session_state.date_range["max_date"]
+
         # Create progress indicators
         progress_bar = st.progress(0)
         status_text = st.empty()
 
         # Get cached documents
-        documents = fetch_data_cached(
-            st.session_state.date_range["min_date"],
-            st.session_state.date_range["max_date"],
-        )
+        cache_call("fetch_data_cached")
+        with timed("mongo: fetch_data_cached"):
+            documents = fetch_data_cached(min_date, max_date)
 
         # Process documents with progress updates
         total_count = len(documents)
@@ -150,16 +618,8 @@ def load_data():
                 status_text.text(f"Processing data... {i:,} of {total_count:,} records")
 
         # Convert to DataFrame
-        df = pd.DataFrame(df_list)
-
-        if len(df) > 0:
-            # Convert and sort by timestamp
-            df["tNow"] = pd.to_datetime(df["tNow"], utc=True)
-            df.sort_values("tNow", inplace=True)
-
-            # Add derived columns
-            df["hour"] = df["tNow"].dt.hour
-            df["day"] = df["tNow"].dt.day
+        with timed("frame: documents_to_frame"):
+            df = documents_to_frame(df_list)
 
         # Clear progress indicators after a short delay
         time.sleep(0.5)
@@ -171,8 +631,9 @@ def load_data():
         else:
             st.toast(f"Loaded {len(df):,} records successfully", icon="✅")
 
-        # Store in session state
+        # Store in session state with the days it covers
         st.session_state.full_df = df
+        st.session_state.loaded_dates = (start_date, end_date)
         return df
 
     except Exception as e:
@@ -181,15 +642,26 @@ def load_data():
 
 
 def filter_data(df, start_date, end_date):
-    """Optimized dataframe filtering"""
-    # Convert dates once
-    start_ts = pd.Timestamp(start_date)
-    end_ts = pd.Timestamp(end_date)
-
-    # Use vectorized operations with pre-computed dates
-    mask = (df["tNow"].dt.date >= start_ts.date()) & (
-        df["tNow"].dt.date <= end_ts.date()
-    )
-    filtered_df = df.loc[mask]
+    """Slice the time-sorted frame to whole UTC days [start_date, end_date].
+
+    The bounds are located with a binary search on ``tNow`` so a date-picker
+    change costs O(log n) and the result is a positional slice of ``df``.
+    Frames must be sorted by ``tNow``, which documents_to_frame guarantees
+    and append_new_data preserves.
+    """
+    if df.empty:
+        return df
+
+    times = df["tNow"]
+
+    # Whole-day bounds in the frame's timezone (UTC), end bound exclusive
+    start_ts = pd.Timestamp(start_date).normalize()
+    end_ts = pd.Timestamp(end_date).normalize() + pd.Timedelta(days=1)
+    if times.dt.tz is not None and start_ts.tzinfo is None:
+        start_ts = start_ts.tz_localize(times.dt.tz)
+        end_ts = end_ts.tz_localize(times.dt.tz)
+
+    lo = times.searchsorted(start_ts, side="left")
+    hi = times.searchsorted(end_ts, side="left")
 
-    return filtered_df
+    return df.iloc[lo:hi]
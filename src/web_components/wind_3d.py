@@ -1,6 +1,13 @@
 import streamlit as st
 import plotly.graph_objects as go
 import numpy as np
+from processing import direction_time_surface
+from web_components.figure_cache import cached_figure
+from web_components.perf import timed_component
+
+# Surface resolution: time bins along the selection and direction step
+SURFACE_TIME_BINS = 100
+SURFACE_DIR_STEP = 5.0  # degrees
 
 
 def ms_to_mph(speed_ms):
@@ -9,6 +16,7 @@ def ms_to_mph(speed_ms):
 
 
 @st.fragment
+@timed_component("wind_3d")
 def wind_3d_component():
     """Create 3D surface plot of wind speed over time and direction using Plotly."""
 
@@ -25,32 +33,28 @@ def wind_3d_component():
         st.error("Required columns are missing from the dataset.")
         return
 
-    # Convert wind speed to mph
-    wind_speed_mph = ms_to_mph(combined_df["3DSpeed_m_s"])
+    fig = cached_figure("wind_3d", None, lambda: create_wind_3d_plot(combined_df))
 
-    # Create direction and time meshgrid with reversed time
-    dir_bins = np.linspace(0, 360, 73)  # 5-degree bins
-    time_bins = np.linspace(len(combined_df) - 1, 0, 100)  # Reversed time bins
+    # Display the plot
+    st.plotly_chart(fig, use_container_width=True)
 
-    Dir, Time = np.meshgrid(dir_bins, time_bins)
-    Speed = np.zeros_like(Dir)
 
-    # For each time bin, interpolate speeds across directions
-    for i, t in enumerate(time_bins):
-        idx = int(round(t))
-        if idx >= len(combined_df):
-            idx = len(combined_df) - 1
+def create_wind_3d_plot(combined_df):
+    """Build the time x direction wind speed surface figure."""
+    # Convert wind speed to mph
+    wind_speed_mph = ms_to_mph(combined_df["3DSpeed_m_s"])
 
-        actual_dir = combined_df["Azimuth_deg"].iloc[idx]
-        actual_speed = wind_speed_mph.iloc[idx]
+    # Aggregate every reading into the time x direction grid
+    time_bins, dir_bins, Speed = direction_time_surface(
+        wind_speed_mph,
+        combined_df["Azimuth_deg"],
+        n_time_bins=SURFACE_TIME_BINS,
+        dir_step_deg=SURFACE_DIR_STEP,
+    )
 
-        # Gaussian smoothing
-        sigma = 15  # Width of gaussian in degrees
-        dir_diff = np.minimum(
-            np.abs(Dir[i] - actual_dir), np.abs(Dir[i] - (actual_dir + 360))
-        )
-        dir_diff = np.minimum(dir_diff, np.abs(Dir[i] - (actual_dir - 360)))
-        Speed[i] = actual_speed * np.exp(-(dir_diff**2) / (2 * sigma**2))
+    # Reversed time bins, matching the reversed time axis
+    time_bins, Speed = time_bins[::-1], Speed[::-1]
+    Dir, Time = np.meshgrid(dir_bins, time_bins)
 
     # Get time labels for x-axis (reversed)
     num_ticks = min(10, len(combined_df) // 100)
@@ -60,14 +64,14 @@ def wind_3d_component():
         for idx in tick_indices
     ]
 
-    # Create customdata array for hover template
-    customdata = np.zeros_like(Dir, dtype="object")
-    for i, t in enumerate(time_bins):
-        idx = int(round(t))
-        if idx >= len(combined_df):
-            idx = len(combined_df) - 1
-        time_str = combined_df["tNow"].iloc[idx].strftime("%Y-%m-%d %H:%M")
-        customdata[i, :] = time_str
+    # Hover time of each time bin, repeated along the direction axis
+    bin_times = (
+        combined_df["tNow"]
+        .iloc[np.rint(time_bins).astype(int)]
+        .dt.strftime("%Y-%m-%d %H:%M")
+        .to_numpy()
+    )
+    customdata = np.repeat(bin_times[:, None], len(dir_bins), axis=1)
 
     # Create the surface plot using Plotly
     fig = go.Figure(
@@ -81,7 +85,7 @@ def wind_3d_component():
                 hovertemplate=(
                     "Time: %{customdata}<br>"
                     "Direction: %{y:.0f}°<br>"
-                    "Wind Speed: %{z:.1f} mph<br>"
+                    "Frequency-Weighted Speed: %{z:.1f} mph<br>"
                     "<extra></extra>"
                 ),
                 customdata=customdata,
@@ -103,7 +107,7 @@ def wind_3d_component():
                 ticktext=["N", "NE", "E", "SE", "S", "SW", "W", "NW", "N"],
                 tickvals=np.arange(0, 361, 45),
             ),
-            zaxis=dict(title="Wind Speed (mph)"),
+            zaxis=dict(title="Frequency-Weighted Speed (mph)"),
             camera=dict(eye=dict(x=1.5, y=1.5, z=1.2)),
         ),
         title=dict(
@@ -116,5 +120,4 @@ def wind_3d_component():
         height=700,
     )
 
-    # Display the plot
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
@@ -1,92 +1,57 @@
 import streamlit as st
 import plotly.graph_objects as go
-import pandas as pd
 import numpy as np
-import plotly.express as px
-
-
-def create_wind_rose(df):
-    # Make an explicit copy at the start
-    df = df.copy()
-
-    # Convert wind speed from m/s to mph
-    df.loc[:, "2dSpeed_mph"] = df["2dSpeed_m_s"] * 2.23694
-
-    # Define direction bins
-    dir_bins = np.arange(0, 361, 22.5)
-    dir_labels = [
-        "N",
-        "NNE",
-        "NE",
-        "ENE",
-        "E",
-        "ESE",
-        "SE",
-        "SSE",
-        "S",
-        "SSW",
-        "SW",
-        "WSW",
-        "W",
-        "WNW",
-        "NW",
-        "NNW",
-    ]
-
-    # Dynamically create speed bins based on data
-    max_speed = df["2dSpeed_mph"].max()
-    num_bins = 6  # You can adjust this number
-    speed_bins = np.linspace(0, max_speed, num_bins + 1)
-    speed_labels = [
-        f"{speed_bins[i]:.1f}-{speed_bins[i+1]:.1f}" for i in range(len(speed_bins) - 1)
-    ]
-
-    # Categorize data
-    df.loc[:, "dir_cat"] = pd.cut(
-        df["Azimuth_deg"],
-        bins=dir_bins,
-        labels=dir_labels,
-        include_lowest=True,
-        ordered=False,
-    )
-    df.loc[:, "speed_cat"] = pd.cut(
-        df["2dSpeed_mph"],
-        bins=speed_bins,
-        labels=speed_labels,
-        include_lowest=True,
-        ordered=False,
-    )
-
-    # Count occurrences and calculate percentages
-    wind_data = (
-        df.groupby(["dir_cat", "speed_cat"], observed=True).size().unstack(fill_value=0)
-    )
-    total_count = wind_data.sum().sum()
-    wind_percentages = wind_data / total_count * 100
+from datetime import timedelta
+from processing.wind_rose import (
+    MS_TO_MPH,
+    SECTOR_LABELS,
+    SPEED_COLORS,
+    SPEED_LABELS,
+    fine_histogram,
+    rebin_histogram,
+)
+from web_components.figure_cache import cached_figure
+from web_components.perf import cache_call, timed, timed_component
+from web_components.utils import (
+    as_utc,
+    fetch_dataset_version,
+    fetch_wind_histogram,
+)
+
+
+def create_wind_rose(counts):
+    """Build the wind rose figure from display counts (speed bins x sectors)."""
+    # Calculate percentages
+    total_count = counts.sum()
+    wind_percentages = counts * 100.0 / total_count
 
     # Create wind rose
     fig = go.Figure()
 
-    # RdYlBu (Blue through yellow to red, very distinct)
-    colors = px.colors.diverging.RdYlBu[::-1][: len(speed_labels)]
+    for i, speed_label in enumerate(SPEED_LABELS):
+        # Only plot and add to legend if bin has data
+        if not np.any(counts[i] > 0):
+            continue
 
-    for i, speed_cat in enumerate(speed_labels):
         fig.add_trace(
             go.Barpolar(
-                r=wind_percentages[speed_cat],
-                theta=dir_labels,
-                name=f"{speed_cat} mph",
-                marker_color=colors[i],
+                r=wind_percentages[i],
+                theta=SECTOR_LABELS,
+                name=f"{speed_label} mph",
+                marker_color=SPEED_COLORS[i],
                 marker_line_width=1,
                 opacity=0.8,
                 hovertemplate="Direction: %{theta}<br>"
                 + "Speed: "
-                + speed_cat
+                + speed_label
                 + " mph<br>"
                 + "Percentage: %{r:.1f}%<extra></extra>",
             )
         )
 
+    # Bars are stacked, so the radial axis has to fit the tallest sector
+    max_total = wind_percentages.sum(axis=0).max()
+
     fig.update_layout(
         title={
             "text": "Wind Rose Diagram",
@@ -99,13 +64,11 @@ def create_wind_rose(df):
         polar=dict(
             radialaxis=dict(
                 visible=True,
-                range=[0, wind_percentages.max().max()],
+                range=[0, max_total],
                 ticksuffix="%",
                 tickmode="array",
-                tickvals=np.arange(0, wind_percentages.max().max(), 5),
-                ticktext=[
-                    f"{i}%" for i in range(0, int(wind_percentages.max().max()), 5)
-                ],
+                tickvals=np.arange(0, max_total, 5),
+                ticktext=[f"{i}%" for i in range(0, int(max_total), 5)],
             ),
             angularaxis=dict(direction="clockwise", rotation=90),
             bgcolor="rgba(0,0,0,0)",  # Set polar area background to transparent
@@ -122,157 +85,65 @@ def create_wind_rose(df):
     return fig
 
 
-def create_wind_rose_over_time(df):
-    # Make an explicit copy at the start
-    df = df.copy()
-
-    # Convert wind speed from m/s to mph
-    df["2dSpeed_mph"] = df["2dSpeed_m_s"] * 2.23694
-
-    # Define direction bins
-    dir_bins = np.arange(0, 361, 22.5)
-    dir_labels = [
-        "N",
-        "NNE",
-        "NE",
-        "ENE",
-        "E",
-        "ESE",
-        "SE",
-        "SSE",
-        "S",
-        "SSW",
-        "SW",
-        "WSW",
-        "W",
-        "WNW",
-        "NW",
-        "NNW",
-    ]
-
-    # Dynamically create speed bins based on data
-    max_speed = df["2dSpeed_mph"].max()
-    num_bins = 6  # You can adjust this number
-    speed_bins = np.linspace(0, max_speed, num_bins + 1)
-    speed_labels = [
-        f"{speed_bins[i]:.1f}-{speed_bins[i+1]:.1f}" for i in range(len(speed_bins) - 1)
-    ]
-
-    # Categorize data
-    df.loc[:, "dir_cat"] = pd.cut(
-        df["Azimuth_deg"],
-        bins=dir_bins,
-        labels=dir_labels,
-        include_lowest=True,
-        ordered=False,
-    )
-    df.loc[:, "speed_cat"] = pd.cut(
-        df["2dSpeed_mph"],
-        bins=speed_bins,
-        labels=speed_labels,
-        include_lowest=True,
-        ordered=False,
-    )
-
-    # Count occurrences and calculate percentages
-    wind_data = (
-        df.groupby(["dir_cat", "speed_cat"], observed=True).size().unstack(fill_value=0)
-    )
-    total_count = wind_data.sum().sum()
-    wind_percentages = wind_data / total_count * 100
-
-    # Create wind rose
-    fig = go.Figure()
-
-    # RdYlBu (Blue through yellow to red, very distinct)
-    colors = px.colors.diverging.RdYlBu[::-1][: len(speed_labels)]
-
-    for i, speed_cat in enumerate(speed_labels):
-        fig.add_trace(
-            go.Barpolar(
-                r=wind_percentages[speed_cat],
-                theta=dir_labels,
-                name=f"{speed_cat} mph",
-                marker_color=colors[i],
-                marker_line_width=1,
-                opacity=0.8,
-                hovertemplate="Direction: %{theta}<br>"
-                + "Speed: "
-                + speed_cat
-                + " mph<br>"
-                + "Percentage: %{r:.1f}%<extra></extra>",
-            )
-        )
+def selection_histogram(df, start_date, end_date):
+    """Fine wind histogram of a selection from the stored per-day histograms.
 
-    fig.update_layout(
-        title={
-            "text": "Wind Rose Diagram",
-            "x": 0.5,
-            "xanchor": "center",
-            "yanchor": "top",
-        },
-        font_size=12,
-        legend_font_size=10,
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[0, wind_percentages.max().max()],
-                ticksuffix="%",
-                tickmode="array",
-                tickvals=np.arange(0, wind_percentages.max().max(), 5),
-                ticktext=[
-                    f"{i}%" for i in range(0, int(wind_percentages.max().max()), 5)
-                ],
-            ),
-            angularaxis=dict(direction="clockwise", rotation=90),
-            bgcolor="rgba(0,0,0,0)",  # Set polar area background to transparent
-        ),
-        width=620,
-        height=620,
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="rgba(0,0,0,0)",
-        legend=dict(
-            orientation="h", yanchor="bottom", y=-0.15, xanchor="center", x=0.5
-        ),
-    )
+    Days from ``live_since_day`` on are binned from the raw frame instead,
+    as their stored histograms predate the live readings. Returns None if
+    the stored histograms cannot be read.
+    """
+    hist = 0
+    live_day = st.session_state.get("live_since_day")
+    if live_day is not None and live_day <= end_date and "resolution" not in df.attrs:
+        live_day = max(live_day, start_date)
+        recent = df.iloc[df["tNow"].searchsorted(as_utc(live_day)) :]
+        hist = fine_histogram(recent["2dSpeed_m_s"] * MS_TO_MPH, recent["Azimuth_deg"])
+        end_date = live_day - timedelta(days=1)
+        if end_date < start_date:
+            return hist
 
-    return fig
+    cache_call("fetch_wind_histogram")
+    with timed("mongo: fetch_wind_histogram"):
+        stored = fetch_wind_histogram(start_date, end_date, fetch_dataset_version())
+    return None if stored is None else stored + hist
 
 
 @st.fragment
+@timed_component("wind_rose")
 def wind_rose_component():
     # Check if filtered_df exists in session state
     if "filtered_df" not in st.session_state:
         st.warning("Please select a date range first.")
         return
 
-    # Make an explicit copy
-    df = st.session_state.filtered_df.copy()
+    df = st.session_state.filtered_df
 
     # Check if dataframe is empty
     if df.empty:
         st.warning("No data available for the selected date range.")
         return
 
-    # Ensure minimum data points for meaningful visualization
-    if len(df) < 10:  # You can adjust this threshold
+    def build():
+        # Sum the stored per-day histograms; fall back to binning the frame
+        hist = None
+        if "selected_dates" in st.session_state:
+            hist = selection_histogram(df, *st.session_state.selected_dates)
+        if hist is None:
+            hist = fine_histogram(df["2dSpeed_m_s"] * MS_TO_MPH, df["Azimuth_deg"])
+
+        counts = rebin_histogram(hist)
+
+        # Ensure minimum data points for meaningful visualization
+        if counts.sum() < 10:  # You can adjust this threshold
+            return None
+
+        return create_wind_rose(counts)
+
+    fig = cached_figure("wind_rose", None, build)
+    if fig is None:
         st.warning(
             "Not enough data points for wind rose visualization. Need at least 10 measurements."
         )
         return
 
-    # Ensure 'tNow' is a datetime column
-    df.loc[:, "tNow"] = pd.to_datetime(df["tNow"])
-
-    # Check if start and end dates are the same
-    start_date = df["tNow"].min().date()
-    end_date = df["tNow"].max().date()
-
-    if start_date == end_date:
-        # For a single day, create a 24-hour wind rose
-        fig = create_wind_rose(df)
-    else:
-        # For multiple days, create a wind rose for the entire period
-        fig = create_wind_rose_over_time(df)
-
     st.plotly_chart(fig, use_container_width=True)
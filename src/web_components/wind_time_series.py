@@ -2,72 +2,59 @@ import streamlit as st
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
-import numpy as np
+from processing import (
+    downsample,
+    interleave_extremes,
+    point_budget,
+    resample_direction,
+    rolling_max_windows,
+)
+from web_components.figure_cache import cached_figure
+from web_components.perf import timed_component
+
+# Assumed rendered width of the full-width wind chart, used for the point budget
+WIND_PLOT_WIDTH_PX = 1400
+
+
+# Define average wind direction interval_map
+ARROW_INTERVAL_MAP = {
+    "10 minutes": pd.Timedelta(minutes=10),
+    "30 minutes": pd.Timedelta(minutes=30),
+    "1 hour": pd.Timedelta(hours=1),
+    "2 hour": pd.Timedelta(hours=2),
+    "3 hour": pd.Timedelta(hours=3),
+}
+
+# Define average gust wind speed interval_map
+GUST_INTERVAL_MAP = {
+    "3 seconds": "3s",
+    "5 seconds": "5s",
+    "10 seconds": "10s",
+    "20 seconds": "20s",
+    "30 seconds": "30s",
+    "1 min": "1min",
+    "2 min": "2min",
+    "3 min": "3min",
+}
+
+SPEED_COLUMNS = ["2dSpeed_m_s", "3DSpeed_m_s", "u_m_s", "v_m_s", "w_m_s"]
 
 
 @st.fragment
+@timed_component("wind_time_series")
 def wind_time_series_component():
     # Check if filtered_df exists in session state
     if "filtered_df" not in st.session_state:
         st.warning("Please select a date range first.")
         return
 
-    # Make an explicit copy of the filtered DataFrame
-    df = st.session_state.filtered_df.copy()
-
-    # Ensure tNow is a datetime index
-    df.loc[:, "tNow"] = pd.to_datetime(df["tNow"])
-    df.set_index("tNow", inplace=True)
-
-    # Sort the DataFrame by the time index
-    df.sort_index(inplace=True)
-
-    # Convert wind speed columns from m/s to mph
-    speed_columns = ["2dSpeed_m_s", "3DSpeed_m_s", "u_m_s", "v_m_s", "w_m_s"]
-    for col in speed_columns:
-        df.loc[:, col.replace("m_s", "mph")] = df[col] * 2.23694  # Convert m/s to mph
-
-    # Define average wind direction interval_map
-    interval_map = {
-        "10 minutes": pd.Timedelta(minutes=10),
-        "30 minutes": pd.Timedelta(minutes=30),
-        "1 hour": pd.Timedelta(hours=1),
-        "2 hour": pd.Timedelta(hours=2),
-        "3 hour": pd.Timedelta(hours=3),
-    }
-
-    # Define average gust wind speed interval_map
-    gust_interval_map = {
-        "3 seconds": "3s",
-        "5 seconds": "5s",
-        "10 seconds": "10s",
-        "20 seconds": "20s",
-        "30 seconds": "30s",
-        "1 min": "1min",
-        "2 min": "2min",
-        "3 min": "3min",
-    }
-
-    # Calculate average gust wind speed (default to 3min)
-    df.loc[:, "GustSpeed_mph"] = df["2dSpeed_mph"].rolling(window="3min").max()
-
     # Update speed_options to include gust speed
-    speed_options = [col.replace("m_s", "mph") for col in speed_columns] + [
+    speed_options = [col.replace("m_s", "mph") for col in SPEED_COLUMNS] + [
         "GustSpeed_mph"
     ]
 
-    # Create the initial plot
-    fig = create_wind_plot(
-        df,
-        ["2dSpeed_mph", "3DSpeed_mph", "GustSpeed_mph"],
-        "30 minutes",
-        interval_map,
-        "3min",
-    )
-
-    # Display the plot
+    # Display the plot above the selectors
     plot_placeholder = st.empty()
-    plot_placeholder.plotly_chart(fig, use_container_width=True)
 
     # UI elements below the plot
     col1, col2 = st.columns(2)
@@ -84,52 +71,112 @@ def wind_time_series_component():
         with col2_1:
             arrow_interval = st.selectbox(
                 "Select interval for average wind direction arrows:",
-                options=list(interval_map.keys()),
+                options=list(ARROW_INTERVAL_MAP.keys()),
                 index=1,  # Default to 30 minutes
             )
         with col2_2:
             gust_wind_interval = st.selectbox(
                 "Select interval for gust wind speed:",
-                options=list(gust_interval_map.keys()),
+                options=list(GUST_INTERVAL_MAP.keys()),
                 index=7,  # Default to 3 min
             )
 
-    # If selections change, update the plot
-    if (
-        selected_speeds != ["2dSpeed_mph", "3DSpeed_mph", "GustSpeed_mph"]
-        or arrow_interval != "30 minutes"
-        or gust_wind_interval != "3 min"
-    ):
-        # Recalculate gust wind speed based on selected interval
-        df.loc[:, "GustSpeed_mph"] = (
-            df["2dSpeed_mph"]
-            .rolling(window=gust_interval_map[gust_wind_interval])
-            .max()
-        )
+    def build():
+        df = prepare_wind_frame(st.session_state.filtered_df)
+
+        # Gust wind speed for the selected interval; all intervals are
+        # cached per selection
+        df.loc[:, "GustSpeed_mph"] = get_gusts(df)[
+            GUST_INTERVAL_MAP[gust_wind_interval]
+        ]
 
-        updated_fig = create_wind_plot(
+        return create_wind_plot(
             df,
             selected_speeds,
             arrow_interval,
-            interval_map,
-            gust_interval_map[gust_wind_interval],
+            ARROW_INTERVAL_MAP,
+            GUST_INTERVAL_MAP[gust_wind_interval],
         )
-        plot_placeholder.plotly_chart(updated_fig, use_container_width=True)
+
+    fig = cached_figure(
+        "wind_time_series",
+        (tuple(selected_speeds), arrow_interval, gust_wind_interval),
+        build,
+    )
+    plot_placeholder.plotly_chart(fig, use_container_width=True)
+
+
+def prepare_wind_frame(filtered_df):
+    """Time-indexed copy of the selection with speeds converted to mph."""
+    # Make an explicit copy of the filtered DataFrame
+    df = filtered_df.copy()
+
+    # Ensure tNow is a datetime index
+    df.loc[:, "tNow"] = pd.to_datetime(df["tNow"])
+    df.set_index("tNow", inplace=True)
+
+    # Sort the DataFrame by the time index
+    df.sort_index(inplace=True)
+
+    # Convert wind speed columns (and bucket extremes of rollup frames) to mph
+    for col in SPEED_COLUMNS:
+        for suffix in ("", "_min", "_max"):
+            if col + suffix in df:
+                df.loc[:, col.replace("m_s", "mph") + suffix] = (
+                    df[col + suffix] * 2.23694
+                )  # Convert m/s to mph
+
+    return df
+
+
+def get_gusts(df):
+    """Rolling max 2D speed for every GUST_INTERVAL_MAP window, cached in
+    session state.
+
+    All windows are computed together when the selection changes, so picking
+    another gust interval is a cache lookup. Bucketed frames use the bucket
+    maxima, so gusts come from the fastest reading rather than the bucket
+    means; a window shorter than a bucket then gives the bucket maximum.
+    """
+    column = "2dSpeed_mph_max" if "2dSpeed_mph_max" in df else "2dSpeed_mph"
+    key = (column, len(df), df.index[0], df.index[-1]) if len(df) else None
+    cache = st.session_state.get("gust_cache")
+    if cache is None or cache["key"] != key:
+        cache = {
+            "key": key,
+            "gusts": rolling_max_windows(
+                df.index, df[column], GUST_INTERVAL_MAP.values()
+            ),
+        }
+        st.session_state.gust_cache = cache
+    return cache["gusts"]
+
+
+def speed_series(df, speed):
+    """Points drawn for a speed column: the bucket extremes when the frame
+    has them (rollups), otherwise the readings themselves."""
+    if f"{speed}_max" in df:
+        return interleave_extremes(df.index, df[f"{speed}_min"], df[f"{speed}_max"])
+    return df.index, df[speed]
 
 
 def create_wind_plot(df, selected_speeds, arrow_interval, interval_map, gust_interval):
-    # Downsample data more efficiently - using iloc
-    df_plot = df.iloc[::10]
+    # Fixed per-trace point budget; min/max envelope keeps gust peaks visible
+    n_points = point_budget(WIND_PLOT_WIDTH_PX)
 
     # Create the plot
     fig = make_subplots(specs=[[{"secondary_y": True}]])
 
     # Add traces for selected wind speed components
+    peaks = []
     for speed in selected_speeds:
+        x_plot, y_plot = downsample(*speed_series(df, speed), n_points, mode="minmax")
+        if len(y_plot):
+            peaks.append(y_plot.max())
         fig.add_trace(
             go.Scatter(
-                x=df_plot.index,
-                y=df_plot[speed],
+                x=x_plot,
+                y=y_plot,
                 name=speed,
                 mode="lines",  # Remove markers for better performance
                 line=dict(
@@ -140,25 +187,15 @@ def create_wind_plot(df, selected_speeds, arrow_interval, interval_map, gust_int
             secondary_y=False,
         )
 
-    # Calculate the y-position for direction markers
-    y_pos = df_plot[selected_speeds].max().max() * 1.1
+    # Calculate the y-position for direction markers above the highest peak
+    y_pos = max(peaks, default=float("nan")) * 1.1
 
     # Resample data based on the selected arrow_interval
     interval = interval_map[arrow_interval]
 
-    # Create a new DataFrame with only the columns we need
-    df_direction = pd.DataFrame(df["Azimuth_deg"].astype(float))
-
-    # Calculate the average direction using circular mean
-    def circular_mean(angles):
-        angles_rad = np.radians(angles)
-        x = np.mean(np.cos(angles_rad))
-        y = np.mean(np.sin(angles_rad))
-        mean_angle = np.degrees(np.arctan2(y, x)) % 360
-        return mean_angle
-
-    # Resample the data and calculate the average direction
-    df_resampled = df_direction.resample(interval).agg({"Azimuth_deg": circular_mean})
+    # Circular mean direction per interval from vectorised sin/cos sums
+    df_resampled = resample_direction(df.index, df["Azimuth_deg"], interval)
+    df_resampled = df_resampled.rename(columns={"mean": "Azimuth_deg"})
 
     # Add direction arrows with optimized settings
     fig.add_trace(
@@ -0,0 +1,47 @@
+"""Time the wind rose kernels on synthetic readings and check they agree.
+
+Run with: python tests/bench/bench_wind_rose.py [n_readings]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add src (for processing) and tests (for the reference kernel) to the path
+tests_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(tests_dir.parent / "src"))
+sys.path.insert(0, str(tests_dir))
+
+from processing.wind_rose import (  # noqa: E402
+    fine_histogram,
+    rebin_histogram,
+    wind_rose_counts,
+)
+from test_wind_rose import per_bin_counts  # noqa: E402
+
+
+def benchmark(n=5_000_000, repeat=3):
+    rng = np.random.default_rng(0)
+    speed = rng.gamma(2.0, 4.0, n)
+    direction = rng.uniform(0, 360, n)
+
+    kernels = {
+        "per-bin loop": per_bin_counts,
+        "fine + rebin": lambda s, d: rebin_histogram(fine_histogram(s, d)),
+        "wind_rose_counts": wind_rose_counts,
+    }
+    expected = wind_rose_counts(speed, direction)
+    for name, kernel in kernels.items():
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            counts = kernel(speed, direction)
+            best = min(best, time.perf_counter() - start)
+        status = "ok" if np.array_equal(counts, expected) else "MISMATCH"
+        print(f"{name:>18}: {best * 1000:8.1f} ms for {n:,} readings ({status})")
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000)
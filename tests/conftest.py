@@ -0,0 +1,9 @@
+import sys
+from pathlib import Path
+
+# The app and CLI import their packages from src/ and project paths from the
+# repository root (`from src import ...`), so tests see both
+ROOT = Path(__file__).resolve().parents[1]
+for path in (ROOT, ROOT / "src"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
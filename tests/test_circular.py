@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from processing.circular import (
+    circular_stats,
+    circular_stats_from_sums,
+    resample_direction,
+    rolling_circular_std,
+    time_bucket_starts,
+)
+
+
+def test_mean_wraps_through_north():
+    mean, resultant, std = circular_stats([350.0, 10.0])
+
+    assert mean == pytest.approx(0.0, abs=1e-9)
+    assert resultant == pytest.approx(np.cos(np.radians(10.0)))
+    assert 0 < std < 20
+
+
+def test_identical_directions_have_zero_spread():
+    mean, resultant, std = circular_stats([123.0] * 5)
+
+    assert mean == pytest.approx(123.0)
+    assert resultant == pytest.approx(1.0)
+    assert std == pytest.approx(0.0, abs=1e-5)
+
+
+def test_nan_readings_are_ignored():
+    with_nan = circular_stats([90.0, np.nan, 180.0])
+    without = circular_stats([90.0, 180.0])
+    np.testing.assert_allclose(with_nan, without)
+
+
+def test_empty_group_is_nan():
+    mean, resultant, std = circular_stats_from_sums([0.0], [0.0], [0])
+    assert np.isnan(mean[0]) and np.isnan(resultant[0]) and np.isnan(std[0])
+
+
+def test_groups_match_separate_calls():
+    rng = np.random.default_rng(5)
+    directions = rng.uniform(0, 360, 100)
+    starts = [0, 10, 55]
+
+    mean, resultant, std = circular_stats(directions, starts)
+
+    for i, (lo, hi) in enumerate(zip(starts, starts[1:] + [100])):
+        expected = circular_stats(directions[lo:hi])
+        np.testing.assert_allclose(
+            (mean[i], resultant[i], std[i]), expected, rtol=1e-12
+        )
+
+
+def test_time_buckets_skip_empty_buckets():
+    times = pd.to_datetime(
+        ["2024-01-01 00:05", "2024-01-01 00:20", "2024-01-01 02:10"], utc=True
+    )
+
+    starts, labels = time_bucket_starts(times, "1h")
+
+    np.testing.assert_array_equal(starts, [0, 2])
+    assert list(labels.hour) == [0, 2]
+
+
+def test_resample_direction_matches_pandas_groups():
+    times = pd.date_range("2024-01-01", periods=240, freq="min", tz="UTC")
+    directions = np.linspace(300, 420, 240) % 360
+
+    result = resample_direction(times, directions, "30min")
+
+    assert len(result) == 8
+    for label, row in result.iterrows():
+        in_bucket = (times >= label) & (times < label + pd.Timedelta("30min"))
+        assert row["mean"] == pytest.approx(circular_stats(directions[in_bucket])[0])
+
+
+def test_rolling_std_matches_window_by_window():
+    rng = np.random.default_rng(6)
+    directions = rng.normal(180, 20, 50)
+
+    result = rolling_circular_std(directions, 10)
+
+    assert np.isnan(result[:9]).all()
+    for i in range(9, 50):
+        expected = circular_stats(directions[i - 9 : i + 1])[2]
+        assert result[i] == pytest.approx(expected, abs=1e-6)
@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from processing.downsample import (
+    downsample,
+    lttb_indices,
+    minmax_indices,
+    point_budget,
+)
+
+
+@pytest.fixture
+def series():
+    rng = np.random.default_rng(1)
+    x = pd.date_range("2024-01-01", periods=10_000, freq="s", tz="UTC")
+    y = rng.normal(size=len(x))
+    # Single-sample spikes that any decimation must keep
+    y[1234] = 50.0
+    y[8765] = -50.0
+    return x, y
+
+
+def test_point_budget():
+    assert point_budget(1000) == 2000
+    assert point_budget(10) == 200
+
+
+def test_minmax_keeps_extremes(series):
+    x, y = series
+    idx = minmax_indices(x, y, 400)
+
+    assert len(idx) <= 400
+    assert np.all(np.diff(idx) > 0)
+    assert {1234, 8765} <= set(idx.tolist())
+
+
+def test_lttb_keeps_endpoints_and_budget(series):
+    x, y = series
+    idx = lttb_indices(x, y, 300)
+
+    assert len(idx) == 300
+    assert idx[0] == 0 and idx[-1] == len(y) - 1
+    assert np.all(np.diff(idx) > 0)
+    assert 1234 in idx
+
+
+@pytest.mark.parametrize("mode", ["lttb", "minmax"])
+def test_nan_samples_are_skipped(series, mode):
+    x, y = series
+    y = y.copy()
+    y[::7] = np.nan
+
+    x_out, y_out = downsample(x, y, 300, mode=mode)
+
+    assert np.isfinite(y_out).all()
+    assert y_out.max() == 50.0
+
+
+@pytest.mark.parametrize("mode", ["lttb", "minmax"])
+def test_short_series_is_returned_whole(mode):
+    x = np.arange(5.0)
+    y = np.array([1.0, np.nan, 3.0, 4.0, 5.0])
+
+    x_out, y_out = downsample(x, y, 100, mode=mode)
+
+    np.testing.assert_array_equal(x_out, [0.0, 2.0, 3.0, 4.0])
+    np.testing.assert_array_equal(y_out, [1.0, 3.0, 4.0, 5.0])
+
+
+def test_timezone_is_kept(series):
+    x, y = series
+    x_out, _ = downsample(x, y, 200, mode="minmax")
+    assert str(x_out.tz) == "UTC"
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        downsample(np.arange(3), np.arange(3), 2, mode="mean")
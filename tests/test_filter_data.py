@@ -0,0 +1,47 @@
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from web_components.utils import filter_data
+
+
+@pytest.fixture
+def frame():
+    # Three days of hourly readings plus one exactly at the last midnight
+    times = pd.date_range("2024-03-01", "2024-03-04", freq="h", tz="UTC")
+    return pd.DataFrame({"tNow": times, "Temp_C": range(len(times))})
+
+
+def test_slices_whole_days_with_exclusive_end(frame):
+    result = filter_data(frame, date(2024, 3, 2), date(2024, 3, 2))
+
+    assert len(result) == 24
+    assert result["tNow"].iloc[0] == pd.Timestamp("2024-03-02", tz="UTC")
+    assert result["tNow"].iloc[-1] == pd.Timestamp("2024-03-02 23:00", tz="UTC")
+
+
+def test_is_a_positional_slice(frame):
+    result = filter_data(frame, date(2024, 3, 1), date(2024, 3, 3))
+
+    assert result.index.tolist() == list(range(72))
+    pd.testing.assert_frame_equal(result, frame.iloc[:72])
+
+
+def test_range_outside_the_data_is_empty(frame):
+    assert filter_data(frame, date(2024, 2, 1), date(2024, 2, 28)).empty
+    assert filter_data(frame, date(2024, 3, 5), date(2024, 3, 9)).empty
+
+
+def test_naive_timestamps(frame):
+    naive = frame.assign(tNow=frame["tNow"].dt.tz_localize(None))
+
+    result = filter_data(naive, date(2024, 3, 3), date(2024, 3, 4))
+
+    assert len(result) == 25
+    assert result["tNow"].iloc[0] == pd.Timestamp("2024-03-03")
+
+
+def test_empty_frame():
+    empty = pd.DataFrame({"tNow": pd.to_datetime([], utc=True)})
+    assert filter_data(empty, date(2024, 3, 1), date(2024, 3, 1)).empty
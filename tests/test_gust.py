@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from processing.gust import rolling_max, rolling_max_windows
+
+
+def brute_force(times, values, window):
+    window = pd.Timedelta(window).to_timedelta64()
+    result = np.full(len(values), np.nan)
+    for i, t in enumerate(times):
+        inside = (times > t - window) & (times <= t) & ~np.isnan(values)
+        if inside.any():
+            result[i] = values[inside].max()
+    return result
+
+
+@pytest.fixture
+def samples():
+    rng = np.random.default_rng(3)
+    # Irregular spacing, including gaps longer than the shortest window
+    steps = rng.choice([0.25, 0.5, 1.0, 7.0], size=600, p=[0.5, 0.3, 0.15, 0.05])
+    times = np.datetime64("2024-06-01T00:00:00", "ns") + (
+        np.cumsum(steps) * 1e9
+    ).astype("timedelta64[ns]")
+    values = rng.gamma(2.0, 3.0, size=len(times))
+    values[rng.random(len(times)) < 0.05] = np.nan
+    return times, values
+
+
+def test_windows_match_brute_force(samples):
+    times, values = samples
+    windows = ["3s", "10s", "1min"]
+
+    result = rolling_max_windows(times, values, windows)
+
+    assert list(result) == windows
+    for window in windows:
+        np.testing.assert_array_equal(
+            result[window], brute_force(times, values, window)
+        )
+
+
+def test_single_window_matches_multi(samples):
+    times, values = samples
+    np.testing.assert_array_equal(
+        rolling_max(times, values, "5s"),
+        rolling_max_windows(times, values, ["5s"])["5s"],
+    )
+
+
+def test_longer_windows_never_lower(samples):
+    times, values = samples
+    result = rolling_max_windows(times, values, ["3s", "30s", "3min"])
+    with np.errstate(invalid="ignore"):
+        assert np.all(np.nan_to_num(result["30s"]) >= np.nan_to_num(result["3s"]))
+        assert np.all(np.nan_to_num(result["3min"]) >= np.nan_to_num(result["30s"]))
+
+
+def test_window_shorter_than_spacing_gives_the_sample():
+    times = pd.date_range("2024-01-01", periods=5, freq="1min").values
+    values = np.array([1.0, 5.0, 2.0, np.nan, 4.0])
+
+    np.testing.assert_array_equal(rolling_max(times, values, "3s"), values)
@@ -0,0 +1,200 @@
+import asyncio
+import operator
+import os
+import time
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from cli_components.jobs import JobQueueFull, JobRunner, SingleFlight
+
+# Jobs are builtins so the forkserver workers can unpickle them without
+# importing this module
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+@pytest.fixture
+def runners():
+    created = []
+
+    def make(*args, **kwargs):
+        runner = JobRunner(*args, **kwargs)
+        created.append(runner)
+        return runner
+
+    yield make
+    for runner in created:
+        if runner._executor is not None:
+            runner._executor.shutdown(cancel_futures=True)
+
+
+def test_returns_results(runners):
+    runner = runners(2, 6, 60)
+
+    async def main():
+        return await asyncio.gather(
+            *(runner.submit(operator.add, i, 1) for i in range(4))
+        )
+
+    assert run(main()) == [1, 2, 3, 4]
+    assert runner.pending == 0
+
+
+def test_timeout_does_not_fail_jobs_queued_behind(runners):
+    runner = runners(2, 6, 3)
+
+    async def main():
+        # Warm the pool so worker start-up is not part of the timed runs
+        await runner.submit(time.sleep, 0)
+        jobs = [runner.submit(time.sleep, 60) for _ in range(2)]
+        jobs += [runner.submit(time.sleep, 0.2) for _ in range(4)]
+        return await asyncio.gather(*jobs, return_exceptions=True)
+
+    results = run(main())
+
+    assert [type(r) for r in results[:2]] == [TimeoutError, TimeoutError]
+    assert results[2:] == [None] * 4
+
+
+def test_job_running_beside_a_timeout_is_resubmitted(runners):
+    runner = runners(2, 6, 2)
+
+    async def main():
+        await runner.submit(time.sleep, 0)
+        slow = runner.submit(time.sleep, 60)
+        # Running when the slow job's pool is killed
+        beside = runner.submit(operator.mul, 6, 7)
+        return await asyncio.gather(slow, beside, return_exceptions=True)
+
+    slow, beside = run(main())
+    assert isinstance(slow, TimeoutError)
+    assert beside == 42
+
+
+def test_crashing_job_is_retried_once_then_fails(runners):
+    runner = runners(2, 6, 60)
+
+    async def main():
+        crash = runner.submit(os._exit, 1)
+        other = runner.submit(operator.add, 2, 2)
+        return await asyncio.gather(crash, other, return_exceptions=True)
+
+    crash, other = run(main())
+    assert isinstance(crash, BrokenProcessPool)
+    assert other == 4
+
+
+def test_queue_limit(runners):
+    runner = runners(1, 2, 60)
+
+    async def main():
+        jobs = [asyncio.ensure_future(runner.submit(time.sleep, 0.5)) for _ in range(2)]
+        await asyncio.sleep(0)
+        with pytest.raises(JobQueueFull):
+            await runner.submit(time.sleep, 0)
+        await asyncio.gather(*jobs)
+
+    run(main())
+
+
+def test_progress_is_reported_while_queued(runners):
+    runner = runners(1, 6, 60, progress_interval=0.1)
+    updates = []
+
+    async def on_progress(position, elapsed, eta):
+        updates.append((position, elapsed))
+
+    async def main():
+        first = runner.submit(time.sleep, 1)
+        second = runner.submit(time.sleep, 0, on_progress=on_progress)
+        await asyncio.gather(first, second)
+
+    run(main())
+    assert updates[0] == (2, 0)
+    assert len(updates) > 2
+    assert all(position == 2 for position, _ in updates)
+
+
+class TestSingleFlight:
+    def test_identical_requests_share_one_job(self):
+        flights = SingleFlight()
+        calls = []
+
+        async def job():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "result"
+
+        async def main():
+            return await asyncio.gather(*(flights.run("key", job) for _ in range(50)))
+
+        assert run(main()) == ["result"] * 50
+        assert len(calls) == 1
+
+    def test_result_is_reused_within_ttl_only(self):
+        flights = SingleFlight(ttl=0.1)
+        calls = []
+
+        async def job():
+            calls.append(1)
+            return len(calls)
+
+        async def main():
+            first = await flights.run("key", job)
+            reused = await flights.run("key", job)
+            await asyncio.sleep(0.15)
+            return first, reused, await flights.run("key", job)
+
+        assert run(main()) == (1, 1, 2)
+
+    def test_different_keys_run_separately(self):
+        flights = SingleFlight()
+
+        async def main():
+            async def job(value):
+                await asyncio.sleep(0.01)
+                return value
+
+            return await asyncio.gather(
+                flights.run("a", lambda: job("a")), flights.run("b", lambda: job("b"))
+            )
+
+        assert run(main()) == ["a", "b"]
+
+    def test_failures_are_not_kept(self):
+        flights = SingleFlight()
+        calls = []
+
+        async def job():
+            calls.append(1)
+            if len(calls) == 1:
+                raise ValueError("first call fails")
+            return "ok"
+
+        async def main():
+            with pytest.raises(ValueError):
+                await flights.run("key", job)
+            return await flights.run("key", job)
+
+        assert run(main()) == "ok"
+        assert len(calls) == 2
+
+    def test_cancelled_waiter_does_not_cancel_the_job(self):
+        flights = SingleFlight()
+
+        async def job():
+            await asyncio.sleep(0.1)
+            return "done"
+
+        async def main():
+            leaver = asyncio.ensure_future(flights.run("key", job))
+            stayer = asyncio.ensure_future(flights.run("key", job))
+            await asyncio.sleep(0.01)
+            assert flights.running("key")
+            leaver.cancel()
+            return await stayer
+
+        assert run(main()) == "done"
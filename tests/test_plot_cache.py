@@ -0,0 +1,73 @@
+import os
+
+import pytest
+
+from cli_components import plot_cache
+from cli_components.plot_cache import (
+    evict_plot_cache,
+    load_cached_plots,
+    plot_cache_key,
+    store_cached_plots,
+)
+
+OPTIONS = {"dpi": 120, "format": "webp", "pil_kwargs": {"quality": 85}}
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(plot_cache, "PLOT_CACHE_DIR", tmp_path / "cache")
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "2024_01_01_weather_station_data.csv"
+    path.write_text("tNow,Temp_C\n")
+    return path
+
+
+def test_key_is_stable(source):
+    first = plot_cache_key("2024_01_01", None, [source], OPTIONS)
+    assert first == plot_cache_key("2024_01_01", None, [source], dict(OPTIONS))
+
+
+def test_key_changes_with_request_and_sources(source):
+    key = plot_cache_key("2024_01_01", None, [source], OPTIONS)
+
+    assert key != plot_cache_key("2024_01_01", "2024_01_02", [source], OPTIONS)
+    assert key != plot_cache_key("2024_01_01", None, [source], {**OPTIONS, "dpi": 50})
+
+    # A file that is still being written gets a new key when it grows
+    with source.open("a") as f:
+        f.write("2024-01-01T00:00:00,1.0\n")
+    assert key != plot_cache_key("2024_01_01", None, [source], OPTIONS)
+
+
+def test_key_changes_with_cache_version(source, monkeypatch):
+    key = plot_cache_key("2024_01_01", None, [source], OPTIONS)
+    monkeypatch.setattr(
+        plot_cache, "PLOT_CACHE_VERSION", plot_cache.PLOT_CACHE_VERSION + 1
+    )
+    assert key != plot_cache_key("2024_01_01", None, [source], OPTIONS)
+
+
+def test_store_and_load(cache_dir):
+    images = {"wind_rose": b"rose", "wind_3d": b"surface"}
+    store_cached_plots("k1", images)
+
+    assert load_cached_plots("k1", list(images)) == images
+    assert load_cached_plots("k1", ["wind_rose", "weather_plot"]) is None
+    assert load_cached_plots("missing", ["wind_rose"]) is None
+    assert not [p for p in cache_dir.iterdir() if p.name.startswith(".")]
+
+
+def test_eviction_removes_least_recently_used(cache_dir):
+    for i, key in enumerate(["old", "used", "new"]):
+        store_cached_plots(key, {"plot": bytes(100)})
+        os.utime(cache_dir / key, (1000 + i, 1000 + i))
+
+    # Reading an entry makes it the most recently used
+    load_cached_plots("old", ["plot"])
+    evict_plot_cache(max_bytes=200)
+
+    assert sorted(p.name for p in cache_dir.iterdir()) == ["new", "old"]
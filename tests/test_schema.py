@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from processing.schema import (
+    EXTREME_FIELDS,
+    SENSOR_DTYPE,
+    SENSOR_FIELDS,
+    TIME_DTYPE,
+    add_time_columns,
+    apply_weather_schema,
+    memory_report,
+)
+
+
+@pytest.fixture
+def wide_frame():
+    rng = np.random.default_rng(7)
+    n = 500
+    frame = pd.DataFrame(
+        {
+            # Naive, as stored in MongoDB
+            "tNow": pd.date_range("2024-05-01 22:00", periods=n, freq="17s"),
+            **{field: rng.normal(100, 50, n) for field in SENSOR_FIELDS},
+            "2dSpeed_m_s_max": rng.gamma(2.0, 3.0, n),
+            "label": ["a"] * n,
+        }
+    )
+    frame["Press_Pa"] = rng.normal(101_325, 500, n)
+    return frame
+
+
+def test_dtypes(wide_frame):
+    df = add_time_columns(apply_weather_schema(wide_frame.copy()))
+
+    assert str(df["tNow"].dtype) == TIME_DTYPE
+    for field in SENSOR_FIELDS + ["2dSpeed_m_s_max"]:
+        assert df[field].dtype == SENSOR_DTYPE
+    assert df["hour"].dtype == np.int8 and df["day"].dtype == np.int8
+    assert df["label"].dtype == wide_frame["label"].dtype
+
+
+def test_values_round_trip_within_float32_precision(wide_frame):
+    df = apply_weather_schema(wide_frame.copy())
+
+    for field in SENSOR_FIELDS:
+        np.testing.assert_allclose(
+            df[field].to_numpy(np.float64), wide_frame[field], rtol=1e-6
+        )
+    # Naive times are taken as UTC, not shifted
+    np.testing.assert_array_equal(
+        df["tNow"].dt.tz_localize(None).to_numpy(), wide_frame["tNow"].to_numpy()
+    )
+
+
+def test_time_columns_follow_utc():
+    df = apply_weather_schema(
+        pd.DataFrame({"tNow": pd.to_datetime(["2024-05-01T23:30:00-02:00"])})
+    )
+    add_time_columns(df)
+
+    assert df["hour"].iloc[0] == 1 and df["day"].iloc[0] == 2
+
+
+def test_non_numeric_readings_become_nan():
+    df = apply_weather_schema(pd.DataFrame({"Temp_C": ["21.5", "n/a"]}))
+
+    assert df["Temp_C"].dtype == SENSOR_DTYPE
+    assert df["Temp_C"].iloc[0] == pytest.approx(21.5)
+    assert np.isnan(df["Temp_C"].iloc[1])
+
+
+def test_extreme_fields_cover_every_averaged_field():
+    averaged = [field for field in SENSOR_FIELDS if field != "Azimuth_deg"]
+    assert len(EXTREME_FIELDS) == 2 * len(averaged)
+    assert {f"{field}_max" for field in averaged} <= set(EXTREME_FIELDS)
+
+
+def test_memory_report_halves_float64(wide_frame):
+    df = apply_weather_schema(wide_frame.drop(columns="label"))
+
+    report = memory_report(df).set_index("column")
+
+    assert report.loc["Temp_C", "bytes"] * 2 == report.loc["Temp_C", "wide_bytes"]
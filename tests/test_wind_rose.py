@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from processing.wind_rose import (
+    FINE_SHAPE,
+    SECTOR_LABELS,
+    SPEED_BINS_MPH,
+    SPEED_LABELS,
+    fine_histogram,
+    histogram_from_document,
+    histogram_to_document,
+    rebin_histogram,
+    wind_rose_counts,
+)
+
+
+def per_bin_counts(speed_mph, direction_deg):
+    """Reference: the former CLI loop, one mask and np.histogram per speed bin."""
+    speed = np.asarray(speed_mph, dtype=np.float64)
+    direction = np.mod(np.asarray(direction_deg, dtype=np.float64) + 11.25, 360)
+    counts = np.zeros((len(SPEED_LABELS), len(SECTOR_LABELS)), dtype=np.int64)
+    for i in range(len(SPEED_BINS_MPH) - 1):
+        mask = (speed >= SPEED_BINS_MPH[i]) & (speed < SPEED_BINS_MPH[i + 1])
+        counts[i], _ = np.histogram(direction[mask], bins=np.arange(0, 361, 22.5))
+    return counts
+
+
+@pytest.fixture
+def readings():
+    rng = np.random.default_rng(11)
+    n = 200_000
+    speed = rng.gamma(2.0, 6.0, n)
+    direction = rng.uniform(0, 360, n)
+    # Values on the bin edges, wrap-around and out-of-range directions
+    speed[:6] = [0.0, 5.0, 60.0, 80.0, 4.999, 64.9]
+    direction[:6] = [348.75, 11.25, 0.0, 359.999, 360.0, 720.5]
+    return speed, direction
+
+
+def test_matches_per_bin_reference(readings):
+    speed, direction = readings
+    np.testing.assert_array_equal(
+        wind_rose_counts(speed, direction), per_bin_counts(speed, direction)
+    )
+
+
+def test_matches_fine_histogram_rebinned(readings):
+    speed, direction = readings
+    np.testing.assert_array_equal(
+        wind_rose_counts(speed, direction),
+        rebin_histogram(fine_histogram(speed, direction)),
+    )
+
+
+def test_invalid_readings_are_dropped():
+    speed = np.array([3.0, np.nan, -1.0, 3.0])
+    direction = np.array([0.0, 0.0, 0.0, np.nan])
+
+    counts = wind_rose_counts(speed, direction)
+
+    assert counts.sum() == 1
+    assert counts[0, 0] == 1
+    assert fine_histogram(speed, direction).sum() == 1
+
+
+def test_fine_histograms_merge_across_days(readings):
+    speed, direction = readings
+    whole = fine_histogram(speed, direction)
+    parts = fine_histogram(speed[:1000], direction[:1000]) + fine_histogram(
+        speed[1000:], direction[1000:]
+    )
+
+    assert whole.shape == FINE_SHAPE
+    np.testing.assert_array_equal(whole, parts)
+
+
+def test_document_round_trip(readings):
+    hist = fine_histogram(*readings)
+    np.testing.assert_array_equal(
+        histogram_from_document(histogram_to_document(hist)), hist
+    )